@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark: concurrent generate_str calls against a local fake OpenAI server.
+
+Every request to the fake server takes LATENCY seconds. If provider calls are
+non-blocking, N concurrent generate_str calls finish in roughly max(latency);
+if they block the event loop, they take sum(latency).
+
+Usage:
+    python benchmarks/bench_concurrent_generate.py [--concurrency N] [--latency S]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp_agent.agents.agent import Agent  # noqa: E402
+from mcp_agent.app import MCPApp  # noqa: E402
+from mcp_agent.config import LoggerSettings, OpenAISettings, Settings  # noqa: E402
+from mcp_agent.logging.logger import LoggingConfig  # noqa: E402
+from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM  # noqa: E402
+
+
+def create_fake_openai_app(latency: float) -> web.Application:
+    async def chat_completions(request: web.Request) -> web.Response:
+        body = await request.json()
+        await asyncio.sleep(latency)
+        return web.json_response(
+            {
+                "id": "chatcmpl-bench",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", "gpt-4o"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": "pong"},
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 1,
+                    "completion_tokens": 1,
+                    "total_tokens": 2,
+                },
+            }
+        )
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    return app
+
+
+async def run_benchmark(concurrency: int, latency: float) -> float:
+    runner = web.AppRunner(create_fake_openai_app(latency))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    settings = Settings(
+        execution_engine="asyncio",
+        logger=LoggerSettings(type="none"),
+        openai=OpenAISettings(api_key="bench", base_url=f"http://127.0.0.1:{port}/v1"),
+    )
+    app = MCPApp(name="bench_concurrent_generate", settings=settings)
+
+    try:
+        async with app.run():
+            agents = [
+                Agent(name=f"agent_{i}", instruction="Reply with pong.")
+                for i in range(concurrency)
+            ]
+            llms = []
+            for agent in agents:
+                await agent.initialize()
+                llms.append(await agent.attach_llm(OpenAIAugmentedLLM))
+
+            # Warm up the pooled client so connection setup isn't measured
+            await llms[0].generate_str("ping")
+
+            start = time.perf_counter()
+            await asyncio.gather(*(llm.generate_str("ping") for llm in llms))
+            elapsed = time.perf_counter() - start
+
+            for agent in agents:
+                await agent.shutdown()
+    finally:
+        await runner.cleanup()
+        await LoggingConfig.shutdown()
+
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.5)
+    args = parser.parse_args()
+
+    elapsed = asyncio.run(run_benchmark(args.concurrency, args.latency))
+    serial = args.concurrency * args.latency
+
+    print(f"concurrency:      {args.concurrency}")
+    print(f"per-call latency: {args.latency:.3f}s")
+    print(f"wall time:        {elapsed:.3f}s")
+    print(f"serial estimate:  {serial:.3f}s")
+
+    # Concurrent calls should overlap: allow generous overhead on top of a
+    # single call's latency, but stay well below the serial sum.
+    budget = args.latency * 2 + 0.5
+    assert elapsed < budget, (
+        f"Concurrent generate_str took {elapsed:.3f}s, expected ~{args.latency:.3f}s "
+        f"(budget {budget:.3f}s); provider calls are blocking the event loop"
+    )
+    print("OK: wall time ~ max(latency), not sum(latency)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: recall against query latency for the embedding index backends.
+
+The catalog is synthetic: entries are drawn around random cluster centres, the
+way tool and intent descriptions cluster by topic, and queries are catalog
+entries with noise added. Recall@k is measured against ExactEmbeddingIndex,
+which is exact by construction. HNSWEmbeddingIndex is measured at several
+ef_search values if hnswlib is installed.
+
+Usage:
+    python benchmarks/bench_embedding_index.py [--entries N] [--dim D] [--ef 16 64 256]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp_agent.workflows.embedding.embedding_index import (  # noqa: E402
+    EmbeddingIndex,
+    ExactEmbeddingIndex,
+    HNSWEmbeddingIndex,
+    SearchResult,
+)
+
+
+def make_catalog(entries: int, dim: int, clusters: int, rng) -> np.ndarray:
+    centres = rng.standard_normal((clusters, dim), dtype=np.float32)
+    assignment = rng.integers(0, clusters, entries)
+    noise = rng.standard_normal((entries, dim), dtype=np.float32)
+    return centres[assignment] + 0.5 * noise
+
+
+def time_queries(index: EmbeddingIndex, queries: np.ndarray, top_k: int):
+    """Average seconds per query, searching one query at a time, and the results."""
+    results: List[SearchResult] = []
+    start = time.perf_counter()
+    for query in queries:
+        results.extend(index.search(query[None], top_k))
+    return (time.perf_counter() - start) / len(queries), results
+
+
+def recall(results: List[SearchResult], truth: List[SearchResult]) -> float:
+    found = sum(
+        len({id for id, _ in r} & {id for id, _ in t}) for r, t in zip(results, truth)
+    )
+    return found / sum(len(t) for t in truth)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=50000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--clusters", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--ef", type=int, nargs="+", default=[16, 32, 64, 128, 256])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    catalog = make_catalog(args.entries, args.dim, args.clusters, rng)
+    ids = [f"tool_{i}" for i in range(args.entries)]
+    picks = rng.integers(0, args.entries, args.queries)
+    queries = catalog[picks] + 0.5 * rng.standard_normal(
+        (args.queries, args.dim), dtype=np.float32
+    )
+
+    print(
+        f"entries: {args.entries}, dim: {args.dim}, "
+        f"queries: {args.queries}, top_k: {args.top_k}"
+    )
+    print(f"{'':20}{'build s':>10}{'ms/query':>10}{'recall':>8}")
+
+    start = time.perf_counter()
+    exact = ExactEmbeddingIndex(args.dim)
+    exact.add(ids, catalog)
+    build = time.perf_counter() - start
+    latency, truth = time_queries(exact, queries, args.top_k)
+    print(f"{'exact':20}{build:>10.2f}{latency * 1e3:>10.3f}{1.0:>8.3f}")
+
+    try:
+        start = time.perf_counter()
+        hnsw = HNSWEmbeddingIndex(args.dim, max_elements=args.entries)
+        hnsw.add(ids, catalog)
+        build = time.perf_counter() - start
+    except ModuleNotFoundError as e:
+        print(f"hnsw: skipped, {e}")
+        return
+
+    for ef in args.ef:
+        hnsw.ef_search = ef
+        latency, results = time_queries(hnsw, queries, args.top_k)
+        print(
+            f"{f'hnsw ef={ef}':20}{build:>10.2f}{latency * 1e3:>10.3f}"
+            f"{recall(results, truth):>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
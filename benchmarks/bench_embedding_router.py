@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-request latency of EmbeddingRouter.route and route_many against
+category count.
+
+Categories are functions, embedded by a fake embedding model that derives
+deterministic vectors from each text, so no API calls are made and timings
+cover scoring only. The baseline reproduces the previous scoring loop, which
+called compute_similarity_scores for every category and sorted all results.
+The batched column routes all requests with one route_many call.
+
+Usage:
+    python benchmarks/bench_embedding_router.py [--categories 100 1000] [--requests N]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+import time
+from typing import Callable, List
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp_agent.core.context import Context  # noqa: E402
+from mcp_agent.workflows.embedding.embedding_base import (  # noqa: E402
+    EmbeddingModel,
+    FloatArray,
+    compute_confidence,
+    compute_similarity_scores,
+)
+from mcp_agent.workflows.router.router_base import RouterResult  # noqa: E402
+from mcp_agent.workflows.router.router_embedding import EmbeddingRouter  # noqa: E402
+
+
+class FakeEmbeddingModel(EmbeddingModel):
+    """Deterministic pseudo-random embeddings seeded by each text's hash."""
+
+    def __init__(self, dim: int = 1536, context: Context | None = None):
+        super().__init__(context=context)
+        self.dim = dim
+
+    async def embed(self, data: List[str]) -> FloatArray:
+        return np.stack([self._embed_one(text) for text in data])
+
+    def _embed_one(self, text: str) -> FloatArray:
+        seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+        return np.random.default_rng(seed).standard_normal(self.dim, dtype=np.float32)
+
+    @property
+    def embedding_dim(self) -> int:
+        return self.dim
+
+
+def make_functions(count: int) -> List[Callable]:
+    functions = []
+    for i in range(count):
+
+        def function():
+            pass
+
+        function.__name__ = f"tool_{i}"
+        function.__doc__ = f"Handles requests about topic {i}"
+        functions.append(function)
+    return functions
+
+
+async def previous_route(
+    router: EmbeddingRouter, request: str, top_k: int
+) -> List[RouterResult]:
+    """The previous scoring loop: one similarity call per category, full sort."""
+    request_embedding = await router._compute_embedding([request])
+    results = []
+    for category in router.function_categories.values():
+        similarity = compute_similarity_scores(request_embedding, category.embedding)
+        results.append(
+            RouterResult(
+                p_score=compute_confidence(similarity), result=category.category
+            )
+        )
+    results.sort(key=lambda x: x.p_score, reverse=True)
+    return results[:top_k]
+
+
+async def time_requests(route, requests: List[str]) -> float:
+    """Average seconds per request."""
+    start = time.perf_counter()
+    for request in requests:
+        await route(request)
+    return (time.perf_counter() - start) / len(requests)
+
+
+async def run(category_counts: List[int], requests: int, top_k: int):
+    context = Context()
+    print(f"requests: {requests}, top_k: {top_k}")
+    print(
+        f"{'categories':>10}{'previous ms':>14}{'matrix ms':>12}{'speedup':>10}"
+        f"{'batched ms':>13}"
+    )
+    for count in category_counts:
+        router = EmbeddingRouter(
+            embedding_model=FakeEmbeddingModel(context=context),
+            functions=make_functions(count),
+            context=context,
+        )
+        await router.initialize()
+        texts = [f"request {i}" for i in range(requests)]
+
+        # The previous loop is slow enough that fewer requests give stable timings
+        baseline = await time_requests(
+            lambda r: previous_route(router, r, top_k), texts[: max(1, requests // 10)]
+        )
+        elapsed = await time_requests(lambda r: router.route(r, top_k), texts)
+
+        start = time.perf_counter()
+        await router.route_many(texts, top_k)
+        batched = (time.perf_counter() - start) / len(texts)
+        print(
+            f"{count:>10}{baseline * 1e3:>14.2f}{elapsed * 1e3:>12.3f}"
+            f"{baseline / elapsed:>9.0f}x{batched * 1e3:>13.3f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--categories", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.categories, args.requests, args.top_k))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold-start wall time of EmbeddingRouter.initialize against category count.
+
+Categories are functions, embedded by a fake embedding model that sleeps for a
+fixed latency per request and derives deterministic vectors from each text, so
+timings reflect the number and concurrency of embedding requests rather than
+network conditions. The baseline reproduces the previous initialization, which
+embedded each category with its own request, one after another.
+
+Usage:
+    python benchmarks/bench_embedding_startup.py [--categories 100 1000] [--latency-ms N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_embedding_router import FakeEmbeddingModel, make_functions  # noqa: E402
+from mcp_agent.core.context import Context  # noqa: E402
+from mcp_agent.workflows.embedding.embedding_base import FloatArray  # noqa: E402
+from mcp_agent.workflows.router.router_base import Router  # noqa: E402
+from mcp_agent.workflows.router.router_embedding import (  # noqa: E402
+    EmbeddingRouter,
+    EmbeddingRouterCategory,
+)
+
+
+class SlowEmbeddingModel(FakeEmbeddingModel):
+    """A fake embedding model that takes a fixed time per request."""
+
+    def __init__(self, latency: float, max_batch_size: int, **kwargs):
+        super().__init__(**kwargs)
+        self.latency = latency
+        self.max_batch_size = max_batch_size
+        self.requests = 0
+
+    async def embed(self, data: List[str]) -> FloatArray:
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        return await super().embed(data)
+
+
+async def previous_initialize(router: EmbeddingRouter):
+    """The previous initialization: one awaited request per category."""
+    await Router.initialize(router)
+    for categories in (
+        router.server_categories,
+        router.agent_categories,
+        router.function_categories,
+    ):
+        for name, category in categories.items():
+            embedding = await router._compute_embedding(
+                [router.format_category(category)]
+            )
+            categories[name] = EmbeddingRouterCategory(
+                **category.model_dump(), embedding=embedding
+            )
+            router.categories[name] = categories[name]
+            router.index.add([name], embedding[None])
+
+
+async def time_startup(initialize, model: SlowEmbeddingModel, count: int, context):
+    """Wall time and embedding requests to initialize a router with count categories."""
+    router = EmbeddingRouter(
+        embedding_model=model, functions=make_functions(count), context=context
+    )
+    start = time.perf_counter()
+    await initialize(router)
+    return time.perf_counter() - start, model.requests
+
+
+async def run(category_counts: List[int], latency: float, max_batch_size: int):
+    context = Context()
+    print(f"latency per request: {latency * 1e3:.0f} ms, batch size: {max_batch_size}")
+    print(
+        f"{'categories':>10}{'previous s':>12}{'requests':>10}"
+        f"{'batched s':>12}{'requests':>10}{'speedup':>10}"
+    )
+    for count in category_counts:
+
+        def make_model():
+            return SlowEmbeddingModel(latency, max_batch_size, dim=256, context=context)
+
+        previous, previous_requests = await time_startup(
+            previous_initialize, make_model(), count, context
+        )
+        batched, batched_requests = await time_startup(
+            lambda router: router.initialize(), make_model(), count, context
+        )
+        print(
+            f"{count:>10}{previous:>12.2f}{previous_requests:>10}"
+            f"{batched:>12.3f}{batched_requests:>10}{previous / batched:>9.0f}x"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--categories", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--batch-size", type=int, default=96)
+    args = parser.parse_args()
+    asyncio.run(run(args.categories, args.latency_ms / 1e3, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark: span throughput of FileSpanExporter behind a BatchSpanProcessor.
+
+Spans carry attributes shaped like those recorded by
+MCPAgentClientSession.send_request. The baseline reproduces the previous
+exporter, which reopened the trace file for every batch and flushed after every
+span. Timings cover creating the spans and draining them to disk. Spans are
+produced as fast as possible, so an exporter that can't keep up makes the
+processor's queue overflow and drop spans. With --max-bytes FileSpanExporter
+rotates (and gzips) its file as it goes; the baseline never rotates.
+
+Usage:
+    python benchmarks/bench_file_span_exporter.py [--spans N] [--attributes A]
+        [--max-bytes B]
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Sequence
+
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp_agent.tracing.file_span_exporter import (  # noqa: E402
+    FileSpanExporter,
+    read_otlp_protobuf_file,
+)
+
+
+class ReopeningFileSpanExporter(SpanExporter):
+    """The previous exporter: open per batch, to_json per span, flush per span."""
+
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        with open(self.filepath, "a", encoding="utf-8") as f:
+            for span in spans:
+                f.write(span.to_json(indent=None) + os.linesep)
+                f.flush()
+        return SpanExportResult.SUCCESS
+
+
+def run(exporter: SpanExporter, spans: int, attributes: int) -> float:
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": "bench", "session.id": "bench"}),
+        shutdown_on_exit=False,
+    )
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    tracer = provider.get_tracer("bench")
+
+    start = time.perf_counter()
+    for i in range(spans):
+        with tracer.start_as_current_span("MCPAgentClientSession.send_request") as span:
+            span.set_attribute("mcp.method.name", "tools/call")
+            span.set_attribute("mcp.tool.name", "fetch")
+            for j in range(attributes):
+                span.set_attribute(f"result.content.{j}.text", f"line {i}.{j} " * 8)
+    provider.shutdown()
+    return time.perf_counter() - start
+
+
+def segments(path: Path) -> List[Path]:
+    """The file and its rotated segments, decompressing gzipped ones in place."""
+    found = [path] if path.exists() else []
+    for rotated in path.parent.glob(f"{path.stem}.*{path.suffix}*"):
+        if rotated.suffix == ".gz":
+            plain = rotated.with_suffix("")
+            with gzip.open(rotated, "rb") as src:
+                plain.write_bytes(src.read())
+            rotated.unlink()
+            rotated = plain
+        found.append(rotated)
+    return found
+
+
+def count_json_lines(path: Path) -> int:
+    count = 0
+    for segment in segments(path):
+        with open(segment, encoding="utf-8") as f:
+            count += sum(1 for _ in f)
+    return count
+
+
+def count_protobuf_spans(path: Path) -> int:
+    return sum(
+        len(scope_spans.spans)
+        for segment in segments(path)
+        for request in read_otlp_protobuf_file(segment)
+        for resource_spans in request.resource_spans
+        for scope_spans in resource_spans.scope_spans
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--spans", type=int, default=20000)
+    parser.add_argument("--attributes", type=int, default=10)
+    parser.add_argument("--max-bytes", type=int, default=None)
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_path = Path(tmp, "baseline.jsonl")
+        elapsed = run(
+            ReopeningFileSpanExporter(baseline_path), args.spans, args.attributes
+        )
+        written = count_json_lines(baseline_path)
+        results.append(("reopen + flush per span", elapsed, written, baseline_path))
+
+        json_path = Path(tmp, "buffered.jsonl")
+        elapsed = run(
+            FileSpanExporter(custom_path=str(json_path), max_bytes=args.max_bytes),
+            args.spans,
+            args.attributes,
+        )
+        written = count_json_lines(json_path)
+        results.append(("FileSpanExporter json", elapsed, written, json_path))
+
+        exporter = FileSpanExporter(
+            custom_path=str(Path(tmp, "buffered.jsonl")),
+            file_format="protobuf",
+            max_bytes=args.max_bytes,
+        )
+        elapsed = run(exporter, args.spans, args.attributes)
+        written = count_protobuf_spans(exporter.filepath)
+        results.append(
+            ("FileSpanExporter protobuf", elapsed, written, exporter.filepath)
+        )
+
+        print(f"spans: {args.spans}, attributes per span: {args.attributes + 2}")
+        print(f"{'':28}{'spans/s':>12}{'dropped':>10}{'bytes/span':>12}")
+        for label, elapsed, written, path in results:
+            size = sum(s.stat().st_size for s in segments(path)) / max(written, 1)
+            print(
+                f"{label:28}{written / elapsed:>12,.0f}"
+                f"{args.spans - written:>10,}{size:>12,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark: log event throughput of FileTransport vs BufferedFileTransport.
+
+Each event carries a payload shaped like the debug logs emitted by
+MCPAgentClientSession.send_request and OpenAIAugmentedLLM.generate. The
+unbuffered transport serializes each event and opens, writes, flushes and
+closes the file per event; the buffered transport appends a cheap snapshot of
+each event to memory and lets a writer thread serialize it and do the I/O.
+
+Usage:
+    python benchmarks/bench_file_transport.py [--events N] [--payload-messages M]
+"""
+
+import argparse
+import asyncio
+import gzip
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp_agent.logging.events import Event  # noqa: E402
+from mcp_agent.logging.transport import (  # noqa: E402
+    BufferedFileTransport,
+    FileTransport,
+)
+
+
+def make_event(i: int, payload_messages: int) -> Event:
+    return Event(
+        type="debug",
+        namespace="mcp_agent.workflows.llm.augmented_llm_openai",
+        message=f"{i}: Completion request arguments:",
+        timestamp=datetime.now(),
+        data={
+            "data": {
+                "model": "gpt-4o",
+                "messages": [
+                    {"role": "user", "content": f"message {j} " * 20}
+                    for j in range(payload_messages)
+                ],
+            }
+        },
+    )
+
+
+def count_lines(directory: Path) -> int:
+    lines = 0
+    for path in directory.iterdir():
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            lines += sum(1 for _ in f)
+    return lines
+
+
+async def run_transport(transport, events) -> tuple[float, float]:
+    """
+    Returns (seconds spent in send_event on the event loop, seconds until every
+    event is on disk).
+    """
+    start = time.perf_counter()
+    for event in events:
+        await transport.send_event(event)
+    on_loop = time.perf_counter() - start
+    if hasattr(transport, "stop"):
+        await transport.stop()
+    return on_loop, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--payload-messages", type=int, default=10)
+    args = parser.parse_args()
+
+    events = [make_event(i, args.payload_messages) for i in range(args.events)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        unbuffered_dir = Path(tmp, "unbuffered")
+        buffered_dir = Path(tmp, "buffered")
+
+        unbuffered = FileTransport(unbuffered_dir / "mcp-agent.jsonl")
+        unbuffered_times = asyncio.run(run_transport(unbuffered, events))
+
+        # Rotate a few times along the way so rotation + gzip is part of the cost
+        buffered = BufferedFileTransport(
+            buffered_dir / "mcp-agent.jsonl", max_bytes=8 * 1024 * 1024
+        )
+        buffered_times = asyncio.run(run_transport(buffered, events))
+
+        assert count_lines(unbuffered_dir) == args.events
+        assert count_lines(buffered_dir) == args.events, (
+            "buffered transport lost events"
+        )
+        segments = len(list(buffered_dir.iterdir()))
+
+    print(f"events: {args.events}, payload messages: {args.payload_messages}")
+    print(f"{'':24}{'on-loop events/s':>18}{'end-to-end events/s':>22}")
+    for label, (on_loop, total) in (
+        ("FileTransport", unbuffered_times),
+        ("BufferedFileTransport*", buffered_times),
+    ):
+        print(f"{label:24}{args.events / on_loop:>18,.0f}{args.events / total:>22,.0f}")
+    print(f"* {segments} files on disk after size-based rotation")
+
+
+if __name__ == "__main__":
+    main()
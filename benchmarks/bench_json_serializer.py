@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Benchmark: time to turn log event payloads into JSON lines with JSONSerializer.
+
+Payloads are shaped like the debug logs of OpenAIAugmentedLLM.generate: a
+completion request with a message history, and the pydantic ChatCompletion
+response. The baseline reproduces the previous serializer, which re-checked
+every type with isinstance chains, scanned every dict key for sensitive
+substrings and was followed by a separate json.dumps.
+
+Usage:
+    python benchmarks/bench_json_serializer.py [--events N] [--messages M]
+"""
+
+import argparse
+import dataclasses
+import inspect
+import json
+import os
+import sys
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable
+from uuid import UUID
+
+from openai.types.chat import ChatCompletion
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp_agent.logging.json_serializer import JSONSerializer, orjson  # noqa: E402
+
+
+class PreviousJSONSerializer:
+    """The previous serializer, without its httpx and Logger special cases."""
+
+    SENSITIVE_FIELDS = JSONSerializer.SENSITIVE_FIELDS
+
+    def __init__(self):
+        self._processed_objects = set()
+
+    def __call__(self, obj: Any) -> Any:
+        self._processed_objects.clear()
+        return self._serialize_object(obj, 0)
+
+    def _is_sensitive_key(self, key) -> bool:
+        key = str(key).lower()
+        return any(sensitive in key for sensitive in self.SENSITIVE_FIELDS)
+
+    def _redact(self, value):
+        if not value or not isinstance(value, str):
+            return value
+        return value[:10] + "....."
+
+    def _serialize_object(self, obj: Any, depth: int) -> Any:
+        if obj is None:
+            return None
+        if depth > 99:
+            return str(obj)
+        if id(obj) in self._processed_objects:
+            return str(obj)
+        self._processed_objects.add(id(obj))
+
+        try:
+            if isinstance(obj, (str, int, float, bool)):
+                return obj
+            if isinstance(obj, (datetime, date)):
+                return obj.isoformat()
+            if isinstance(obj, (Decimal, UUID, Path)):
+                return str(obj)
+            if isinstance(obj, Enum):
+                return obj.value
+            if callable(obj):
+                return f"<callable: {obj.__name__}>"
+            if hasattr(obj, "model_dump"):
+                return self._serialize_object(obj.model_dump(), depth)
+            if hasattr(obj, "dict"):
+                return self._serialize_object(obj.dict(), depth)
+            if dataclasses.is_dataclass(obj):
+                return self._serialize_object(dataclasses.asdict(obj), depth)
+            if hasattr(obj, "to_json"):
+                return self._serialize_object(obj.to_json(), depth)
+            if hasattr(obj, "to_dict"):
+                return self._serialize_object(obj.to_dict(), depth)
+            if isinstance(obj, Dict):
+                return {
+                    str(key): self._redact(value)
+                    if self._is_sensitive_key(key)
+                    else self._serialize_object(value, depth + 1)
+                    for key, value in obj.items()
+                }
+            if isinstance(obj, Iterable) and not isinstance(obj, (str, bytes)):
+                return [self._serialize_object(item, depth + 1) for item in obj]
+            if hasattr(obj, "__dict__"):
+                return self._serialize_object(obj.__dict__, depth + 1)
+            if inspect.getmembers(obj):
+                return str(obj)
+            return str(obj)
+        except Exception as e:
+            return f"<unserializable: {type(obj).__name__}, error: {str(e)}>"
+
+
+def make_payloads(messages: int) -> list:
+    request = {
+        "data": {
+            "model": "gpt-4o",
+            "max_tokens": 1024,
+            "messages": [
+                {"role": "user", "content": f"message {i} " * 20}
+                for i in range(messages)
+            ],
+            "tools": [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": f"server_tool_{i}",
+                        "description": "Fetch a URL and return its contents",
+                        "parameters": {
+                            "type": "object",
+                            "properties": {"url": {"type": "string"}},
+                        },
+                    },
+                }
+                for i in range(5)
+            ],
+        }
+    }
+    response = {
+        "data": ChatCompletion.model_validate(
+            {
+                "id": "chatcmpl-1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o",
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": "answer " * 50},
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 100,
+                    "completion_tokens": 50,
+                    "total_tokens": 150,
+                },
+            }
+        )
+    }
+    return [request, response]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--messages", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.messages)
+    previous = PreviousJSONSerializer()
+    scenarios = [
+        (
+            "previous + json.dumps",
+            lambda data: json.dumps(previous(data), separators=(",", ":")),
+        ),
+        ("JSONSerializer json", JSONSerializer(backend="json").dumps),
+    ]
+    if orjson is not None:
+        scenarios.append(("JSONSerializer orjson", JSONSerializer().dumps))
+
+    print(f"events: {args.events}, messages per request: {args.messages}")
+    print(f"{'':24}{'events/s':>12}{'us/event':>12}")
+    for label, dumps in scenarios:
+        start = time.perf_counter()
+        for i in range(args.events):
+            dumps(payloads[i % len(payloads)])
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:24}{args.events / elapsed:>12,.0f}"
+            f"{elapsed / args.events * 1e6:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: per-call overhead of @telemetry.traced on a no-op function.
+
+Each traced function takes a request shaped like RequestCompletionRequest (a
+config plus a message history), which is what workflow tasks such as
+request_completion_task receive. Overhead is reported relative to calling the
+undecorated function, for tracing disabled, for spans that are not sampled,
+and for sampled spans under each argument capture policy.
+
+Usage:
+    python benchmarks/bench_traced.py [--calls N] [--messages M]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF, ALWAYS_ON
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp_agent.core.context import Context  # noqa: E402
+from mcp_agent.tracing.telemetry import TelemetryManager  # noqa: E402
+
+
+def make_request(messages: int) -> dict:
+    return {
+        "config": {
+            "api_key": "sk-bench",
+            "base_url": None,
+            "reasoning_effort": "medium",
+        },
+        "payload": {
+            "model": "gpt-4o",
+            "messages": [
+                {"role": "user", "content": f"message {i} " * 20}
+                for i in range(messages)
+            ],
+        },
+    }
+
+
+async def noop(request: dict, turn: int = 0) -> int:
+    return turn
+
+
+async def time_calls(func, request: dict, calls: int) -> float:
+    """Average seconds per call."""
+    start = time.perf_counter()
+    for i in range(calls):
+        await func(request, turn=i)
+    return (time.perf_counter() - start) / calls
+
+
+async def run(calls: int, messages: int):
+    request = make_request(messages)
+    baseline = await time_calls(noop, request, calls)
+
+    scenarios = [("tracing disabled", False, ALWAYS_ON, "full")]
+    scenarios.append(("span not sampled", True, ALWAYS_OFF, "full"))
+    for capture in ("none", "names", "shallow", "full"):
+        scenarios.append((f"sampled, capture={capture}", True, ALWAYS_ON, capture))
+
+    print(f"calls: {calls}, messages per request: {messages}")
+    print(f"undecorated: {baseline * 1e6:.2f} us/call")
+    print(f"{'':28}{'us/call':>10}{'overhead us':>14}")
+    for label, enabled, sampler, capture in scenarios:
+        provider = TracerProvider(sampler=sampler, shutdown_on_exit=False)
+        context = Context(tracing_enabled=enabled, tracer=provider.get_tracer("bench"))
+        traced = TelemetryManager(context=context).traced(capture=capture)(noop)
+
+        elapsed = await time_calls(traced, request, calls)
+        print(f"{label:28}{elapsed * 1e6:>10.2f}{(elapsed - baseline) * 1e6:>14.2f}")
+        provider.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--messages", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls, args.messages))
+
+
+if __name__ == "__main__":
+    main()
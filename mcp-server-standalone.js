@@ -901,6 +901,8 @@ export class ${codeType}Service {
 class StdioHandler {
   constructor() {
     this.server = new SimpleMCPServer();
+    // Holds a partial line until the rest of it arrives in a later chunk
+    this.buffer = '';
     process.stdin.setEncoding('utf8');
     process.stdin.on('data', (data) => {
       this.handleInput(data);
@@ -908,7 +910,8 @@ class StdioHandler {
   }
 
   async handleInput(data) {
-    const lines = data.trim().split('\n');
+    const lines = (this.buffer + data).split('\n');
+    this.buffer = lines.pop();
     
     for (const line of lines) {
       if (line.trim()) {
@@ -44,6 +44,7 @@ from mcp_agent.human_input.types import (
 from mcp_agent.logging.logger import get_logger
 
 if TYPE_CHECKING:
+    from mcp_agent.utils.tool_filter import ToolFilter
     from mcp_agent.workflows.llm.augmented_llm import AugmentedLLM
 
     # Define a TypeVar for AugmentedLLM and its subclasses that's only used at type checking time
@@ -52,6 +53,7 @@ else:
     # Define a TypeVar without the bound for runtime
     LLM = TypeVar("LLM")
 
+T = TypeVar("T")
 
 logger = get_logger(__name__)
 
@@ -142,6 +144,13 @@ class Agent(BaseModel):
         default_factory=dict
     )
 
+    # Bumped whenever the tool maps change, to invalidate converted tool caches
+    _tool_map_version: int = PrivateAttr(default=0)
+    # Maps (provider, server_name, has_human_input) -> (tool map version, converted tools)
+    _provider_tools_cache: Dict[tuple, tuple[int, List[Any]]] = PrivateAttr(
+        default_factory=dict
+    )
+
     _agent_tasks: "AgentTasks" = PrivateAttr(default=None)
     _init_lock: asyncio.Lock = PrivateAttr(default_factory=asyncio.Lock)
 
@@ -249,6 +258,8 @@ class Agent(BaseModel):
                 self._server_to_tool_map.clear()
                 self._server_to_tool_map.update(result.server_to_tool_map)
 
+                self._tool_map_version += 1
+
                 self._namespaced_prompt_map.clear()
                 self._namespaced_prompt_map.update(result.namespaced_prompt_map)
 
@@ -484,6 +495,48 @@ class Agent(BaseModel):
 
             return result
 
+    @property
+    def tool_map_version(self) -> int:
+        """A counter that changes whenever the agent's tools change."""
+        return self._tool_map_version
+
+    async def list_tools_for_provider(
+        self,
+        provider: str,
+        convert: Callable[[Tool], T],
+        server_name: str | None = None,
+        tool_filter: Optional["ToolFilter"] = None,
+    ) -> List[T]:
+        """
+        List the agent's tools converted into a provider's tool format with `convert`,
+        keeping only the tools `tool_filter` includes.
+
+        The converted list is memoized per (provider, server_name, tool_filter) until
+        the tool maps change, so LLM turns don't re-copy and re-convert every tool
+        schema. The returned list is shared and must not be mutated.
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        key = (
+            provider,
+            server_name,
+            self.human_input_callback is not None,
+            tool_filter,
+        )
+        cached = self._provider_tools_cache.get(key)
+        if cached is not None and cached[0] == self._tool_map_version:
+            return cached[1]
+
+        version = self._tool_map_version
+        # Bypass list_tools patched onto the instance by a filtered LLM sharing this
+        # agent (see apply_tool_filter), so each cache entry holds exactly its filter
+        result = await type(self).list_tools(self, server_name=server_name)
+        tools = tool_filter.filter_tools(result.tools) if tool_filter else result.tools
+        converted = [convert(tool) for tool in tools]
+        self._provider_tools_cache[key] = (version, converted)
+        return converted
+
     async def list_resources(
         self, server_name: str | None = None
     ) -> ListResourcesResult:
@@ -230,10 +230,12 @@ class MCPApp:
         # Force flush traces before cleanup
         if self._context and self._context.tracing_config:
             await self._context.tracing_config.flush()
+        if self._context and self._context.metrics_config:
+            self._context.metrics_config.flush()
 
         try:
             # Don't shutdown OTEL completely, just cleanup app-specific resources
-            await cleanup_context(shutdown_logger=False)
+            await cleanup_context(shutdown_logger=False, context=self._context)
         except asyncio.CancelledError:
             self.logger.debug("Cleanup cancelled during shutdown")
 
@@ -241,6 +243,8 @@ class MCPApp:
         # This prevents dangling span exports after cleanup
         if self._context and self._context.tracing_config:
             self._context.tracing_config.shutdown()
+        if self._context and self._context.metrics_config:
+            self._context.metrics_config.shutdown()
 
         self._context = None
         self._initialized = False
@@ -105,6 +105,14 @@ class MCPSettings(BaseModel):
     """Configuration for all MCP servers."""
 
     servers: Dict[str, MCPServerSettings] = Field(default_factory=dict)
+
+    capability_cache_ttl: float | None = 300.0
+    """
+    Seconds a server's cached tools/prompts/resources listing stays valid.
+    Entries are also dropped when the server sends a list_changed notification.
+    None caches until a notification arrives; 0 disables caching.
+    """
+
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
@@ -169,7 +177,8 @@ class OpenAISettings(BaseModel):
     # NOTE: An http_client can be programmatically specified
     # and will be used by the OpenAI client. However, since it is
     # not a JSON-serializable object, it cannot be set via configuration.
-    # http_client: Client | None = None
+    # The client is async, so it must be an httpx.AsyncClient.
+    # http_client: AsyncClient | None = None
 
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
@@ -207,6 +216,32 @@ class GoogleSettings(BaseModel):
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
+class ClientPoolSettings(BaseModel):
+    """
+    Settings for the per-context pool of long-lived LLM provider clients.
+    """
+
+    max_connections_per_host: int = 100
+    """Maximum number of open connections a pooled client keeps to its host."""
+
+    max_keepalive_connections: int = 20
+    """Maximum number of idle keep-alive connections retained per pooled client."""
+
+    keepalive_expiry: float = 30.0
+    """Seconds an idle keep-alive connection is retained before being closed."""
+
+    max_concurrent_requests_per_host: int | None = None
+    """Maximum number of in-flight requests to each provider host. Unbounded if None."""
+
+    max_blocking_threads: int = 32
+    """
+    Size of the thread pool used to run provider SDK calls that have no async
+    client (e.g. boto3 Bedrock), so they don't block the event loop.
+    """
+
+    model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
+
+
 class TemporalSettings(BaseModel):
     """
     Temporal settings for the MCP Agent application.
@@ -267,6 +302,26 @@ class TraceOTLPSettings(BaseModel):
     """OTLP endpoint for exporting traces."""
 
 
+class MetricsSettings(BaseModel):
+    """
+    Settings for performance metrics (LLM, MCP tool call and connection latencies,
+    logger queue depth), exported with the OpenTelemetry metrics SDK.
+    """
+
+    exporters: List[Literal["console", "otlp", "prometheus"]] = []
+    """
+    List of metrics exporters. otlp uses the endpoint in otel.otlp_settings, with
+    /v1/traces replaced by /v1/metrics. prometheus serves the metrics in the
+    Prometheus text format from the app server at prometheus_path.
+    """
+
+    export_interval: float = 60.0
+    """Seconds between exports for the console and otlp exporters."""
+
+    prometheus_path: str = "/metrics"
+    """Path of the Prometheus scrape endpoint on the app server."""
+
+
 class OpenTelemetrySettings(BaseModel):
     """
     OTEL settings for the MCP Agent application.
@@ -284,6 +339,27 @@ class OpenTelemetrySettings(BaseModel):
     sample_rate: float = 1.0
     """Sample rate for tracing (1.0 = sample everything)"""
 
+    max_span_attributes: int | None = 128
+    """
+    Maximum number of attributes recorded on a span (and on each span event).
+    Nested values stop being flattened once the limit is reached. None for no limit.
+    """
+
+    max_attribute_length: int | None = 4096
+    """Maximum length of a string attribute value; longer values are truncated."""
+
+    max_attribute_depth: int | None = 5
+    """
+    Maximum depth to which nested dicts and lists are flattened into attributes.
+    Deeper values are recorded as a short summary.
+    """
+
+    payload_sample_rate: float = 1.0
+    """
+    Fraction of sampled traces that record payloads (message contents, tool
+    arguments and results) on their spans. Decided per trace.
+    """
+
     otlp_settings: TraceOTLPSettings | None = None
     """OTLP settings for OpenTelemetry tracing. Required if using otlp exporter."""
 
@@ -300,6 +376,21 @@ class OpenTelemetrySettings(BaseModel):
     Ignored if 'path' is specified.
     """
 
+    file_format: Literal["json", "protobuf"] = "json"
+    """
+    Format of the file exporter's trace file: JSON lines, or length-delimited OTLP
+    protobuf, which is smaller but slower to encode. With protobuf a .jsonl path becomes .binpb.
+    """
+
+    file_max_bytes: int | None = None
+    """Rotate the trace file once it grows past this many bytes. None disables rotation."""
+
+    file_compress_rotated: bool = True
+    """Whether to gzip rotated trace files."""
+
+    metrics: MetricsSettings | None = None
+    """Performance metrics settings. Metrics are exported only when otel is enabled."""
+
 
 class LogPathSettings(BaseModel):
     """
@@ -327,6 +418,30 @@ class LogPathSettings(BaseModel):
     """
 
 
+class LogArchiveSettings(BaseModel):
+    """
+    Settings for archiving log events in batches, partitioned by session and hour.
+    """
+
+    path: str = "logs/archive"
+    """Root directory of the archive"""
+
+    format: Literal["parquet", "jsonl"] = "parquet"
+    """Archive format. Parquet requires pyarrow and falls back to JSONL if it isn't installed."""
+
+    compression: str | None = "zstd"
+    """Parquet compression codec. JSONL archives are gzipped unless this is None."""
+
+    batch_size: int = 1000
+    """Number of events written per batch (one Parquet row group)"""
+
+    flush_interval: float = 5.0
+    """How often to write a partial batch, in seconds"""
+
+    max_open_partitions: int = 4
+    """Maximum number of Parquet files kept open for writing"""
+
+
 class LoggerSettings(BaseModel):
     """
     Logger settings for the MCP Agent application.
@@ -362,6 +477,48 @@ class LoggerSettings(BaseModel):
     max_queue_size: int = 2048
     """Maximum queue size for event processing"""
 
+    archive: LogArchiveSettings | None = None
+    """Archive log events to Parquet/JSONL files, partitioned by session and hour"""
+
+    otlp_export: bool = False
+    """
+    Export log events as OpenTelemetry logs to the OTLP endpoint configured in
+    'otel.otlp_settings' (its /v1/traces path is swapped for /v1/logs).
+    """
+
+    queue_overflow_policy: Literal["drop", "block"] = "block"
+    """
+    What to do with new events when the event queue is full: 'drop' discards them
+    (counted in the event bus stats), 'block' waits for the queue to drain.
+    Producers on the event loop can't wait, so under 'block' their events
+    overfill the queue: warnings and errors are always kept, debug and info
+    events are dropped past twice max_queue_size. Drops are reported with a
+    warning event.
+    """
+
+    # File transport settings
+    file_buffered: bool = False
+    """
+    Keep the log file open and serialize and write events from a background
+    thread instead of doing so, and opening and flushing the file, on the event
+    loop for every event.
+    """
+
+    file_flush_size: int = 64 * 1024
+    """Buffered bytes that trigger a flush, if 'file_buffered' is enabled"""
+
+    file_flush_interval: float = 1.0
+    """Maximum seconds between flushes, if 'file_buffered' is enabled"""
+
+    file_max_bytes: int | None = None
+    """Rotate the log file once it grows past this size, if 'file_buffered' is enabled"""
+
+    file_rotate_interval: float | None = None
+    """Rotate the log file after this many seconds, if 'file_buffered' is enabled"""
+
+    file_compress_rotated: bool = True
+    """Gzip rotated log files"""
+
     # HTTP transport settings
     http_endpoint: str | None = None
     """HTTP endpoint for event transport"""
@@ -413,6 +570,9 @@ class Settings(BaseSettings):
     google: GoogleSettings | None = None
     """Settings for using Google models in the MCP Agent application"""
 
+    client_pool: ClientPoolSettings | None = ClientPoolSettings()
+    """Connection pooling settings for LLM provider clients"""
+
     otel: OpenTelemetrySettings | None = OpenTelemetrySettings()
     """OpenTelemetry logging settings for the MCP Agent application"""
 
@@ -4,7 +4,7 @@ A central context object to store global state that is shared across the applica
 
 import asyncio
 import concurrent.futures
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict
 
@@ -24,10 +24,14 @@ from mcp_agent.executor.signal_registry import SignalRegistry
 from mcp_agent.executor.task_registry import ActivityRegistry
 
 from mcp_agent.logging.events import EventFilter
+from mcp_agent.logging.listeners import ArchiveListener, EventListener, OTLPLogListener
 from mcp_agent.logging.logger import LoggingConfig
-from mcp_agent.logging.transport import create_transport
+from mcp_agent.logging.transport import create_transport, otlp_logs_endpoint
+from mcp_agent.mcp.capability_cache import MCPCapabilityCache
 from mcp_agent.mcp.mcp_server_registry import ServerRegistry
+from mcp_agent.tracing.metrics import MetricsConfig
 from mcp_agent.tracing.tracer import TracingConfig
+from mcp_agent.workflows.llm.client_pool import ProviderClientPool
 from mcp_agent.workflows.llm.llm_selector import ModelSelector
 from mcp_agent.logging.logger import get_logger
 
@@ -62,6 +66,8 @@ class Context(BaseModel):
     signal_notification: Optional[SignalWaitCallback] = None
     upstream_session: Optional[ServerSession] = None  # TODO: saqadri - figure this out
     model_selector: Optional[ModelSelector] = None
+    client_pool: Optional[ProviderClientPool] = None
+    capability_cache: Optional[MCPCapabilityCache] = None
     session_id: str | None = None
     app: Optional["MCPApp"] = None
 
@@ -77,6 +83,8 @@ class Context(BaseModel):
     tracing_enabled: bool = False
     # Store the TracingConfig instance for this context
     tracing_config: Optional[TracingConfig] = None
+    # Store the MetricsConfig instance for this context, if metrics are enabled
+    metrics_config: Optional[MetricsConfig] = None
 
     model_config = ConfigDict(
         extra="allow",
@@ -101,6 +109,23 @@ async def configure_otel(
     return tracing_config
 
 
+def configure_metrics(
+    config: "Settings", session_id: str | None = None
+) -> Optional[MetricsConfig]:
+    """
+    Configure performance metrics based on the application config.
+
+    Returns:
+        MetricsConfig instance if OTEL and metrics are enabled, None otherwise
+    """
+    if not config.otel.enabled or not config.otel.metrics:
+        return None
+
+    metrics_config = MetricsConfig()
+    metrics_config.configure(settings=config.otel, session_id=session_id)
+    return metrics_config
+
+
 async def configure_logger(config: "Settings", session_id: str | None = None):
     """
     Configure logging and tracing based on the application config.
@@ -110,12 +135,40 @@ async def configure_logger(config: "Settings", session_id: str | None = None):
     transport = create_transport(
         settings=config.logger, event_filter=event_filter, session_id=session_id
     )
+
+    listeners: Dict[str, EventListener] = {}
+    if config.logger.archive:
+        archive = config.logger.archive
+        listeners["archive"] = ArchiveListener(
+            directory=archive.path,
+            event_filter=event_filter,
+            batch_size=archive.batch_size,
+            flush_interval=archive.flush_interval,
+            format=archive.format,
+            compression=archive.compression,
+            max_open_partitions=archive.max_open_partitions,
+        )
+    if config.logger.otlp_export:
+        if not config.otel.otlp_settings:
+            raise ValueError(
+                "OTLP log export requires an OTLP endpoint in 'otel.otlp_settings'"
+            )
+        listeners["otlp"] = OTLPLogListener(
+            endpoint=otlp_logs_endpoint(config.otel.otlp_settings.endpoint),
+            event_filter=event_filter,
+            service_name=config.otel.service_name,
+            resource_attributes={"session.id": session_id} if session_id else None,
+        )
+
     await LoggingConfig.configure(
         event_filter=event_filter,
         transport=transport,
         batch_size=config.logger.batch_size,
         flush_interval=config.logger.flush_interval,
         progress_display=config.logger.progress_display,
+        max_queue_size=config.logger.max_queue_size,
+        queue_overflow_policy=config.logger.queue_overflow_policy,
+        listeners=listeners,
     )
 
 
@@ -178,6 +231,10 @@ async def initialize_context(
     context = Context()
     context.config = config
     context.server_registry = ServerRegistry(config=config)
+    context.client_pool = ProviderClientPool(settings=config.client_pool)
+    context.capability_cache = MCPCapabilityCache(
+        ttl=config.mcp.capability_cache_ttl if config.mcp else None
+    )
 
     # Configure the executor
     context.executor = await configure_executor(config)
@@ -189,6 +246,7 @@ async def initialize_context(
 
     # Configure logging and telemetry
     context.tracing_config = await configure_otel(config, context.session_id)
+    context.metrics_config = configure_metrics(config, context.session_id)
     await configure_logger(config, context.session_id)
     await configure_usage_telemetry(config)
 
@@ -221,20 +279,28 @@ async def initialize_context(
     return context
 
 
-async def cleanup_context(shutdown_logger: bool = False):
+async def cleanup_context(
+    shutdown_logger: bool = False, context: Optional[Context] = None
+):
     """
     Cleanup the global application context.
 
     Args:
         shutdown_logger: If True, completely shutdown OTEL infrastructure.
                       If False, just cleanup app-specific resources.
+        context: The context to clean up. Defaults to the global context.
     """
+    context = context or _global_context
+    if context is not None and context.client_pool is not None:
+        # Close pooled provider clients and their keep-alive connections
+        await context.client_pool.close()
+
     if shutdown_logger:
         # Shutdown logging and telemetry completely
         await LoggingConfig.shutdown()
     else:
-        # Just cleanup app-specific resources
-        pass
+        # Just cleanup app-specific resources, making sure buffered log events are written
+        await LoggingConfig.flush()
 
 
 _global_context: Context | None = None
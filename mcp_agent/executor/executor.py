@@ -53,6 +53,12 @@ class ExecutorConfig(BaseModel):
 class Executor(ABC, ContextDependent):
     """Abstract base class for different execution backends"""
 
+    crosses_process_boundary: bool = False
+    """
+    Whether task arguments and results are sent to another process (and so must be
+    JSON-serializable). In-process executors pass objects through untouched.
+    """
+
     def __init__(
         self,
         engine: str,
@@ -54,6 +54,8 @@ class TemporalExecutorConfig(ExecutorConfig, TemporalSettings):
 class TemporalExecutor(Executor):
     """Executor that runs @workflows as Temporal workflows, with @workflow_tasks as Temporal activities"""
 
+    crosses_process_boundary = True
+
     def __init__(
         self,
         config: TemporalExecutorConfig | None = None,
@@ -8,7 +8,9 @@ import random
 from datetime import datetime
 from typing import (
     Any,
+    Callable,
     Dict,
+    FrozenSet,
     Literal,
     Set,
 )
@@ -19,6 +21,40 @@ from pydantic import BaseModel, ConfigDict, Field
 EventType = Literal["debug", "info", "warning", "error", "progress"]
 """Broad categories for events (severity or role)."""
 
+EVENT_LEVELS: Dict[EventType, int] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+"""Severity of each EventType. Types not listed (e.g. "progress") rank as DEBUG."""
+
+
+def event_level(event_type: EventType) -> int:
+    """Return the severity of an event type as a `logging` level."""
+    return EVENT_LEVELS.get(event_type, logging.DEBUG)
+
+
+class LazyValue:
+    """An event data value computed only if the event is consumed (see `lazy`)."""
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[[], Any]):
+        self.func = func
+
+    def __repr__(self) -> str:
+        return f"lazy({getattr(self.func, '__qualname__', self.func)!r})"
+
+
+def lazy(func: Callable[[], Any]) -> LazyValue:
+    """
+    Defer an expensive event data value until the event is known to be consumed,
+    e.g. `logger.debug("request", data=lazy(request.model_dump))`. Other callables
+    in event data are logged as they are, never called.
+    """
+    return LazyValue(func)
+
 
 class EventContext(BaseModel):
     """
@@ -56,6 +92,19 @@ class Event(BaseModel):
 
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
+    def resolve_data(self):
+        """
+        Evaluate lazy data values in place, e.g. `logger.debug(..., data=lazy(request.model_dump))`.
+        Consumers call this once an event is known to be used, so expensive
+        payloads are never built for events that get filtered out.
+        """
+        for key, value in self.data.items():
+            if isinstance(value, LazyValue):
+                try:
+                    self.data[key] = value.func()
+                except Exception as e:
+                    self.data[key] = f"<error evaluating lazy log data: {e}>"
+
 
 class EventFilter(BaseModel):
     """
@@ -64,6 +113,9 @@ class EventFilter(BaseModel):
       - allowed event 'names'
       - allowed namespace prefixes
       - a minimum severity level (DEBUG < INFO < WARNING < ERROR)
+
+    Transports and listeners compile the criteria once into a predicate
+    (see `compile`) instead of re-evaluating them for every event.
     """
 
     types: Set[EventType] | None = Field(default_factory=set)
@@ -74,50 +126,128 @@ class EventFilter(BaseModel):
     def matches(self, event: Event) -> bool:
         """
         Check if an event matches this EventFilter criteria.
+        Callers checking many events should hold on to `compile()` instead.
+        """
+        return self.compile()(event)
+
+    def compile(self) -> Callable[[Event], bool]:
+        """
+        Return a predicate equivalent to `matches`, with the criteria precomputed.
+        The predicate reflects the filter as it is now; compile again after
+        changing it.
         """
-        # 1) Filter by broad event type
-        if self.types:
-            if event.type not in self.types:
+        return self._compile()
+
+    def _compile(self) -> Callable[[Event], bool]:
+        types = frozenset(self.types) if self.types else None
+        names = frozenset(self.names) if self.names else None
+        namespace_matches = (
+            _compile_namespace_prefixes(frozenset(self.namespaces))
+            if self.namespaces
+            else None
+        )
+        # Every event ranks at least DEBUG, so a DEBUG threshold filters nothing
+        threshold = self.min_level_value
+        if threshold <= logging.DEBUG:
+            threshold = None
+
+        levels = EVENT_LEVELS
+        default_level = logging.DEBUG
+
+        def matches(event: Event) -> bool:
+            # 1) Minimum severity
+            if (
+                threshold is not None
+                and levels.get(event.type, default_level) < threshold
+            ):
                 return False
 
-        # 2) Filter by custom event name
-        if self.names:
-            if not event.name or event.name not in self.names:
+            # 2) Filter by broad event type
+            if types is not None and event.type not in types:
                 return False
 
-        # 3) Filter by namespace prefix
-        if self.namespaces and not any(
-            event.namespace.startswith(ns) for ns in self.namespaces
-        ):
-            return False
-
-        # 4) Minimum severity
-        if self.min_level:
-            level_map: Dict[EventType, int] = {
-                "debug": logging.DEBUG,
-                "info": logging.INFO,
-                "warning": logging.WARNING,
-                "error": logging.ERROR,
-            }
-
-            min_val = level_map.get(self.min_level, logging.DEBUG)
-            event_val = level_map.get(event.type, logging.DEBUG)
-            if event_val < min_val:
+            # 3) Filter by custom event name
+            if names is not None and (not event.name or event.name not in names):
                 return False
 
-        return True
+            # 4) Filter by namespace prefix
+            if namespace_matches is not None and not namespace_matches(event.namespace):
+                return False
+
+            return True
+
+        return matches
+
+    @property
+    def min_level_value(self) -> int:
+        """The minimum severity this filter lets through, as a `logging` level."""
+        return event_level(self.min_level) if self.min_level else logging.DEBUG
 
 
 class SamplingFilter(EventFilter):
     """
     Random sampling on top of base filter.
     Only pass an event if it meets the base filter AND random() < sample_rate.
+
+    With `sample_by="trace_id"`, the decision is derived from the event's trace ID
+    instead, so every event of a trace is kept or dropped together. This uses the
+    same rule as OpenTelemetry's TraceIdRatioBased sampler, so logs are kept for
+    the traces that are sampled at the same rate. Events without a trace ID are
+    sampled randomly.
     """
 
     sample_rate: float = 0.1
     """Fraction of events to pass through"""
 
-    def matches(self, event: Event) -> bool:
-        if not super().matches(event):
-            return False
-        return random.random() < self.sample_rate
+    sample_by: Literal["random", "trace_id"] = "random"
+    """Whether to sample each event independently or whole traces"""
+
+    def _compile(self) -> Callable[[Event], bool]:
+        base_matches = super()._compile()
+        sample_rate = self.sample_rate
+        by_trace = self.sample_by == "trace_id"
+        # Compare the low 64 bits of the trace ID against the rate, like TraceIdRatioBased
+        trace_id_bound = round(sample_rate * _TRACE_ID_LIMIT)
+
+        def matches(event: Event) -> bool:
+            if not base_matches(event):
+                return False
+            if by_trace and event.trace_id:
+                try:
+                    return int(event.trace_id, 16) & _TRACE_ID_LIMIT < trace_id_bound
+                except ValueError:
+                    pass
+            return random.random() < sample_rate
+
+        return matches
+
+
+_TRACE_ID_LIMIT = (1 << 64) - 1
+
+_NAMESPACE_CACHE_SIZE = 4096
+
+
+def _compile_namespace_prefixes(prefixes: FrozenSet[str]) -> Callable[[str], bool]:
+    """
+    Build a predicate checking whether a namespace starts with any of `prefixes`.
+
+    Rather than calling startswith for every prefix, the namespace is sliced once
+    per distinct prefix length and looked up in the set. Loggers use a small,
+    fixed set of namespaces, so results are also memoized.
+    """
+    lengths = sorted({len(prefix) for prefix in prefixes})
+    cache: Dict[str, bool] = {}
+
+    def matches(namespace: str) -> bool:
+        result = cache.get(namespace)
+        if result is None:
+            result = any(
+                namespace[:length] in prefixes
+                for length in lengths
+                if length <= len(namespace)
+            )
+            if len(cache) < _NAMESPACE_CACHE_SIZE:
+                cache[namespace] = result
+        return result
+
+    return matches
@@ -1,6 +1,10 @@
+import json
 import os
+import re
 import warnings
-from typing import Any, Dict, Iterable, Set
+from collections.abc import Iterable, Sized
+from itertools import islice
+from typing import Any, Callable, Dict, Literal, Set, Tuple
 from datetime import datetime, date
 from decimal import Decimal
 from pathlib import Path
@@ -10,16 +14,39 @@ import dataclasses
 import inspect
 import httpx
 
-from mcp_agent.logging import logger
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+JSONBackend = Literal["auto", "json", "orjson"]
+"""
+json: the standard library encoder.
+orjson: the orjson encoder, which is several times faster. Requires orjson.
+auto: orjson when it is installed, json otherwise.
+"""
+
+_Handler = Callable[[Any, int], Any]
+_MISSING = object()
 
 
 class JSONSerializer:
     """
     A robust JSON serializer that handles various Python objects by attempting
     different serialization strategies recursively.
+
+    The strategy for each type is resolved once and cached, so serializing many
+    objects of the same types only costs a dict lookup per value. An object
+    reachable more than once is serialized once per call and its result reused.
+    Output is bounded by max_depth, max_collection_length, max_string_length
+    and max_nodes; anything past a limit is replaced by a marker describing
+    what was left out.
     """
 
     MAX_DEPTH = 99  # Maximum recursion depth
+    MAX_COLLECTION_LENGTH = 1000  # Items kept per dict, list, tuple or set
+    MAX_STRING_LENGTH = 64 * 1024  # Characters kept per string
+    MAX_NODES = 100_000  # Values kept per serialize call, counting reused results
 
     # Fields that are likely to contain sensitive information
     SENSITIVE_FIELDS = {
@@ -34,11 +61,55 @@ class JSONSerializer:
         "refresh_token",
     }
 
-    def __init__(self):
-        # Set of already processed objects to prevent infinite recursion
+    _SENSITIVE_KEY_CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        max_depth: int = MAX_DEPTH,
+        max_collection_length: int | None = MAX_COLLECTION_LENGTH,
+        max_string_length: int | None = MAX_STRING_LENGTH,
+        max_nodes: int | None = MAX_NODES,
+        backend: JSONBackend = "auto",
+    ):
+        """
+        Args:
+            max_depth: Nesting depth past which values are replaced by a marker
+            max_collection_length: Items kept per collection. None for no limit
+            max_string_length: Characters kept per string. None for no limit
+            max_nodes: Values kept per serialize call, including each copy of a
+                result reused for an object reachable more than once. None for no limit
+            backend: Encoder used by dumps and dumps_bytes
+        """
+        self.max_depth = max_depth
+        self.max_collection_length = max_collection_length
+        self.max_string_length = max_string_length
+        self.max_nodes = max_nodes
+
+        if backend == "orjson" and orjson is None:
+            warnings.warn(
+                "orjson is not installed; serializing logs with the json module instead. "
+                "Install orjson for faster serialization.",
+                stacklevel=2,
+            )
+        self._use_orjson = backend != "json" and orjson is not None
+
+        # Ids of the containers being serialized, to detect reference cycles
         self._processed_objects: Set[int] = set()
+        # Results of this serialize call by object id, with the object (which
+        # keeps its id from being reused) and the number of values in the result
+        self._memo: Dict[int, Tuple[Any, Any, int]] = {}
+        # Values produced by this serialize call, checked against max_nodes
+        self._nodes = 0
+        self._handlers: Dict[type, _Handler] = {}
+
         # Check if secrets should be logged in full
         self._log_secrets = os.getenv("LOG_SECRETS", "").upper() == "TRUE"
+        # Sensitive fields match as case-insensitive substrings of a key
+        self._sensitive_pattern = re.compile(
+            "|".join(re.escape(field) for field in sorted(self.SENSITIVE_FIELDS)),
+            re.IGNORECASE,
+        )
+        self._sensitive_keys: Dict[str, bool] = {}
 
     def _redact_sensitive_value(self, value: str) -> str:
         """Redact sensitive values to show only first 10 chars."""
@@ -54,109 +125,272 @@ class JSONSerializer:
         """Main entry point for serialization."""
         # Reset processed objects for new serialization
         self._processed_objects.clear()
-        return self._serialize_object(obj, depth=0)
+        self._nodes = 0
+        try:
+            return self._serialize_object(obj, depth=0)
+        finally:
+            self._memo.clear()
+
+    def dumps(self, obj: Any) -> str:
+        """Serialize obj and encode it as compact JSON text."""
+        return self.encode(self.serialize(obj)).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Serialize obj and encode it as compact UTF-8 JSON."""
+        return self.encode(self.serialize(obj))
+
+    def encode(self, data: Any) -> bytes:
+        """Encode already serialized data as compact UTF-8 JSON."""
+        if self._use_orjson:
+            try:
+                return orjson.dumps(data)
+            except TypeError:
+                # e.g. integers wider than 64 bits, which json handles
+                pass
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
 
     def _is_sensitive_key(self, key: str) -> bool:
         """Check if a key likely contains sensitive information."""
-        key = str(key).lower()
-        return any(sensitive in key for sensitive in self.SENSITIVE_FIELDS)
+        sensitive = self._sensitive_keys.get(key)
+        if sensitive is None:
+            sensitive = self._sensitive_pattern.search(key) is not None
+            if len(self._sensitive_keys) >= self._SENSITIVE_KEY_CACHE_SIZE:
+                self._sensitive_keys.clear()
+            self._sensitive_keys[key] = sensitive
+        return sensitive
 
     def _serialize_object(self, obj: Any, depth: int = 0) -> Any:
         """Recursively serialize an object using various strategies."""
-        # Handle None
-        if obj is None:
-            return None
+        # Fast path for the JSON scalars that make up most payloads
+        obj_type = type(obj)
+        if obj is None or obj_type is int or obj_type is float or obj_type is bool:
+            return obj
+        if obj_type is str:
+            return self._serialize_str(obj, depth)
 
-        if depth == 0:
-            self._parent_obj = obj
         # Check depth
-        if depth > self.MAX_DEPTH:
-            warnings.warn(
-                f"Maximum recursion depth ({self.MAX_DEPTH}) exceeded while serializing object of type {type(obj).__name__} parent: {type(self._parent_obj).__name__}"
+        if depth > self.max_depth:
+            return f"<max depth exceeded: {obj_type.__name__}>"
+
+        # Reuse the result for an object already serialized by this call, so
+        # shared references don't multiply the work
+        obj_id = id(obj)
+        memo = self._memo.get(obj_id)
+        if memo is not None:
+            _, result, nodes = memo
+            if self.max_nodes is not None and self._nodes + nodes > self.max_nodes:
+                return self._node_limit_marker()
+            self._nodes += nodes
+            return result
+
+        handler = self._handlers.get(obj_type)
+        if handler is None:
+            handler = self._handlers[obj_type] = self._resolve_handler(obj_type)
+
+        start = self._nodes
+        try:
+            result = handler(obj, depth)
+        except Exception as e:
+            # If all serialization attempts fail, return string representation
+            result = f"<unserializable: {obj_type.__name__}, error: {str(e)}>"
+        self._memo[obj_id] = (obj, result, self._nodes - start)
+        return result
+
+    def _over_node_limit(self, nodes: int) -> bool:
+        """Charge nodes against max_nodes, unless the budget is already spent."""
+        if self.max_nodes is not None and self._nodes >= self.max_nodes:
+            return True
+        self._nodes += nodes
+        return False
+
+    def _node_limit_marker(self) -> str:
+        return f"<truncated: output limit of {self.max_nodes} values reached>"
+
+    def _resolve_handler(self, obj_type: type) -> _Handler:
+        """Pick the serialization strategy for instances of obj_type."""
+        # Imported here: the logger module imports this one via its transports
+        from mcp_agent.logging.logger import Logger
+
+        if issubclass(obj_type, httpx.Response):
+            return lambda obj, depth: f"<httpx.Response [{obj.status_code}] {obj.url}>"
+        if issubclass(obj_type, Logger):
+            return lambda obj, depth: "<logging: logger>"
+
+        # Basic JSON-serializable types, including subclasses such as str enums
+        if issubclass(obj_type, str):
+            return self._serialize_str
+        if issubclass(obj_type, (int, float, bool)):
+            return lambda obj, depth: obj
+
+        # Handle common built-in types
+        if issubclass(obj_type, (datetime, date)):
+            return lambda obj, depth: obj.isoformat()
+        if issubclass(obj_type, (Decimal, UUID, Path)):
+            return lambda obj, depth: str(obj)
+        if issubclass(obj_type, Enum):
+            return lambda obj, depth: self._serialize_object(obj.value, depth)
+        if issubclass(obj_type, (bytes, bytearray, memoryview)):
+            return lambda obj, depth: f"<{obj_type.__name__}: {len(obj)} bytes>"
+
+        # Handle callables
+        if any("__call__" in vars(cls) for cls in obj_type.__mro__):
+            return lambda obj, depth: (
+                f"<callable: {getattr(obj, '__name__', obj_type.__name__)}>"
+            )
+
+        # Handle Pydantic models
+        if hasattr(obj_type, "model_dump"):  # Pydantic v2
+            return self._serialize_model
+        if hasattr(obj_type, "dict"):  # Pydantic v1
+            return lambda obj, depth: self._serialize_object(obj.dict(), depth)
+
+        # Handle dataclasses
+        if dataclasses.is_dataclass(obj_type):
+            return lambda obj, depth: self._serialize_object(
+                dataclasses.asdict(obj), depth
             )
-            return str(obj)
 
-        # Prevent infinite recursion
+        # Handle objects with custom serialization method
+        if hasattr(obj_type, "to_json"):
+            return lambda obj, depth: self._serialize_object(obj.to_json(), depth)
+        if hasattr(obj_type, "to_dict"):
+            return lambda obj, depth: self._serialize_object(obj.to_dict(), depth)
+
+        # Handle dictionaries with sensitive data redaction
+        if issubclass(obj_type, dict):
+            return self._serialize_dict
+
+        # Handle iterables (lists, tuples, sets, generators)
+        if issubclass(obj_type, Iterable):
+            return self._serialize_iterable
+
+        return self._serialize_members
+
+    def _serialize_str(self, obj: str, depth: int) -> str:
+        limit = self.max_string_length
+        if limit is not None and len(obj) > limit:
+            return f"{obj[:limit]}...<truncated {len(obj) - limit} chars>"
+        return obj
+
+    def _serialize_model(self, obj: Any, depth: int) -> Any:
+        try:
+            # JSON mode converts nested values natively, leaving only
+            # redaction and the size limits to apply
+            data = obj.model_dump(mode="json")
+        except Exception:
+            # e.g. fields of arbitrary types pydantic can't convert to JSON
+            data = obj.model_dump()
+        return self._serialize_object(data, depth)
+
+    def _serialize_dict(self, obj: Dict[Any, Any], depth: int) -> Any:
+        obj_id = id(obj)
+        if obj_id in self._processed_objects:
+            return f"<circular reference: {type(obj).__name__}>"
+        self._processed_objects.add(obj_id)
+
+        try:
+            items = obj.items()
+            length = len(obj)
+            limit = self.max_collection_length
+            if limit is not None and length > limit:
+                items = islice(items, limit)
+                length = limit
+            # The whole dict is charged up front (inline, as this is the hot
+            # path), so nested containers are what stop once the budget runs out
+            if self.max_nodes is not None and self._nodes >= self.max_nodes:
+                return self._node_limit_marker()
+            self._nodes += length
+
+            result = {}
+            # Dicts dominate payloads, so scalar values and cached key checks
+            # are handled inline rather than through _serialize_object
+            sensitive_keys = None if self._log_secrets else self._sensitive_keys
+            string_limit = self.max_string_length
+            for key, value in items:
+                if type(key) is not str:
+                    key = str(key)
+                if sensitive_keys is not None:
+                    sensitive = sensitive_keys.get(key)
+                    if sensitive is None:
+                        sensitive = self._is_sensitive_key(key)
+                    if sensitive and isinstance(value, str):
+                        result[key] = self._redact_sensitive_value(value)
+                        continue
+
+                value_type = type(value)
+                if value_type is str:
+                    if string_limit is not None and len(value) > string_limit:
+                        value = self._serialize_str(value, depth + 1)
+                    result[key] = value
+                elif (
+                    value is None
+                    or value_type is int
+                    or value_type is float
+                    or value_type is bool
+                ):
+                    result[key] = value
+                else:
+                    result[key] = self._serialize_object(value, depth + 1)
+
+            if limit is not None and len(obj) > limit:
+                result["<truncated>"] = f"{len(obj) - limit} more items"
+            return result
+        finally:
+            self._processed_objects.discard(obj_id)
+
+    def _serialize_iterable(self, obj: Iterable[Any], depth: int) -> Any:
         obj_id = id(obj)
         if obj_id in self._processed_objects:
-            return str(obj)
+            return f"<circular reference: {type(obj).__name__}>"
         self._processed_objects.add(obj_id)
 
-        # Try different serialization strategies in order
         try:
-            if isinstance(obj, httpx.Response):
-                return f"<httpx.Response [{obj.status_code}] {obj.url}>"
-
-            if isinstance(obj, logger.Logger):
-                return "<logging: logger>"
-
-            # Basic JSON-serializable types
-            if isinstance(obj, (str, int, float, bool)):
-                return obj
-
-            # Handle common built-in types
-            if isinstance(obj, (datetime, date)):
-                return obj.isoformat()
-            if isinstance(obj, (Decimal, UUID)):
-                return str(obj)
-            if isinstance(obj, Path):
-                return str(obj)
-            if isinstance(obj, Enum):
-                return obj.value
-
-            # Handle callables
-            if callable(obj):
-                return f"<callable: {obj.__name__}>"
-
-            # Handle Pydantic models
-            if hasattr(obj, "model_dump"):  # Pydantic v2
-                return self._serialize_object(obj.model_dump())
-            if hasattr(obj, "dict"):  # Pydantic v1
-                return self._serialize_object(obj.dict())
-
-            # Handle dataclasses
-            if dataclasses.is_dataclass(obj):
-                return self._serialize_object(dataclasses.asdict(obj))
-
-            # Handle objects with custom serialization method
-            if hasattr(obj, "to_json"):
-                return self._serialize_object(obj.to_json())
-            if hasattr(obj, "to_dict"):
-                return self._serialize_object(obj.to_dict())
-
-            # Handle dictionaries with sensitive data redaction
-            if isinstance(obj, Dict):
-                return {
-                    str(key): self._redact_sensitive_value(value)
-                    if self._is_sensitive_key(key)
-                    else self._serialize_object(value, depth + 1)
-                    for key, value in obj.items()
-                }
-
-            # Handle iterables (lists, tuples, sets)
-            if isinstance(obj, Iterable) and not isinstance(obj, (str, bytes)):
-                return [self._serialize_object(item, depth + 1) for item in obj]
-
-            # Handle objects with __dict__
-            if hasattr(obj, "__dict__"):
+            limit = self.max_collection_length
+            if isinstance(obj, Sized):
+                length = len(obj) if limit is None else min(len(obj), limit)
+                if self._over_node_limit(length):
+                    return self._node_limit_marker()
+            elif self._over_node_limit(0):
+                return self._node_limit_marker()
+
+            iterator = iter(obj)
+            result = [
+                self._serialize_object(item, depth + 1)
+                for item in (iterator if limit is None else islice(iterator, limit))
+            ]
+            if limit is not None and next(iterator, _MISSING) is not _MISSING:
+                more = f"{len(obj) - limit} more" if isinstance(obj, Sized) else "more"
+                result.append(f"<truncated: {more} items>")
+            return result
+        finally:
+            self._processed_objects.discard(obj_id)
+
+    def _serialize_members(self, obj: Any, depth: int) -> Any:
+        # Handle objects with __dict__
+        if hasattr(obj, "__dict__"):
+            obj_id = id(obj)
+            if obj_id in self._processed_objects:
+                return f"<circular reference: {type(obj).__name__}>"
+            self._processed_objects.add(obj_id)
+            try:
                 return self._serialize_object(obj.__dict__, depth + 1)
+            finally:
+                self._processed_objects.discard(obj_id)
 
-            # Handle objects with attributes
-            if inspect.getmembers(obj):
-                return {
-                    name: self._redact_sensitive_value(value)
-                    if self._is_sensitive_key(name)
-                    else self._serialize_object(value, depth + 1)
-                    for name, value in inspect.getmembers(obj)
+        # Handle objects with attributes
+        members = inspect.getmembers(obj)
+        if members:
+            return self._serialize_dict(
+                {
+                    name: value
+                    for name, value in members
                     if not name.startswith("_") and not inspect.ismethod(value)
-                }
-
-            # Fallback: convert to string
-            return str(obj)
+                },
+                depth,
+            )
 
-        except Exception as e:
-            # If all serialization attempts fail, return string representation
-            return f"<unserializable: {type(obj).__name__}, error: {str(e)}>"
+        # Fallback: convert to string
+        return str(obj)
 
     def __call__(self, obj: Any) -> Any:
         """Make the serializer callable."""
@@ -3,14 +3,21 @@ Listeners for the logger module of MCP Agent.
 """
 
 import asyncio
+import gzip
+import json
 import logging
 import time
+import uuid
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Literal
 
 from mcp_agent.logging.events import Event, EventFilter, EventType
 from mcp_agent.logging.event_progress import convert_log_event
+from mcp_agent.logging.json_serializer import JSONSerializer
 
 
 class EventListener(ABC):
@@ -50,14 +57,45 @@ class FilteredListener(LifecycleAwareListener):
         """
         self.filter = event_filter
 
+    @property
+    def filter(self) -> EventFilter | None:
+        return self._filter
+
+    @filter.setter
+    def filter(self, event_filter: EventFilter | None):
+        # Compile once here rather than evaluating the filter's criteria per event.
+        # Reassign the filter after changing it for the change to take effect.
+        self._filter = event_filter
+        self._matches = event_filter.compile() if event_filter else None
+
     async def handle_event(self, event):
-        if not self.filter or self.filter.matches(event):
+        if self._matches is None or self._matches(event):
+            event.resolve_data()
             await self.handle_matched_event(event)
 
+    async def handle_events(self, events: List[Event]):
+        """Process a batch of events from the event bus, filtering it in one pass."""
+        if self._matches is not None:
+            events = [event for event in events if self._matches(event)]
+        if not events:
+            return
+        for event in events:
+            event.resolve_data()
+        await self.handle_matched_events(events)
+
+    def min_event_level(self) -> int | None:
+        """The lowest event level this listener consumes (see AsyncEventBus.is_enabled_for)."""
+        return self.filter.min_level_value if self.filter else logging.DEBUG
+
     async def handle_matched_event(self, event: Event):
         """Process an event that matches the filter."""
         pass
 
+    async def handle_matched_events(self, events: List[Event]):
+        """Process a batch of events that match the filter, one at a time by default."""
+        for event in events:
+            await self.handle_matched_event(event)
+
 
 class LoggingListener(FilteredListener):
     """
@@ -130,6 +168,13 @@ class ProgressListener(LifecycleAwareListener):
         """Stop the progress display."""
         self.display.stop()
 
+    def min_event_level(self) -> int | None:
+        """
+        Progress events at lower levels still reach this listener, since the
+        logger never drops them early (see Logger.event).
+        """
+        return logging.INFO
+
     async def handle_event(self, event: Event):
         """Process an incoming event and display progress if relevant."""
 
@@ -203,6 +248,16 @@ class BatchingListener(FilteredListener):
         if len(self.batch) >= self.batch_size:
             await self.flush()
 
+    async def handle_matched_events(self, events: List[Event]):
+        # Fill the batch up to batch_size at a time, so a flush never holds more
+        start = 0
+        while start < len(events):
+            end = start + max(self.batch_size - len(self.batch), 1)
+            self.batch.extend(events[start:end])
+            start = end
+            if len(self.batch) >= self.batch_size:
+                await self.flush()
+
     async def flush(self):
         """Flush the current batch of events."""
         if not self.batch:
@@ -214,3 +269,340 @@ class BatchingListener(FilteredListener):
 
     async def _process_batch(self, events: List[Event]):
         pass
+
+
+def _event_record(event: Event, serializer: JSONSerializer) -> Dict[str, Any]:
+    """Flatten an event into a row for the batch sinks below."""
+    return {
+        "timestamp": event.timestamp,
+        "level": event.type,
+        "namespace": event.namespace,
+        "name": event.name,
+        "message": event.message,
+        "session_id": event.context.session_id if event.context else None,
+        "workflow_id": event.context.workflow_id if event.context else None,
+        "trace_id": event.trace_id,
+        "span_id": event.span_id,
+        "data": serializer.dumps(event.data) if event.data else None,
+    }
+
+
+class ArchiveListener(BatchingListener):
+    """
+    Archives event batches under `directory`, partitioned by session and hour
+    (`session_id=<id>/hour=<YYYY-MM-DD-HH>/`) so that long-running agent logs
+    can be queried by partition with tools like DuckDB or pyarrow.dataset.
+
+    Batches are written as Parquet row groups if pyarrow is installed, and as
+    gzipped JSONL otherwise (or if `format` is "jsonl"). A Parquet file can only
+    be read once it is closed, so each partition is written as a series of
+    `part-*.parquet` files: a part is closed once it is `max_part_age` seconds
+    old, holds `max_part_rows` rows, or its hour is over, and the next batch
+    starts a new one. At most `max_open_partitions` Parquet writers are kept
+    open; each flush holds at most `batch_size` events in memory.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        event_filter: EventFilter | None = None,
+        batch_size: int = 1000,
+        flush_interval: float = 5.0,
+        format: Literal["parquet", "jsonl"] = "parquet",
+        compression: str | None = "zstd",
+        max_open_partitions: int = 4,
+        max_part_age: float = 300.0,
+        max_part_rows: int = 100_000,
+    ):
+        """
+        Initialize the listener.
+        Args:
+            directory: Root directory of the archive.
+            batch_size: Number of events to accumulate before writing.
+            flush_interval: Time in seconds to wait before writing a partial batch.
+            format: "parquet" (requires pyarrow, falls back to "jsonl") or "jsonl".
+            compression: Parquet codec (e.g. "zstd", "snappy", "gzip"). JSONL is
+                gzipped unless this is None.
+            max_open_partitions: Maximum number of Parquet files kept open for writing.
+            max_part_age: Seconds after which an open Parquet part file is closed,
+                bounding how long archived events stay unreadable.
+            max_part_rows: Rows after which an open Parquet part file is closed.
+        """
+        super().__init__(
+            event_filter=event_filter,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+        )
+        self.directory = Path(directory)
+        self.compression = compression
+        self.max_open_partitions = max_open_partitions
+        self.max_part_age = max_part_age
+        self.max_part_rows = max_part_rows
+        self._serializer = JSONSerializer()
+        # Open Parquet parts, least recently used first
+        self._writers: "OrderedDict[Path, _ParquetPart]" = OrderedDict()
+        self._schema = None
+        # Batches and part closing run in worker threads, one at a time
+        self._write_lock = asyncio.Lock()
+
+        if format == "parquet":
+            try:
+                import pyarrow  # noqa: F401
+            except ModuleNotFoundError:
+                print(
+                    "pyarrow is not installed; archiving logs as JSONL instead of Parquet. "
+                    "Install pyarrow to enable Parquet archives."
+                )
+                format = "jsonl"
+        self.format = format
+
+    def _partition(self, record: Dict[str, Any]) -> Path:
+        session_id = record["session_id"] or "unknown"
+        hour = record["timestamp"].strftime("%Y-%m-%d-%H")
+        return self.directory / f"session_id={session_id}" / f"hour={hour}"
+
+    async def flush(self):
+        """Write the current batch, then close Parquet parts that are due."""
+        await super().flush()
+        # Runs on every periodic flush, so idle partitions are closed too
+        if self._writers:
+            async with self._write_lock:
+                await asyncio.to_thread(self._close_finished_parts)
+
+    async def _process_batch(self, events: List[Event]):
+        partitions: Dict[Path, List[Dict[str, Any]]] = {}
+        for event in events:
+            record = _event_record(event, self._serializer)
+            partitions.setdefault(self._partition(record), []).append(record)
+
+        async with self._write_lock:
+            await asyncio.to_thread(self._write_partitions, partitions)
+
+    def _write_partitions(self, partitions: Dict[Path, List[Dict[str, Any]]]):
+        for partition, records in partitions.items():
+            try:
+                partition.mkdir(parents=True, exist_ok=True)
+                if self.format == "parquet":
+                    self._write_parquet(partition, records)
+                else:
+                    self._write_jsonl(partition, records)
+            except Exception as e:
+                print(f"Error archiving {len(records)} events to {partition}: {e}")
+
+    def _write_jsonl(self, partition: Path, records: List[Dict[str, Any]]):
+        lines = "".join(
+            json.dumps(
+                {**record, "timestamp": record["timestamp"].isoformat()},
+                separators=(",", ":"),
+            )
+            + "\n"
+            for record in records
+        )
+        if self.compression:
+            # Each batch is appended as its own gzip member; readers see one stream
+            with gzip.open(partition / "events.jsonl.gz", "at", encoding="utf-8") as f:
+                f.write(lines)
+        else:
+            with open(partition / "events.jsonl", "a", encoding="utf-8") as f:
+                f.write(lines)
+
+    def _write_parquet(self, partition: Path, records: List[Dict[str, Any]]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._schema is None:
+            self._schema = pa.schema(
+                [
+                    ("timestamp", pa.timestamp("us")),
+                    ("level", pa.string()),
+                    ("namespace", pa.string()),
+                    ("name", pa.string()),
+                    ("message", pa.string()),
+                    ("session_id", pa.string()),
+                    ("workflow_id", pa.string()),
+                    ("trace_id", pa.string()),
+                    ("span_id", pa.string()),
+                    ("data", pa.string()),
+                ]
+            )
+
+        part = self._writers.get(partition)
+        if part is None:
+            # A Parquet file is only readable once closed, so every writer gets its own part file
+            path = partition / f"part-{uuid.uuid4().hex[:12]}.parquet"
+            part = _ParquetPart(
+                pq.ParquetWriter(
+                    path, self._schema, compression=self.compression or "none"
+                )
+            )
+            self._writers[partition] = part
+            while len(self._writers) > self.max_open_partitions:
+                _, oldest = self._writers.popitem(last=False)
+                oldest.writer.close()
+        else:
+            self._writers.move_to_end(partition)
+
+        part.writer.write_table(pa.Table.from_pylist(records, schema=self._schema))
+        part.rows += len(records)
+
+    def _close_finished_parts(self):
+        """Close parts that are old or large enough, or whose hour is over."""
+        now = time.monotonic()
+        current_hour = f"hour={datetime.now().strftime('%Y-%m-%d-%H')}"
+        for partition, part in list(self._writers.items()):
+            if (
+                now - part.opened >= self.max_part_age
+                or part.rows >= self.max_part_rows
+                or partition.name != current_hour
+            ):
+                self._close_part(partition)
+
+    def _close_part(self, partition: Path):
+        part = self._writers.pop(partition)
+        try:
+            part.writer.close()
+        except Exception as e:
+            print(f"Error closing Parquet archive: {e}")
+
+    def _close_writers(self):
+        for partition in list(self._writers):
+            self._close_part(partition)
+
+    async def stop(self):
+        """Write any remaining events and close open Parquet files."""
+        await super().stop()
+        async with self._write_lock:
+            await asyncio.to_thread(self._close_writers)
+
+
+class _ParquetPart:
+    """An open Parquet part file of an ArchiveListener partition."""
+
+    def __init__(self, writer: Any):
+        self.writer = writer
+        self.opened = time.monotonic()
+        self.rows = 0
+
+
+class OTLPLogListener(BatchingListener):
+    """
+    Exports event batches as OpenTelemetry log records over OTLP/HTTP.
+
+    Records are handed to the SDK's BatchLogRecordProcessor, which holds at most
+    `max_queue_size` records (dropping the excess if the collector falls behind)
+    and exports them in gzip-compressed requests.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        event_filter: EventFilter | None = None,
+        batch_size: int = 512,
+        flush_interval: float = 5.0,
+        service_name: str = "mcp-agent",
+        resource_attributes: Dict[str, Any] | None = None,
+        headers: Dict[str, str] | None = None,
+        compression: Literal["gzip", "deflate", "none"] = "gzip",
+        max_queue_size: int = 2048,
+    ):
+        """
+        Initialize the listener.
+        Args:
+            endpoint: OTLP/HTTP logs endpoint, e.g. "http://localhost:4318/v1/logs".
+            batch_size: Number of events to accumulate before handing them to the exporter.
+            flush_interval: Time in seconds to wait before exporting a partial batch.
+            service_name: The service.name resource attribute.
+            resource_attributes: Additional resource attributes.
+            headers: HTTP headers to send with every export request.
+            compression: Request body compression.
+            max_queue_size: Maximum number of records buffered for export.
+        """
+        super().__init__(
+            event_filter=event_filter,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+        )
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.resource_attributes = resource_attributes or {}
+        self.headers = headers
+        self.compression = compression
+        self.max_queue_size = max_queue_size
+        self._serializer = JSONSerializer()
+        self._provider = None
+        self._otel_logger = None
+
+    async def start(self, loop=None):
+        # pylint: disable=import-outside-toplevel (only import the OTLP exporter if used)
+        from opentelemetry.exporter.otlp.proto.http import Compression
+        from opentelemetry.exporter.otlp.proto.http._log_exporter import (
+            OTLPLogExporter,
+        )
+        from opentelemetry.sdk._logs import LoggerProvider
+        from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+        from opentelemetry.sdk.resources import Resource
+
+        exporter = OTLPLogExporter(
+            endpoint=self.endpoint,
+            headers=self.headers,
+            compression=Compression(self.compression),
+        )
+        self._provider = LoggerProvider(
+            resource=Resource.create(
+                {"service.name": self.service_name, **self.resource_attributes}
+            )
+        )
+        self._provider.add_log_record_processor(
+            BatchLogRecordProcessor(
+                exporter,
+                max_queue_size=self.max_queue_size,
+                max_export_batch_size=min(self.batch_size, self.max_queue_size),
+            )
+        )
+        self._otel_logger = self._provider.get_logger("mcp_agent")
+        await super().start(loop=loop)
+
+    async def _process_batch(self, events: List[Event]):
+        if self._otel_logger is None:
+            return
+
+        from opentelemetry._logs import LogRecord, SeverityNumber
+
+        severity_map: Dict[EventType, SeverityNumber] = {
+            "debug": SeverityNumber.DEBUG,
+            "info": SeverityNumber.INFO,
+            "warning": SeverityNumber.WARN,
+            "error": SeverityNumber.ERROR,
+            "progress": SeverityNumber.INFO,
+        }
+
+        for event in events:
+            record = _event_record(event, self._serializer)
+            attributes = {
+                "mcp_agent.namespace": record["namespace"],
+                "mcp_agent.session_id": record["session_id"],
+                "mcp_agent.workflow_id": record["workflow_id"],
+                "mcp_agent.event_name": record["name"],
+                "mcp_agent.data": record["data"],
+            }
+            self._otel_logger.emit(
+                LogRecord(
+                    timestamp=int(event.timestamp.timestamp() * 1e9),
+                    trace_id=int(event.trace_id, 16) if event.trace_id else None,
+                    span_id=int(event.span_id, 16) if event.span_id else None,
+                    severity_text=event.type.upper(),
+                    severity_number=severity_map.get(
+                        event.type, SeverityNumber.UNSPECIFIED
+                    ),
+                    body=event.message,
+                    attributes={k: v for k, v in attributes.items() if v is not None},
+                )
+            )
+
+    async def stop(self):
+        """Export any remaining events and shut down the exporter."""
+        await super().stop()
+        if self._provider is not None:
+            provider, self._provider = self._provider, None
+            self._otel_logger = None
+            await asyncio.to_thread(provider.shutdown)
@@ -24,11 +24,19 @@ from mcp_agent.logging.listeners import (
 from mcp_agent.logging.transport import AsyncEventBus, EventTransport
 
 
+def _is_progress_data(data: dict) -> bool:
+    """Whether event data carries a progress update (see convert_log_event)."""
+    event_data = data.get("data")
+    return isinstance(event_data, dict) and "progress_action" in event_data
+
+
 class Logger:
     """
     Developer-friendly logger that sends events to the AsyncEventBus.
     - `type` is a broad category (INFO, ERROR, etc.).
     - `name` can be a custom domain-specific event name, e.g. "ORDER_PLACED".
+    - `data` values wrapped in `lazy` (e.g. `data=lazy(request.model_dump)`) are
+      only evaluated if the event is consumed.
     """
 
     def __init__(self, namespace: str, session_id: str | None = None):
@@ -36,6 +44,13 @@ class Logger:
         self.session_id = session_id
         self.event_bus = AsyncEventBus.get()
 
+    def is_enabled_for(self, level: EventType) -> bool:
+        """
+        Whether events at this level are consumed by any transport or listener.
+        Use it to guard log calls whose message is expensive to format.
+        """
+        return self.event_bus.is_enabled_for(level)
+
     def _ensure_event_loop(self):
         """Ensure we have an event loop we can use."""
         try:
@@ -57,8 +72,8 @@ class Logger:
             is_running = False
 
         if is_running:
-            # If we're in a thread with a running loop, schedule the coroutine
-            asyncio.create_task(self.event_bus.emit(event))
+            # Enqueue synchronously; the bus's consumer task processes it in a batch
+            self.event_bus.emit_nowait(event)
         else:
             # If no loop is running, run it until the emit completes
             try:
@@ -83,6 +98,11 @@ class Logger:
         data: dict,
     ):
         """Create and emit an event."""
+        # Drop events nothing would consume before paying to build them. Progress
+        # events are rare and may be shown whatever their level, so always keep them
+        if not self.event_bus.is_enabled_for(etype) and not _is_progress_data(data):
+            return
+
         # Only create or modify context with session_id if we have one
         if self.session_id:
             # If no context was provided, create one with our session_id
@@ -237,6 +257,10 @@ class LoggingConfig:
             return
 
         bus = AsyncEventBus.get(transport=transport)
+        if "max_queue_size" in kwargs:
+            bus.max_queue_size = kwargs["max_queue_size"]
+        if "queue_overflow_policy" in kwargs:
+            bus.overflow_policy = kwargs["queue_overflow_policy"]
 
         # Add standard listeners
         if "logging" not in bus.listeners:
@@ -246,6 +270,10 @@ class LoggingConfig:
         if "progress" not in bus.listeners and kwargs.get("progress_display", True):
             bus.add_listener("progress", ProgressListener())
 
+        for name, listener in kwargs.get("listeners", {}).items():
+            if name not in bus.listeners:
+                bus.add_listener(name, listener)
+
         if "batching" not in bus.listeners:
             bus.add_listener(
                 "batching",
@@ -268,6 +296,15 @@ class LoggingConfig:
         await bus.stop()
         cls._initialized = False
 
+    @classmethod
+    async def flush(cls):
+        """Flush events buffered by the transport (e.g. BufferedFileTransport) to their destination."""
+        if not cls._initialized:
+            return
+        flush = getattr(AsyncEventBus.get().transport, "flush", None)
+        if flush is not None:
+            await flush()
+
     @classmethod
     @asynccontextmanager
     async def managed(cls, **config_kwargs):
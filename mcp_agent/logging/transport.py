@@ -5,11 +5,16 @@ Transports for the Logger module for MCP Agent, including:
 """
 
 import asyncio
-import json
+import atexit
+import logging
+import os
+import threading
+import time
 import uuid
 import datetime
 from abc import ABC, abstractmethod
-from typing import Dict, List, Protocol
+from collections import deque
+from typing import Deque, Dict, List, Literal, Protocol, TextIO
 from pathlib import Path
 
 import aiohttp
@@ -19,13 +24,23 @@ from rich.text import Text
 
 from mcp_agent.config import LoggerSettings
 from mcp_agent.console import console
-from mcp_agent.logging.events import Event, EventFilter
+from mcp_agent.logging.events import Event, EventFilter, EventType, event_level
 from mcp_agent.logging.json_serializer import JSONSerializer
 from mcp_agent.logging.listeners import EventListener, LifecycleAwareListener
+from mcp_agent.utils.common import rotate_file
 from rich import print
 import traceback
 
 
+def _min_event_level(component: "EventTransport | EventListener") -> int | None:
+    """
+    The lowest event level a transport or listener consumes, or None if it
+    consumes nothing. Components that don't say are assumed to want everything.
+    """
+    min_event_level = getattr(component, "min_event_level", None)
+    return min_event_level() if min_event_level else logging.DEBUG
+
+
 class EventTransport(Protocol):
     """
     Pluggable interface for sending events to a remote or external system
@@ -49,10 +64,44 @@ class FilteredEventTransport(EventTransport, ABC):
     def __init__(self, event_filter: EventFilter | None = None):
         self.filter = event_filter
 
+    @property
+    def filter(self) -> EventFilter | None:
+        return self._filter
+
+    @filter.setter
+    def filter(self, event_filter: EventFilter | None):
+        # Compile once here rather than evaluating the filter's criteria per event.
+        # Reassign the filter after changing it for the change to take effect.
+        self._filter = event_filter
+        self._matches = event_filter.compile() if event_filter else None
+
     async def send_event(self, event: Event):
-        if not self.filter or self.filter.matches(event):
+        if self._matches is None or self._matches(event):
+            event.resolve_data()
             await self.send_matched_event(event)
 
+    async def send_events(self, events: List[Event]):
+        """Send the events in a batch that pass the filter."""
+        if self._matches is not None:
+            events = [event for event in events if self._matches(event)]
+        if not events:
+            return
+        for event in events:
+            event.resolve_data()
+        await self.send_matched_events(events)
+
+    async def send_matched_events(self, events: List[Event]):
+        """Send a batch of matched events. Defaults to sending them one by one."""
+        for event in events:
+            await self.send_matched_event(event)
+
+    def min_event_level(self) -> int | None:
+        """
+        The lowest event level this transport sends, or None if it sends nothing.
+        Used by AsyncEventBus to drop events before they are built.
+        """
+        return self.filter.min_level_value if self.filter else logging.DEBUG
+
     @abstractmethod
     async def send_matched_event(self, event: Event):
         """Send an event to the external system."""
@@ -65,6 +114,13 @@ class NoOpTransport(FilteredEventTransport):
         """Do nothing."""
         pass
 
+    async def send_events(self, events):
+        """Do nothing."""
+        pass
+
+    def min_event_level(self) -> int | None:
+        return None
+
 
 class ConsoleTransport(FilteredEventTransport):
     """Simple transport that prints events to console."""
@@ -134,32 +190,50 @@ class FileTransport(FilteredEventTransport):
         # Create directory if it doesn't exist
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
+    def _format_event(self, event: Event) -> str:
+        """Format an event as a single JSONL line."""
+        return self._format_entry(_log_entry(event))
+
+    def _format_entry(self, entry: tuple) -> str:
+        """Format a snapshot taken by _log_entry as a single JSONL line."""
+        event_type, timestamp, namespace, message, data = entry
+        log_entry = {
+            "level": event_type.upper(),
+            "timestamp": timestamp.isoformat(),
+            "namespace": namespace,
+            "message": message,
+        }
+
+        # Add event data if present
+        if data:
+            log_entry["data"] = data
+
+        # Write the log entry as compact JSON (JSONL format)
+        return self._serializer.dumps(log_entry) + "\n"
+
     async def send_matched_event(self, event: Event) -> None:
         """Write matched event to log file asynchronously.
 
         Args:
             event: Event to write to file
         """
-        # Format the log entry
-        namespace = event.namespace
-        if event.name:
-            namespace = f"{namespace}.{event.name}"
+        line = self._format_event(event)
 
-        log_entry = {
-            "level": event.type.upper(),
-            "timestamp": event.timestamp.isoformat(),
-            "namespace": namespace,
-            "message": event.message,
-        }
+        try:
+            with open(self.filepath, mode=self.mode, encoding=self.encoding) as f:
+                f.write(line)
+                f.flush()  # Ensure writing to disk
+        except IOError as e:
+            # Log error without recursion
+            print(f"Error writing to log file {self.filepath}: {e}")
 
-        # Add event data if present
-        if event.data:
-            log_entry["data"] = self._serializer(event.data)
+    async def send_matched_events(self, events: List[Event]) -> None:
+        """Write a batch of matched events with a single open/flush."""
+        lines = "".join(self._format_event(event) for event in events)
 
         try:
             with open(self.filepath, mode=self.mode, encoding=self.encoding) as f:
-                # Write the log entry as compact JSON (JSONL format)
-                f.write(json.dumps(log_entry, separators=(",", ":")) + "\n")
+                f.write(lines)
                 f.flush()  # Ensure writing to disk
         except IOError as e:
             # Log error without recursion
@@ -175,6 +249,205 @@ class FileTransport(FilteredEventTransport):
         return False  # Since we open/close per write
 
 
+def _log_entry(event: Event) -> tuple:
+    """
+    Snapshot the parts of an event that are written to a log file. Only the
+    top level of the event data is copied, so this is cheap to take on the loop.
+    """
+    namespace = event.namespace
+    if event.name:
+        namespace = f"{namespace}.{event.name}"
+    data = dict(event.data) if event.data else None
+    return (event.type, event.timestamp, namespace, event.message, data)
+
+
+class BufferedFileTransport(FileTransport):
+    """
+    FileTransport that keeps the log file open and appends events to an in-memory
+    buffer, which a dedicated writer thread serializes and flushes to disk when
+    it grows past `flush_size` bytes or every `flush_interval` seconds.
+
+    The file is rotated once it exceeds `max_bytes` or has been open for
+    `rotate_interval` seconds. Rotated segments are gzipped unless `compress` is False.
+    """
+
+    def __init__(
+        self,
+        filepath: str | Path,
+        event_filter: EventFilter | None = None,
+        mode: str = "a",
+        encoding: str = "utf-8",
+        flush_size: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        max_bytes: int | None = None,
+        rotate_interval: float | None = None,
+        compress: bool = True,
+    ):
+        """Initialize BufferedFileTransport.
+
+        Args:
+            filepath: Path to the log file. If relative, the current working directory will be used
+            event_filter: Optional filter for events
+            mode: File open mode ('a' for append, 'w' for write) for the first segment
+            encoding: File encoding to use
+            flush_size: Buffered bytes that trigger a flush
+            flush_interval: Maximum seconds between flushes
+            max_bytes: Rotate the file once it grows past this size. None disables size-based rotation
+            rotate_interval: Rotate the file after this many seconds. None disables time-based rotation
+            compress: Whether to gzip rotated segments
+        """
+        super().__init__(
+            filepath=filepath, event_filter=event_filter, mode=mode, encoding=encoding
+        )
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.compress = compress
+
+        # Snapshots of events (see _log_entry), serialized by the writer thread
+        self._buffer: List[tuple] = []
+        self._buffered_bytes = 0
+        # Average serialized size of an event, to estimate the buffered bytes
+        self._entry_size = 256.0
+        self._lock = threading.Lock()
+        # Serializes file I/O between the writer thread and explicit flushes
+        self._io_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        self._file: TextIO | None = None
+        self._opened_at = 0.0
+
+    async def send_matched_event(self, event: Event) -> None:
+        """Append the matched event to the write buffer.
+
+        Args:
+            event: Event to write to file
+        """
+        self._append_entries([_log_entry(event)])
+
+    async def send_matched_events(self, events: List[Event]) -> None:
+        """Append a batch of matched events to the write buffer."""
+        self._append_entries([_log_entry(event) for event in events])
+
+    def _append_entries(self, entries: List[tuple]):
+        size = len(entries) * self._entry_size
+        with self._lock:
+            if self._thread is None:
+                self._start_writer()
+            self._buffer.extend(entries)
+            # Only wake the writer when the buffer first crosses the threshold
+            should_flush = (
+                self._buffered_bytes < self.flush_size
+                and self._buffered_bytes + size >= self.flush_size
+            )
+            self._buffered_bytes += size
+
+        if should_flush:
+            self._wakeup.set()
+
+    def _start_writer(self):
+        self._thread = threading.Thread(
+            target=self._run_writer, name="mcp-agent-log-writer", daemon=True
+        )
+        self._thread.start()
+        # Flush whatever is buffered if the process exits without stop()
+        atexit.register(self._stop_writer)
+
+    def _run_writer(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            stopping = self._stopping
+            self._flush()
+            if stopping:
+                break
+
+    def _flush(self, durable: bool = False):
+        with self._io_lock:
+            self._write_buffer(durable=durable)
+
+    def _write_buffer(self, durable: bool):
+        with self._lock:
+            entries, self._buffer = self._buffer, []
+            self._buffered_bytes = 0
+
+        try:
+            if entries:
+                lines = "".join(self._format_entry(entry) for entry in entries)
+                self._entry_size = len(lines) / len(entries)
+                if self._file is None:
+                    self._open()
+                self._file.write(lines)
+                self._file.flush()
+
+            if self._file is not None:
+                if durable:
+                    os.fsync(self._file.fileno())
+                if self._should_rotate():
+                    self._rotate()
+        except (IOError, OSError) as e:
+            # Log error without recursion
+            print(f"Error writing to log file {self.filepath}: {e}")
+
+    def _open(self):
+        self._file = open(self.filepath, mode=self.mode, encoding=self.encoding)
+        self._opened_at = time.monotonic()
+        # Later segments always start from an empty file
+        self.mode = "a"
+
+    def _should_rotate(self) -> bool:
+        if self.max_bytes is not None and self._file.tell() >= self.max_bytes:
+            return True
+        return (
+            self.rotate_interval is not None
+            and time.monotonic() - self._opened_at >= self.rotate_interval
+        )
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        rotate_file(self.filepath, compress=self.compress)
+
+    def _stop_writer(self):
+        with self._lock:
+            thread = self._thread
+            if thread is None or self._stopping:
+                return
+            self._stopping = True
+
+        atexit.unregister(self._stop_writer)
+        self._wakeup.set()
+        thread.join()
+
+        # Pick up anything emitted while the writer was shutting down
+        self._flush(durable=True)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        with self._lock:
+            self._thread = None
+            self._stopping = False
+
+    async def flush(self) -> None:
+        """Write buffered events to disk without stopping the writer thread."""
+        await asyncio.to_thread(self._flush, True)
+
+    async def stop(self) -> None:
+        """Flush buffered events to disk and stop the writer thread."""
+        await asyncio.to_thread(self._stop_writer)
+
+    async def close(self) -> None:
+        await self.stop()
+
+    @property
+    def is_closed(self) -> bool:
+        """Check if transport is closed."""
+        return self._thread is None
+
+
 class HTTPTransport(FilteredEventTransport):
     """
     Sends events to an HTTP endpoint in batches.
@@ -222,6 +495,14 @@ class HTTPTransport(FilteredEventTransport):
             if len(self.batch) >= self.batch_size:
                 await self._flush()
 
+    async def send_matched_events(self, events: List[Event]):
+        """Add a batch of events, flushing whenever the batch is full."""
+        async with self.lock:
+            for event in events:
+                self.batch.append(event)
+                if len(self.batch) >= self.batch_size:
+                    await self._flush()
+
     async def _flush(self):
         """Send batch of events to HTTP endpoint."""
         if not self.batch:
@@ -231,23 +512,29 @@ class HTTPTransport(FilteredEventTransport):
             await self.start()
 
         try:
-            # Convert events to JSON-serializable dicts
-            events_data = [
-                {
-                    "timestamp": event.timestamp.isoformat(),
-                    "type": event.type,
-                    "name": event.name,
-                    "namespace": event.namespace,
-                    "message": event.message,
-                    "data": self._serializer(event.data),
-                    "trace_id": event.trace_id,
-                    "span_id": event.span_id,
-                    "context": event.context.dict() if event.context else None,
-                }
-                for event in self.batch
-            ]
-
-            async with self._session.post(self.endpoint, json=events_data) as response:
+            # Serialize and encode the whole batch in one pass
+            body = self._serializer.dumps_bytes(
+                [
+                    {
+                        "timestamp": event.timestamp.isoformat(),
+                        "type": event.type,
+                        "name": event.name,
+                        "namespace": event.namespace,
+                        "message": event.message,
+                        "data": event.data,
+                        "trace_id": event.trace_id,
+                        "span_id": event.span_id,
+                        "context": event.context.dict() if event.context else None,
+                    }
+                    for event in self.batch
+                ]
+            )
+
+            async with self._session.post(
+                self.endpoint,
+                data=body,
+                headers={"Content-Type": "application/json"},
+            ) as response:
                 if response.status >= 400:
                     text = await response.text()
                     print(
@@ -264,27 +551,107 @@ class AsyncEventBus:
     """
     Async event bus with local in-process listeners + optional remote transport.
     Also injects distributed tracing (trace_id, span_id) if there's a current span.
+
+    Producers enqueue events synchronously into a bounded ring buffer. A single
+    consumer task drains it in batches and hands each batch to the transport and
+    every listener. When the buffer is full, the overflow policy either drops the
+    new event ("drop") or makes the producer wait for room ("block"). Producers
+    that can't wait (see emit_nowait) may overfill the buffer under "block": their
+    warning and error events are always kept, while debug and info events are
+    dropped past twice max_queue_size. Dropped events are counted in
+    dropped_events and reported by a warning event once the consumer catches up.
     """
 
     _instance = None
 
-    def __init__(self, transport: EventTransport | None = None):
-        self.transport: EventTransport = transport or NoOpTransport()
+    def __init__(
+        self,
+        transport: EventTransport | None = None,
+        max_queue_size: int = 2048,
+        overflow_policy: Literal["drop", "block"] = "block",
+        max_batch_size: int = 256,
+    ):
         self.listeners: Dict[str, EventListener] = {}
+        self._min_level: int | None = None
+        self.transport = transport or NoOpTransport()
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.max_batch_size = max_batch_size
+
+        self._buffer: Deque[Event] = deque()
         self._task: asyncio.Task | None = None
         self._running = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._has_events: asyncio.Event | None = None
+        # Producers awaiting room in the buffer under the "block" policy
+        self._room_waiters: Deque[asyncio.Future] = deque()
+
+        # Counters
+        self.emitted_events = 0
+        self.processed_events = 0
+        self.dropped_events = 0
+        self.max_queue_depth = 0
+        # Drops already reported through a warning event
+        self._reported_drops = 0
+
+    @property
+    def transport(self) -> EventTransport:
+        return self._transport
+
+    @transport.setter
+    def transport(self, transport: EventTransport):
+        self._transport = transport
+        self.update_min_level()
+
+    def update_min_level(self):
+        """
+        Recompute the lowest event level that the transport or any listener consumes.
+        Call this after changing the filter of a registered transport or listener.
+        """
+        levels = [
+            level
+            for level in (
+                _min_event_level(component)
+                for component in (self._transport, *self.listeners.values())
+            )
+            if level is not None
+        ]
+        self._min_level = min(levels, default=None)
+
+    def is_enabled_for(self, event_type: EventType) -> bool:
+        """Whether an event of this type would be consumed by the transport or any listener."""
+        return (
+            self._min_level is not None and event_level(event_type) >= self._min_level
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting to be processed."""
+        return len(self._buffer)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the bus counters."""
+        return {
+            "emitted_events": self.emitted_events,
+            "processed_events": self.processed_events,
+            "dropped_events": self.dropped_events,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+        }
 
     def init_queue(self):
         if self._running:
             return
-        self._queue = asyncio.Queue()
-        self._stop_event = asyncio.Event()
+        self._has_events = asyncio.Event()
         # Store the loop we're created on
         try:
             self._loop = asyncio.get_running_loop()
         except RuntimeError:
             self._loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self._loop)
+        self._loop_thread_id = threading.get_ident()
 
     @classmethod
     def get(cls, transport: EventTransport | None = None) -> "AsyncEventBus":
@@ -306,7 +673,8 @@ class AsyncEventBus:
         if cls._instance:
             # Signal shutdown
             cls._instance._running = False
-            cls._instance._stop_event.set()
+            if cls._instance._has_events is not None:
+                cls._instance._has_events.set()
 
             # Clear the singleton instance
             cls._instance = None
@@ -321,48 +689,37 @@ class AsyncEventBus:
             if isinstance(listener, LifecycleAwareListener):
                 await listener.start()
 
-        # Clear stop event and start processing
-        self._stop_event.clear()
         self._running = True
         self._task = asyncio.create_task(self._process_events())
+        if self._buffer:
+            # Process events emitted before the bus was started
+            self._has_events.set()
 
     async def stop(self):
         """Stop the event bus and all lifecycle-aware listeners."""
         if not self._running:
             return
 
-        # Signal processing to stop
+        # Signal the consumer to drain what's left and exit
         self._running = False
-        self._stop_event.set()
-
-        # Try to process remaining items with a timeout
-        if not self._queue.empty():
-            try:
-                # Give some time for remaining items to be processed
-                await asyncio.wait_for(self._queue.join(), timeout=5.0)
-            except asyncio.TimeoutError:
-                # If we timeout, drain the queue to prevent deadlock
-                while not self._queue.empty():
-                    try:
-                        self._queue.get_nowait()
-                        self._queue.task_done()
-                    except asyncio.QueueEmpty:
-                        break
-            except Exception as e:
-                print(f"Error during queue cleanup: {e}")
+        self._has_events.set()
 
-        # Cancel and wait for task with timeout
         if self._task and not self._task.done():
-            self._task.cancel()
             try:
-                # Wait for task to complete with timeout
                 await asyncio.wait_for(self._task, timeout=5.0)
-            except (asyncio.CancelledError, asyncio.TimeoutError):
-                pass  # Task was cancelled or timed out
+            except asyncio.TimeoutError:
+                print(
+                    f"Timeout draining event bus, dropping {len(self._buffer)} events"
+                )
+                self.dropped_events += len(self._buffer)
+                self._buffer.clear()
+            except asyncio.CancelledError:
+                pass
             except Exception as e:
-                print(f"Error cancelling process task: {e}")
-            finally:
-                self._task = None
+                print(f"Error stopping event processing task: {e}")
+        self._task = None
+        # Release any producers still waiting for room
+        self._wake_room_waiters(len(self._room_waiters))
 
         # Stop each lifecycle-aware listener
         for listener in self.listeners.values():
@@ -374,92 +731,220 @@ class AsyncEventBus:
                 except Exception as e:
                     print(f"Error stopping listener: {e}")
 
-    async def emit(self, event: Event):
-        """Emit an event to all listeners and transport."""
-        # Inject current tracing info if available
+        # Flush transports that buffer events (e.g. BufferedFileTransport)
+        stop_transport = getattr(self.transport, "stop", None)
+        if stop_transport is not None:
+            try:
+                await stop_transport()
+            except Exception as e:
+                print(f"Error stopping transport: {e}")
+
+    def _inject_trace_context(self, event: Event):
         span = trace.get_current_span()
         if span.is_recording():
             ctx = span.get_span_context()
             event.trace_id = f"{ctx.trace_id:032x}"
             event.span_id = f"{ctx.span_id:016x}"
 
-        # Forward to transport first (immediate processing)
+    def emit_nowait(self, event: Event):
+        """
+        Enqueue an event for the transport and listeners without awaiting.
+        Safe to call from any thread.
+
+        If the buffer is full, the "drop" policy discards the event. The "block"
+        policy makes producers on other threads wait for room; a producer on the
+        bus's own loop can't wait without starving the consumer, so its event is
+        queued past the limit instead. Past twice the limit, only its warning and
+        error events are still queued.
+        """
+        self._inject_trace_context(event)
+
+        if (
+            self._running
+            and self._loop_thread_id is not None
+            and threading.get_ident() != self._loop_thread_id
+            and not self._loop.is_closed()
+        ):
+            # Only the bus's own loop touches the buffer
+            if (
+                self.overflow_policy == "block"
+                and len(self._buffer) >= self.max_queue_size
+            ):
+                asyncio.run_coroutine_threadsafe(
+                    self._enqueue_when_room(event), self._loop
+                ).result()
+            else:
+                self._loop.call_soon_threadsafe(self._enqueue, event)
+            return
+
+        if self._running and self._task is not None and self._task.done():
+            self._restart()
+        self._enqueue(event)
+
+    def _restart(self):
+        """
+        The consumer task dies with the loop it was started on (e.g. between
+        asyncio.run calls). Restart the bus on the current loop, if there is one.
+        """
         try:
-            await self.transport.send_event(event)
-        except Exception as e:
-            print(f"Error in transport.send_event: {e}")
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._running = False
+        self._task = None
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        loop.create_task(self.start())
+
+    def _enqueue(self, event: Event):
+        limit = self.max_queue_size
+        if self.overflow_policy == "block":
+            # Producers that can't wait overfill the buffer, but never lose
+            # warnings or errors, and only so many debug and info events
+            if event_level(event.type) >= logging.WARNING:
+                self._append(event)
+                return
+            limit *= 2
+        if len(self._buffer) >= limit:
+            self.dropped_events += 1
+            return
 
-        # Then queue for listeners
-        await self._queue.put(event)
+        self._append(event)
+
+    async def _enqueue_when_room(self, event: Event):
+        while self._running and len(self._buffer) >= self.max_queue_size:
+            waiter = self._loop.create_future()
+            self._room_waiters.append(waiter)
+            await waiter
+        self._append(event)
+
+    def _wake_room_waiters(self, count: int):
+        while count > 0 and self._room_waiters:
+            waiter = self._room_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                count -= 1
+
+    def _append(self, event: Event):
+        self._buffer.append(event)
+        self.emitted_events += 1
+        depth = len(self._buffer)
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+        if self._has_events is not None and not self._has_events.is_set():
+            self._has_events.set()
+
+    async def emit(self, event: Event):
+        """Emit an event to all listeners and transport."""
+        self._inject_trace_context(event)
+
+        if (
+            self.overflow_policy == "block"
+            and self._running
+            and len(self._buffer) >= self.max_queue_size
+            and threading.get_ident() == self._loop_thread_id
+        ):
+            await self._enqueue_when_room(event)
+        else:
+            self._enqueue(event)
 
     def add_listener(self, name: str, listener: EventListener):
         """Add a listener to the event bus."""
         self.listeners[name] = listener
+        self.update_min_level()
 
     def remove_listener(self, name: str):
         """Remove a listener from the event bus."""
         self.listeners.pop(name, None)
+        self.update_min_level()
 
-    async def _process_events(self):
-        """Process events from the queue until stopped."""
-        while self._running:
-            event = None
-            try:
-                # Use wait_for with a timeout to allow checking running state
-                try:
-                    # Check if we should be stopping first
-                    if not self._running or self._stop_event.is_set():
-                        break
+    def _next_batch(self) -> List[Event]:
+        batch_size = min(len(self._buffer), self.max_batch_size)
+        batch = [self._buffer.popleft() for _ in range(batch_size)]
+        if self._room_waiters:
+            self._wake_room_waiters(batch_size)
+        return batch
 
-                    event = await asyncio.wait_for(self._queue.get(), timeout=0.1)
-                except asyncio.TimeoutError:
-                    # Check again before continuing
-                    if not self._running or self._stop_event.is_set():
-                        break
-                    continue
-
-                # Process the event through all listeners
-                tasks = []
-                for listener in self.listeners.values():
-                    try:
-                        tasks.append(listener.handle_event(event))
-                    except Exception as e:
-                        print(f"Error creating listener task: {e}")
-
-                if tasks:
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    for r in results:
-                        if isinstance(r, Exception):
-                            print(f"Error in listener: {r}")
-                            print(
-                                f"Stacktrace: {''.join(traceback.format_exception(type(r), r, r.__traceback__))}"
-                            )
+    async def _process_events(self):
+        """Process batches of events from the buffer until stopped, then drain it."""
+        while True:
+            if not self._buffer:
+                if not self._running:
+                    break
+                self._has_events.clear()
+                await self._has_events.wait()
+                continue
 
+            batch = self._next_batch()
+            if self.dropped_events > self._reported_drops and not self._buffer:
+                batch.append(self._drop_report())
+            try:
+                await self._dispatch(batch)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 print(f"Error in event processing loop: {e}")
-                continue
             finally:
-                # Always mark the task as done if we got an event
-                if event is not None:
-                    self._queue.task_done()
+                self.processed_events += len(batch)
+
+    def _drop_report(self) -> Event:
+        """A warning event for the events dropped since the last report."""
+        dropped = self.dropped_events - self._reported_drops
+        self._reported_drops = self.dropped_events
+        self.emitted_events += 1
+        return Event(
+            type="warning",
+            namespace=__name__,
+            message=(
+                f"Dropped {dropped} log events because the event queue was full "
+                f"(max_queue_size={self.max_queue_size}, "
+                f"policy={self.overflow_policy!r})"
+            ),
+            data={"dropped_events": dropped},
+        )
 
-        # Process remaining events in queue
-        while not self._queue.empty():
-            try:
-                event = self._queue.get_nowait()
-                tasks = []
-                for listener in self.listeners.values():
-                    try:
-                        tasks.append(listener.handle_event(event))
-                    except Exception:
-                        pass
-                if tasks:
-                    await asyncio.gather(*tasks, return_exceptions=True)
-                self._queue.task_done()
-            except asyncio.QueueEmpty:
-                break
+    async def _dispatch(self, batch: List[Event]):
+        """Hand a batch of events to the transport, then to every listener."""
+        try:
+            await _send_events(self.transport, batch)
+        except Exception as e:
+            print(f"Error in transport.send_events: {e}")
+
+        listeners = list(self.listeners.values())
+        if not listeners:
+            return
+
+        results = await asyncio.gather(
+            *(_handle_events(listener, batch) for listener in listeners),
+            return_exceptions=True,
+        )
+        for r in results:
+            if isinstance(r, Exception):
+                print(f"Error in listener: {r}")
+                print(
+                    f"Stacktrace: {''.join(traceback.format_exception(type(r), r, r.__traceback__))}"
+                )
+
+
+async def _send_events(transport: EventTransport, events: List[Event]):
+    """Send a batch through a transport, one event at a time if it has no batch API."""
+    send_events = getattr(transport, "send_events", None)
+    if send_events is not None:
+        await send_events(events)
+    else:
+        for event in events:
+            await transport.send_event(event)
+
+
+async def _handle_events(listener: EventListener, events: List[Event]):
+    """Hand a batch to a listener, one event at a time if it has no batch API."""
+    handle_events = getattr(listener, "handle_events", None)
+    if handle_events is not None:
+        await handle_events(events)
+    else:
+        for event in events:
+            await listener.handle_event(event)
 
 
 class MultiTransport(EventTransport):
@@ -499,6 +984,60 @@ class MultiTransport(EventTransport):
             for transport, exc in exceptions:
                 print(f"  {transport.__class__.__name__}: {exc}")
 
+    def min_event_level(self) -> int | None:
+        levels = [
+            level
+            for level in (_min_event_level(t) for t in self.transports)
+            if level is not None
+        ]
+        return min(levels, default=None)
+
+    async def send_events(self, events: List[Event]):
+        """Send a batch of events to all configured transports in parallel."""
+        results = await asyncio.gather(
+            *(_send_events(transport, events) for transport in self.transports),
+            return_exceptions=True,
+        )
+        for transport, result in zip(self.transports, results):
+            if isinstance(result, Exception):
+                print(f"Error in {transport.__class__.__name__}: {result}")
+
+    async def flush(self):
+        """Flush every configured transport that buffers events."""
+        for transport in self.transports:
+            flush = getattr(transport, "flush", None)
+            if flush is not None:
+                try:
+                    await flush()
+                except Exception as e:
+                    print(f"Error flushing {transport.__class__.__name__}: {e}")
+
+    async def stop(self):
+        """Stop every configured transport that supports it."""
+        for transport in self.transports:
+            stop = getattr(transport, "stop", None)
+            if stop is not None:
+                try:
+                    await stop()
+                except Exception as e:
+                    print(f"Error stopping {transport.__class__.__name__}: {e}")
+
+
+def otlp_logs_endpoint(traces_endpoint: str) -> str:
+    """
+    Derive the OTLP/HTTP logs endpoint from the traces endpoint configured in
+    OpenTelemetrySettings, e.g. http://host:4318/v1/traces -> http://host:4318/v1/logs.
+    """
+    return otlp_signal_endpoint(traces_endpoint, "logs")
+
+
+def otlp_signal_endpoint(traces_endpoint: str, signal: str) -> str:
+    """Derive the OTLP/HTTP endpoint of another signal (logs, metrics) from the traces endpoint."""
+    endpoint = traces_endpoint.rstrip("/")
+    if endpoint.endswith("/v1/traces"):
+        endpoint = endpoint[: -len("/v1/traces")]
+    return f"{endpoint}/v1/{signal}"
+
 
 def get_log_filename(settings: LoggerSettings, session_id: str | None = None) -> str:
     """Generate a log filename based on the configuration.
@@ -560,9 +1099,22 @@ def create_transport(
                     "File path required for file transport. Either specify 'path' or configure 'path_settings'"
                 )
 
-            transports.append(
-                FileTransport(filepath=filepath, event_filter=event_filter)
-            )
+            if settings.file_buffered:
+                transports.append(
+                    BufferedFileTransport(
+                        filepath=filepath,
+                        event_filter=event_filter,
+                        flush_size=settings.file_flush_size,
+                        flush_interval=settings.file_flush_interval,
+                        max_bytes=settings.file_max_bytes,
+                        rotate_interval=settings.file_rotate_interval,
+                        compress=settings.file_compress_rotated,
+                    )
+                )
+            else:
+                transports.append(
+                    FileTransport(filepath=filepath, event_filter=event_filter)
+                )
         elif transport_type == "http":
             if not settings.http_endpoint:
                 raise ValueError("HTTP endpoint required for HTTP transport")
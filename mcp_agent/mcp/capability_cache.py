@@ -0,0 +1,131 @@
+"""
+A per-context cache of the tools, prompts and resources each MCP server exposes.
+
+Every aggregator that loads a server would otherwise re-run list_tools,
+list_prompts and list_resources against it, so N agents sharing a server pay
+for N identical discovery round-trips. The cache is keyed by server name and
+shared by all aggregators on the context. An entry lives until the server sends
+a list_changed notification or the configured TTL expires.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, TYPE_CHECKING
+
+from mcp.types import Prompt, Resource, Tool
+
+from mcp_agent.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from mcp_agent.core.context import Context
+
+logger = get_logger(__name__)
+
+
+class CachedCapabilities(NamedTuple):
+    """The tools, prompts and resources listed by a single server."""
+
+    tools: List[Tool]
+    prompts: List[Prompt]
+    resources: List[Resource]
+    fetched_at: float
+
+
+CapabilityFetcher = Callable[
+    [], Awaitable[tuple[List[Tool], List[Prompt], List[Resource]]]
+]
+
+
+class MCPCapabilityCache:
+    """
+    Caches server capability listings by server name.
+    Concurrent loads of the same server share a single fetch.
+    """
+
+    def __init__(self, ttl: float | None = None):
+        """
+        :param ttl: Seconds an entry stays valid. None keeps entries until the
+        server reports a list change.
+        """
+        self.ttl = ttl
+        self._entries: Dict[str, CachedCapabilities] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # Bumped on invalidation so that a fetch racing a list_changed
+        # notification doesn't store a stale listing
+        self._generations: Dict[str, int] = {}
+
+    def get(self, server_name: str) -> Optional[CachedCapabilities]:
+        """Return the cached capabilities for `server_name` if they are still valid."""
+        entry = self._entries.get(server_name)
+        if entry is None:
+            return None
+
+        if self.ttl is not None and time.monotonic() - entry.fetched_at > self.ttl:
+            self._entries.pop(server_name, None)
+            return None
+
+        return entry
+
+    async def get_or_fetch(
+        self, server_name: str, fetch: CapabilityFetcher
+    ) -> CachedCapabilities:
+        """
+        Return the cached capabilities for `server_name`, calling `fetch` to
+        populate the entry if it is missing or expired.
+        """
+        if self.ttl == 0:
+            tools, prompts, resources = await fetch()
+            return CachedCapabilities(tools, prompts, resources, time.monotonic())
+
+        entry = self.get(server_name)
+        if entry is not None:
+            return entry
+
+        lock = self._locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            # Another aggregator may have populated the entry while we waited
+            entry = self.get(server_name)
+            if entry is not None:
+                return entry
+
+            generation = self._generations.get(server_name, 0)
+            tools, prompts, resources = await fetch()
+            entry = CachedCapabilities(
+                tools=tools,
+                prompts=prompts,
+                resources=resources,
+                fetched_at=time.monotonic(),
+            )
+            if self._generations.get(server_name, 0) == generation:
+                self._entries[server_name] = entry
+            return entry
+
+    def invalidate(self, server_name: str | None = None):
+        """
+        Drop the cached capabilities for `server_name`, or for every server if None.
+        """
+        server_names = list(self._entries) if server_name is None else [server_name]
+        for name in server_names:
+            self._entries.pop(name, None)
+            self._generations[name] = self._generations.get(name, 0) + 1
+
+        logger.debug(f"Invalidated capability cache for {server_names}")
+
+
+def get_capability_cache(context: Optional["Context"] = None) -> MCPCapabilityCache:
+    """
+    Get the capability cache for the given context, falling back to the global context.
+    """
+    if context is None:
+        from mcp_agent.core.context import get_current_context
+
+        context = get_current_context()
+
+    cache = getattr(context, "capability_cache", None)
+    if cache is None:
+        mcp_settings = context.config.mcp if context.config else None
+        cache = MCPCapabilityCache(
+            ttl=mcp_settings.capability_cache_ttl if mcp_settings else None
+        )
+        context.capability_cache = cache
+    return cache
@@ -48,11 +48,16 @@ from mcp.types import (
     ElicitRequestParams as MCPElicitRequestParams,
     ElicitResult,
     PaginatedRequestParams,
+    PromptListChangedNotification,
+    ResourceListChangedNotification,
+    ToolListChangedNotification,
 )
 
 from mcp_agent.config import MCPServerSettings
 from mcp_agent.core.context_dependent import ContextDependent
+from mcp_agent.logging.events import lazy
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.mcp.capability_cache import get_capability_cache
 from mcp_agent.tracing.semconv import (
     MCP_METHOD_NAME,
     MCP_PROMPT_NAME,
@@ -61,7 +66,11 @@ from mcp_agent.tracing.semconv import (
     MCP_SESSION_ID,
     MCP_TOOL_NAME,
 )
-from mcp_agent.tracing.telemetry import get_tracer, record_attributes
+from mcp_agent.tracing.telemetry import (
+    get_tracer,
+    record_attributes,
+    should_capture_payload,
+)
 
 if TYPE_CHECKING:
     from mcp_agent.core.context import Context
@@ -152,7 +161,7 @@ class MCPAgentClientSession(ClientSession, ContextDependent):
         metadata: MessageMetadata = None,
         progress_callback: ProgressFnT | None = None,
     ) -> ReceiveResultT:
-        logger.debug("send_request: request=", data=request.model_dump())
+        logger.debug("send_request: request=", data=lazy(request.model_dump))
         tracer = get_tracer(self.context)
         with tracer.start_as_current_span(
             f"{self.__class__.__name__}.send_request", kind=trace.SpanKind.CLIENT
@@ -164,17 +173,20 @@ class MCPAgentClientSession(ClientSession, ContextDependent):
 
                 params = request.root.params
                 if params:
+                    capture_payload = should_capture_payload(span)
                     if isinstance(params, GetPromptRequestParams):
                         span.set_attribute(MCP_PROMPT_NAME, params.name)
-                        record_attributes(
-                            span, params.arguments or {}, MCP_REQUEST_ARGUMENT_KEY
-                        )
+                        if capture_payload:
+                            record_attributes(
+                                span, params.arguments or {}, MCP_REQUEST_ARGUMENT_KEY
+                            )
                     elif isinstance(params, CallToolRequestParams):
                         span.set_attribute(MCP_TOOL_NAME, params.name)
-                        record_attributes(
-                            span, params.arguments or {}, MCP_REQUEST_ARGUMENT_KEY
-                        )
-                    else:
+                        if capture_payload:
+                            record_attributes(
+                                span, params.arguments or {}, MCP_REQUEST_ARGUMENT_KEY
+                            )
+                    elif capture_payload:
                         record_attributes(
                             span, params.model_dump(), MCP_REQUEST_ARGUMENT_KEY
                         )
@@ -217,11 +229,10 @@ class MCPAgentClientSession(ClientSession, ContextDependent):
                     metadata,
                     progress_callback,
                 )
-                res_data = result.model_dump()
-                logger.debug("send_request: response=", data=res_data)
+                logger.debug("send_request: response=", data=lazy(result.model_dump))
 
-                if self.context.tracing_enabled:
-                    record_attributes(span, res_data, "result")
+                if self.context.tracing_enabled and should_capture_payload(span):
+                    record_attributes(span, result.model_dump(), "result")
 
                 return result
             except Exception as e:
@@ -233,7 +244,7 @@ class MCPAgentClientSession(ClientSession, ContextDependent):
         notification: ClientNotification,
         related_request_id: RequestId | None = None,
     ) -> None:
-        logger.debug("send_notification:", data=notification.model_dump())
+        logger.debug("send_notification:", data=lazy(notification.model_dump))
         tracer = get_tracer(self.context)
         with tracer.start_as_current_span(
             f"{self.__class__.__name__}.send_notification", kind=trace.SpanKind.CLIENT
@@ -245,7 +256,7 @@ class MCPAgentClientSession(ClientSession, ContextDependent):
                     span.set_attribute(MCP_REQUEST_ID, str(related_request_id))
 
                 params = notification.root.params
-                if params:
+                if params and should_capture_payload(span):
                     record_attributes(
                         span,
                         params.model_dump(),
@@ -277,7 +288,7 @@ class MCPAgentClientSession(ClientSession, ContextDependent):
     ) -> None:
         logger.debug(
             f"send_response: request_id={request_id}, response=",
-            data=response.model_dump(),
+            data=lazy(response.model_dump),
         )
         return await super()._send_response(request_id, response)
 
@@ -288,8 +299,22 @@ class MCPAgentClientSession(ClientSession, ContextDependent):
         """
         logger.info(
             "_received_notification: notification=",
-            data=notification.model_dump(),
+            data=lazy(notification.model_dump),
         )
+
+        if isinstance(
+            notification.root,
+            (
+                ToolListChangedNotification,
+                PromptListChangedNotification,
+                ResourceListChangedNotification,
+            ),
+        ):
+            server_name = getattr(self.server_config, "name", None)
+            if server_name:
+                # Drop the shared listing so the next load re-fetches it
+                get_capability_cache(self.context).invalidate(server_name)
+
         return await super()._received_notification(notification)
 
     async def send_progress_notification(
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from typing import List, Literal, Dict, Optional, TypeVar, TYPE_CHECKING
 
 from opentelemetry import trace
@@ -22,6 +23,7 @@ from mcp.types import (
 
 from mcp_agent.logging.event_progress import ProgressAction
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.tracing.metrics import get_metrics
 from mcp_agent.tracing.semconv import GEN_AI_AGENT_NAME, GEN_AI_TOOL_NAME
 from mcp_agent.tracing.telemetry import (
     annotate_span_for_call_tool_result,
@@ -31,6 +33,7 @@ from mcp_agent.tracing.telemetry import (
 from mcp_agent.mcp.gen_client import gen_client
 
 from mcp_agent.core.context_dependent import ContextDependent
+from mcp_agent.mcp.capability_cache import get_capability_cache
 from mcp_agent.mcp.mcp_agent_client_session import MCPAgentClientSession
 from mcp_agent.mcp.mcp_connection_manager import MCPConnectionManager
 
@@ -79,6 +82,85 @@ class NamespacedResource(BaseModel):
     namespaced_resource_name: str
 
 
+class CapabilityIndex:
+    """
+    Reverse indexes used to resolve a tool/prompt/resource name to the server
+    that provides it without scanning every server's capability list.
+
+    The index is updated in place (without awaiting) whenever a server's
+    capabilities are loaded, so lookups need no lock.
+    """
+
+    def __init__(self, server_names: List[str]):
+        self._server_priority = {name: i for i, name in enumerate(server_names)}
+        # Maps server_name -> local capability names
+        self._server_to_names: Dict[str, set[str]] = {}
+        # Maps local capability name -> first server (in priority order) providing it
+        self._local_to_server: Dict[str, str] = {}
+        # Maps namespaced capability name -> (server_name, local_name)
+        self._namespaced: Dict[str, tuple[str, str | None]] = {}
+
+    def update(self, server_name: str, local_names: List[str]):
+        """Replace the indexed capability names for a single server."""
+        old_names = self._server_to_names.get(server_name, set())
+        new_names = set(local_names)
+        self._server_to_names[server_name] = new_names
+
+        for name in old_names - new_names:
+            self._namespaced.pop(f"{server_name}{SEP}{name}", None)
+        for name in new_names - old_names:
+            namespaced_name = f"{server_name}{SEP}{name}"
+            self._namespaced[namespaced_name] = self.split_namespaced(namespaced_name)
+
+        for name in old_names ^ new_names:
+            servers = [
+                srv_name
+                for srv_name, names in self._server_to_names.items()
+                if name in names
+            ]
+            if servers:
+                self._local_to_server[name] = min(
+                    servers,
+                    key=lambda srv_name: self._server_priority.get(
+                        srv_name, len(self._server_priority)
+                    ),
+                )
+            else:
+                self._local_to_server.pop(name, None)
+
+    def clear(self):
+        self._server_to_names.clear()
+        self._local_to_server.clear()
+        self._namespaced.clear()
+
+    def split_namespaced(self, name: str) -> tuple[str | None, str | None]:
+        """
+        Split a name on the longest server name prefix, e.g. "server_tool" -> ("server", "tool").
+        """
+        end = len(name)
+        while (end := name.rfind(SEP, 0, end)) != -1:
+            prefix = name[:end]
+            if prefix in self._server_priority:
+                return prefix, name[end + len(SEP) :]
+        return None, None
+
+    def resolve(self, name: str) -> tuple[str | None, str | None]:
+        """
+        Resolve a possibly namespaced capability name to (server_name, local_name).
+        """
+        if SEP in name:
+            match = self._namespaced.get(name)
+            if match is None:
+                match = self.split_namespaced(name)
+            if match[0] is not None:
+                return match
+
+        server_name = self._local_to_server.get(name)
+        if server_name is None:
+            return None, None
+        return server_name, name
+
+
 class MCPAggregator(ContextDependent):
     """
     Aggregates multiple MCP servers. When a developer calls, e.g. call_tool(...),
@@ -134,18 +216,23 @@ class MCPAggregator(ContextDependent):
         # Maps server_name -> list of tools
         self._server_to_tool_map: Dict[str, List[NamespacedTool]] = {}
         self._tool_map_lock = asyncio.Lock()
+        # Bumped whenever the tool maps change, to invalidate converted tool caches
+        self._tool_map_version = 0
+        self._tool_index = CapabilityIndex(server_names)
 
         # Maps namespaced_prompt_name -> namespaced prompt info
         self._namespaced_prompt_map: Dict[str, NamespacedPrompt] = {}
         # Cache for prompt objects, maps server_name -> list of prompt objects
         self._server_to_prompt_map: Dict[str, List[NamespacedPrompt]] = {}
         self._prompt_map_lock = asyncio.Lock()
+        self._prompt_index = CapabilityIndex(server_names)
 
         # Maps namespaced_resource_name -> namespaced resource info
         self._namespaced_resource_map: Dict[str, NamespacedResource] = {}
         # Cache for resource objects, maps server_name -> list of resource objects
         self._server_to_resource_map: Dict[str, List[NamespacedResource]] = {}
         self._resource_map_lock = asyncio.Lock()
+        self._resource_index = CapabilityIndex(server_names)
 
     async def initialize(self, force: bool = False):
         """Initialize the application."""
@@ -337,7 +424,17 @@ class MCPAggregator(ContextDependent):
             if server_name not in self.server_names:
                 raise ValueError(f"Server '{server_name}' not found in server list")
 
-            _, tools, prompts, resources = await self._fetch_capabilities(server_name)
+            async def fetch():
+                _, tools, prompts, resources = await self._fetch_capabilities(
+                    server_name
+                )
+                return tools, prompts, resources
+
+            # Listings are shared by every aggregator on the context, so only the
+            # first agent to load a server pays for discovery
+            tools, prompts, resources, _ = await get_capability_cache(
+                self.context
+            ).get_or_fetch(server_name, fetch)
 
             # Process tools
             async with self._tool_map_lock:
@@ -352,6 +449,8 @@ class MCPAggregator(ContextDependent):
 
                     self._namespaced_tool_map[namespaced_tool_name] = namespaced_tool
                     self._server_to_tool_map[server_name].append(namespaced_tool)
+                self._tool_index.update(server_name, [tool.name for tool in tools])
+                self._tool_map_version += 1
 
             # Process prompts
             async with self._prompt_map_lock:
@@ -368,6 +467,9 @@ class MCPAggregator(ContextDependent):
                         namespaced_prompt
                     )
                     self._server_to_prompt_map[server_name].append(namespaced_prompt)
+                self._prompt_index.update(
+                    server_name, [prompt.name for prompt in prompts]
+                )
 
             # Process resources
             async with self._resource_map_lock:
@@ -386,6 +488,9 @@ class MCPAggregator(ContextDependent):
                     self._server_to_resource_map[server_name].append(
                         namespaced_resource
                     )
+                self._resource_index.update(
+                    server_name, [str(resource.uri) for resource in resources]
+                )
 
             event_metadata = {
                 "server_name": server_name,
@@ -444,14 +549,18 @@ class MCPAggregator(ContextDependent):
             async with self._tool_map_lock:
                 self._namespaced_tool_map.clear()
                 self._server_to_tool_map.clear()
+                self._tool_index.clear()
+                self._tool_map_version += 1
 
             async with self._prompt_map_lock:
                 self._namespaced_prompt_map.clear()
                 self._server_to_prompt_map.clear()
+                self._prompt_index.clear()
 
             async with self._resource_map_lock:
                 self._namespaced_resource_map.clear()
                 self._server_to_resource_map.clear()
+                self._resource_index.clear()
 
             # TODO: saqadri (FA1) - Verify that this can be removed
             # if self.connection_persistence:
@@ -588,12 +697,21 @@ class MCPAggregator(ContextDependent):
         tracer = get_tracer(self.context)
         with tracer.start_as_current_span(f"{self.__class__.__name__}.refresh") as span:
             span.set_attribute(GEN_AI_AGENT_NAME, self.agent_name)
+            capability_cache = get_capability_cache(self.context)
             if server_name:
                 span.set_attribute("server_name", server_name)
+                capability_cache.invalidate(server_name)
                 await self.load_server(server_name)
             else:
+                for name in self.server_names:
+                    capability_cache.invalidate(name)
                 await self.load_servers(force=True)
 
+    @property
+    def tool_map_version(self) -> int:
+        """A counter that changes whenever the aggregated tools change (see load_server, refresh)."""
+        return self._tool_map_version
+
     async def list_servers(self) -> List[str]:
         """Return the list of server names aggregated by this agent."""
         tracer = get_tracer(self.context)
@@ -866,14 +984,29 @@ class MCPAggregator(ContextDependent):
                     return
                 annotate_span_for_call_tool_result(span, result)
 
+            metrics = get_metrics(self.context)
+
             async def try_call_tool(client: ClientSession):
+                start = time.perf_counter()
                 try:
                     res = await client.call_tool(
                         name=local_tool_name, arguments=arguments
                     )
+                    metrics.record_tool_call(
+                        server_name,
+                        local_tool_name,
+                        time.perf_counter() - start,
+                        error_type="tool_error" if res.isError else None,
+                    )
                     _annotate_span_for_result(res)
                     return res
                 except Exception as e:
+                    metrics.record_tool_call(
+                        server_name,
+                        local_tool_name,
+                        time.perf_counter() - start,
+                        error_type=type(e).__qualname__,
+                    )
                     span.set_status(trace.Status(trace.StatusCode.ERROR))
                     span.record_exception(e)
                     return CallToolResult(
@@ -1155,48 +1288,18 @@ class MCPAggregator(ContextDependent):
             Tuple of (server_name, local_name)
         """
 
-        # First check if this is a namespaced name with a valid server prefix
-        if SEP in name:
-            parts = name.split(SEP)
-
-            # Try matching from longest possible prefix to shortest
-            for i in range(len(parts) - 1, 0, -1):
-                prefix = SEP.join(parts[:i])
-                if prefix in self.server_names:
-                    return prefix, SEP.join(parts[i:])
-
-        # If no server name prefix is found, search all servers for a capability with this exact name
         if capability == "tool":
-            lock = self._tool_map_lock
-            capability_map = self._server_to_tool_map
-
-            def getter(item: NamespacedTool):
-                return item.tool.name
+            index = self._tool_index
         elif capability == "prompt":
-            lock = self._prompt_map_lock
-            capability_map = self._server_to_prompt_map
-
-            def getter(item: NamespacedPrompt):
-                return item.prompt.name
+            index = self._prompt_index
         elif capability == "resource":
-            lock = self._resource_map_lock
-            capability_map = self._server_to_resource_map
-
-            def getter(item: NamespacedResource):
-                return str(item.resource.uri)
+            index = self._resource_index
         else:
             raise ValueError(f"Unsupported capability: {capability}")
 
-        # Search servers in the order of self.server_names
-        async with lock:
-            for srv_name in self.server_names:
-                items = capability_map.get(srv_name, [])
-                for item in items:
-                    if getter(item) == name:
-                        return srv_name, name
-
-        # No match found
-        return None, None
+        # A namespaced name with a valid server prefix wins; otherwise fall back to
+        # the first server (in the order of self.server_names) with this exact name
+        return index.resolve(name)
 
     async def _start_server(self, server_name: str):
         if self.connection_persistence:
@@ -2,6 +2,7 @@
 Manages the lifecycle of multiple MCP server connections.
 """
 
+import time
 from datetime import timedelta
 from typing import (
     AsyncGenerator,
@@ -33,6 +34,7 @@ from mcp_agent.core.exceptions import ServerInitializationError
 from mcp_agent.logging.event_progress import ProgressAction
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.mcp.mcp_agent_client_session import MCPAgentClientSession
+from mcp_agent.tracing.metrics import AgentMetrics, get_metrics
 
 if TYPE_CHECKING:
     from mcp_agent.mcp.mcp_server_registry import InitHookCallable, ServerRegistry
@@ -155,12 +157,17 @@ class ServerConnection:
         return session
 
 
-async def _server_lifecycle_task(server_conn: ServerConnection) -> None:
+async def _server_lifecycle_task(
+    server_conn: ServerConnection, metrics: AgentMetrics | None = None
+) -> None:
     """
     Manage the lifecycle of a single server connection.
     Runs inside the MCPConnectionManager's shared TaskGroup.
+    If metrics are given, records the time taken to connect and initialize the session.
     """
     server_name = server_conn.server_name
+    start = time.perf_counter()
+    connected = False
     try:
         transport_context = server_conn._transport_context_factory()
 
@@ -180,12 +187,22 @@ async def _server_lifecycle_task(server_conn: ServerConnection) -> None:
             async with server_conn.session:
                 # Initialize the session
                 await server_conn.initialize_session()
+                connected = True
+                if metrics is not None:
+                    metrics.record_connect(server_name, time.perf_counter() - start)
 
                 # Wait until we're asked to shut down
                 await server_conn.wait_for_shutdown_request()
     except Exception as exc:
         import traceback
 
+        if metrics is not None and not connected:
+            metrics.record_connect(
+                server_name,
+                time.perf_counter() - start,
+                error_type=type(exc).__qualname__,
+            )
+
         if hasattr(
             exc, "exceptions"
         ):  # ExceptionGroup or BaseExceptionGroup in Python 3.11+
@@ -373,7 +390,9 @@ class MCPConnectionManager(ContextDependent):
                 return self.running_servers[server_name]
 
             self.running_servers[server_name] = server_conn
-            self._tg.start_soon(_server_lifecycle_task, server_conn)
+            self._tg.start_soon(
+                _server_lifecycle_task, server_conn, get_metrics(self.context)
+            )
 
         logger.info(f"{server_name}: Up and running with a persistent connection!")
         return server_conn
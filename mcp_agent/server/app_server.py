@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Type, TYPE_CHECKING
 from mcp.server.fastmcp import Context as MCPContext, FastMCP
 from mcp.server.fastmcp.exceptions import ToolError
 from mcp.server.fastmcp.tools import Tool as FastTool
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
 
 from mcp_agent.app import MCPApp
 from mcp_agent.agents.agent import Agent
@@ -299,6 +301,31 @@ def create_mcp_server_for_app(app: MCPApp) -> FastMCP:
 
     # endregion
 
+    # region Metrics
+
+    otel_settings = app.config.otel if app.config else None
+    metrics_settings = otel_settings.metrics if otel_settings else None
+    if (
+        otel_settings
+        and otel_settings.enabled
+        and metrics_settings
+        and "prometheus" in metrics_settings.exporters
+    ):
+
+        @mcp.custom_route(metrics_settings.prometheus_path, methods=["GET"])
+        async def prometheus_metrics(request: Request) -> Response:
+            """Serve the app's metrics in the Prometheus text exposition format."""
+            # The server's lifespan initializes the app before requests are served
+            metrics_config = app.context.metrics_config
+            text = metrics_config.render_prometheus() if metrics_config else None
+            if text is None:
+                return PlainTextResponse("Metrics are not available", status_code=503)
+            return PlainTextResponse(
+                text, media_type="text/plain; version=0.0.4; charset=utf-8"
+            )
+
+    # endregion
+
     return mcp
 
 
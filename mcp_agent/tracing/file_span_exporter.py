@@ -1,41 +1,120 @@
+import json
+import threading
+import time
 from datetime import datetime
-from os import linesep
 from pathlib import Path
-from typing import Callable, Sequence
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Sequence,
+    TYPE_CHECKING,
+)
 import uuid
 
+from opentelemetry import trace
+from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+from opentelemetry.sdk.util import ns_to_iso_str
 
 from mcp_agent.config import TracePathSettings
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.utils.common import compress_file, rotate_file
+
+if TYPE_CHECKING:
+    from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+        ExportTraceServiceRequest,
+    )
 
 logger = get_logger(__name__)
 
+SpanFileFormat = Literal["json", "protobuf"]
+"""
+json: one compact JSON object per span per line, in the shape of ReadableSpan.to_json.
+protobuf: one OTLP ExportTraceServiceRequest per exported batch, each prefixed with
+its varint-encoded length (see read_otlp_protobuf_file).
+"""
+
 
 class FileSpanExporter(SpanExporter):
-    """Implementation of :class:`SpanExporter` that writes spans as JSON to a file."""
+    """
+    Implementation of :class:`SpanExporter` that writes spans to a file.
+
+    The file stays open with a large write buffer: spans reach disk when the buffer
+    fills, at most every `flush_interval` seconds while spans are being exported, and
+    on `force_flush`/`shutdown`, instead of reopening and flushing the file per span.
+    Once the file grows past `max_bytes` it is rotated, and gzipped on a background
+    thread unless `compress_rotated` is False.
+    """
 
     def __init__(
         self,
         service_name: str | None = None,
         session_id: str | None = None,
-        formatter: Callable[[ReadableSpan], str] = lambda span: span.to_json(
-            indent=None
-        )
-        + linesep,
+        formatter: Callable[[ReadableSpan], str] | None = None,
         path_settings: TracePathSettings | None = None,
         custom_path: str | None = None,
+        file_format: SpanFileFormat = "json",
+        max_bytes: int | None = None,
+        compress_rotated: bool = True,
+        buffer_size: int = 256 * 1024,
+        flush_interval: float = 5.0,
     ):
+        """
+        Args:
+            formatter: Formats a span as a line of text. Defaults to compact JSON.
+                Only used with the "json" file format
+            file_format: "json" for JSON lines, "protobuf" for length-delimited OTLP
+                protobuf, which is smaller but costs more CPU to encode
+            max_bytes: Rotate the file once it grows past this size. None disables rotation
+            compress_rotated: Whether to gzip rotated files
+            buffer_size: Size of the file's write buffer in bytes
+            flush_interval: Maximum seconds exported spans stay in the write buffer,
+                checked on each export
+        """
         self.formatter = formatter
         self.service_name = service_name
         self.session_id = session_id or str(uuid.uuid4())
         self.path_settings = path_settings or TracePathSettings()
         self.custom_path = custom_path
+        self.file_format = file_format
+        self.max_bytes = max_bytes
+        self.compress_rotated = compress_rotated
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+
         self.filepath = Path(self._get_trace_filename())
+        if file_format == "protobuf" and self.filepath.suffix == ".jsonl":
+            self.filepath = self.filepath.with_suffix(".binpb")
         # Create directory if it doesn't exist
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
+        if file_format == "protobuf":
+            # pylint: disable=import-outside-toplevel (only needed for the protobuf format)
+            from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
+                encode_spans,
+            )
+
+            self._encode_spans = encode_spans
+
+        # export() runs on the span processor's worker thread, while force_flush()
+        # and shutdown() may be called from any thread
+        self._lock = threading.Lock()
+        self._file: IO[bytes] | None = None
+        self._size = 0
+        self._flushed_at = time.monotonic()
+        self._shutdown = False
+        # Threads gzipping rotated files, joined on shutdown
+        self._compressions: List[threading.Thread] = []
+        # Spans of a provider share one resource; serialize it once
+        self._resource: Resource | None = None
+        self._resource_json: Dict[str, Any] | None = None
+
     def _get_trace_filename(self) -> str:
         """Generate a trace filename based on the path settings."""
         # If custom_path is provided, use it directly
@@ -59,16 +138,188 @@ class FileSpanExporter(SpanExporter):
         return path_pattern.replace("{unique_id}", unique_id)
 
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
-        logger.info("EXPORTING SPANS TO FILE", data={"spans": spans})
+        if self._shutdown:
+            return SpanExportResult.FAILURE
+
         try:
-            with open(self.filepath, "a", encoding="utf-8") as f:
-                for span in spans:
-                    f.write(self.formatter(span))
-                    f.flush()  # Ensure writing to disk
+            data = self._encode(spans)
+            with self._lock:
+                if self._file is None:
+                    self._open()
+                self._file.write(data)
+                self._size += len(data)
+
+                if self.max_bytes is not None and self._size >= self.max_bytes:
+                    self._rotate()
+                elif time.monotonic() - self._flushed_at >= self.flush_interval:
+                    self._flush()
             return SpanExportResult.SUCCESS
         except Exception as e:
-            logger.error(f"Failed to export span to {self.filepath}: {e}")
+            logger.error(f"Failed to export spans to {self.filepath}: {e}")
             return SpanExportResult.FAILURE
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
-        return True
+        """Write buffered spans to disk."""
+        try:
+            with self._lock:
+                if self._file is not None:
+                    self._flush()
+            return True
+        except OSError as e:
+            logger.error(f"Failed to flush spans to {self.filepath}: {e}")
+            return False
+
+    def shutdown(self):
+        """
+        Write buffered spans to disk, close the file and wait for rotated files to
+        be compressed. Later exports fail.
+        """
+        with self._lock:
+            self._shutdown = True
+            if self._file is not None:
+                try:
+                    self._file.close()
+                except OSError as e:
+                    logger.error(f"Failed to flush spans to {self.filepath}: {e}")
+                self._file = None
+            compressions, self._compressions = self._compressions, []
+
+        for thread in compressions:
+            thread.join()
+
+    def _encode(self, spans: Sequence[ReadableSpan]) -> bytes:
+        if self.file_format == "protobuf":
+            message = self._encode_spans(spans).SerializeToString()
+            return _encode_varint(len(message)) + message
+
+        formatter = self.formatter or self._format_span
+        return "".join(formatter(span) for span in spans).encode("utf-8")
+
+    def _format_span(self, span: ReadableSpan) -> str:
+        """Compact equivalent of span.to_json(), without re-serializing the resource."""
+        if span.resource is not self._resource:
+            self._resource_json = json.loads(span.resource.to_json())
+            self._resource = span.resource
+
+        status = {"status_code": span.status.status_code.name}
+        if span.status.description:
+            status["description"] = span.status.description
+
+        f_span = {
+            "name": span.name,
+            "context": _format_context(span.context) if span.context else None,
+            "kind": str(span.kind),
+            "parent_id": (
+                f"0x{trace.format_span_id(span.parent.span_id)}"
+                if span.parent is not None
+                else None
+            ),
+            "start_time": ns_to_iso_str(span.start_time) if span.start_time else None,
+            "end_time": ns_to_iso_str(span.end_time) if span.end_time else None,
+            "status": status,
+            "attributes": _format_attributes(span.attributes),
+            "events": [
+                {
+                    "name": event.name,
+                    "timestamp": ns_to_iso_str(event.timestamp),
+                    "attributes": _format_attributes(event.attributes),
+                }
+                for event in span.events
+            ],
+            "links": [
+                {
+                    "context": _format_context(link.context),
+                    "attributes": _format_attributes(link.attributes),
+                }
+                for link in span.links
+            ],
+            "resource": self._resource_json,
+        }
+        return json.dumps(f_span, separators=(",", ":"), default=str) + "\n"
+
+    def _open(self):
+        self._file = open(self.filepath, "ab", buffering=self.buffer_size)
+        self._size = self._file.tell()
+        self._flushed_at = time.monotonic()
+
+    def _flush(self):
+        self._file.flush()
+        self._flushed_at = time.monotonic()
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        rotated = rotate_file(self.filepath, compress=False)
+        if self.compress_rotated:
+            # Compressing takes far longer than an export; don't hold up the span
+            # processor's worker thread (or the lock) for it
+            thread = threading.Thread(
+                target=self._compress,
+                args=(rotated,),
+                name="FileSpanExporter-compress",
+            )
+            self._compressions = [t for t in self._compressions if t.is_alive()]
+            self._compressions.append(thread)
+            thread.start()
+
+    def _compress(self, path: Path):
+        try:
+            compress_file(path)
+        except OSError as e:
+            logger.error(f"Failed to compress rotated trace file {path}: {e}")
+
+
+def read_otlp_protobuf_file(
+    path: str | Path,
+) -> Iterator["ExportTraceServiceRequest"]:
+    """Read back the batches written by FileSpanExporter with the "protobuf" file format."""
+    # pylint: disable=import-outside-toplevel
+    from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+        ExportTraceServiceRequest,
+    )
+
+    with open(path, "rb") as f:
+        data = f.read()
+
+    position = 0
+    while position < len(data):
+        length, position = _decode_varint(data, position)
+        request = ExportTraceServiceRequest()
+        request.ParseFromString(data[position : position + length])
+        position += length
+        yield request
+
+
+def _format_context(context: trace.SpanContext) -> Dict[str, str]:
+    return {
+        "trace_id": f"0x{trace.format_trace_id(context.trace_id)}",
+        "span_id": f"0x{trace.format_span_id(context.span_id)}",
+        "trace_state": repr(context.trace_state),
+    }
+
+
+def _format_attributes(attributes) -> Dict[str, Any] | None:
+    if attributes is not None and not isinstance(attributes, dict):
+        return dict(attributes)
+    return attributes
+
+
+def _encode_varint(value: int) -> bytes:
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _decode_varint(data: bytes, position: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, position
+        shift += 7
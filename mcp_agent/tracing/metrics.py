@@ -0,0 +1,389 @@
+"""
+Performance metrics: latency histograms for LLM requests, MCP tool calls and
+server connections, plus the depth of the logger's event queue.
+
+Metrics are configured alongside tracing (see MetricsConfig) and exported with
+the OpenTelemetry metrics SDK to the console, to an OTLP collector, or rendered
+in the Prometheus text format for scraping from the app server.
+"""
+
+import math
+import re
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence
+
+from opentelemetry.metrics import CallbackOptions, Meter, NoOpMeterProvider, Observation
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import (
+    ConsoleMetricExporter,
+    Gauge,
+    Histogram,
+    InMemoryMetricReader,
+    MetricReader,
+    PeriodicExportingMetricReader,
+    Sum,
+)
+
+from mcp_agent.config import OpenTelemetrySettings
+from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.transport import AsyncEventBus, otlp_signal_endpoint
+from mcp_agent.tracing.semconv import (
+    GEN_AI_OPERATION_NAME,
+    GEN_AI_REQUEST_MODEL,
+    GEN_AI_SYSTEM,
+    MCP_SERVER_NAME,
+    MCP_TOOL_NAME,
+)
+from mcp_agent.tracing.tracer import create_service_resource
+
+if TYPE_CHECKING:
+    from mcp_agent.core.context import Context
+
+logger = get_logger(__name__)
+
+ERROR_TYPE = "error.type"
+
+# Bucket boundaries in seconds. LLM latencies follow the GenAI semantic
+# conventions; MCP calls and connections are typically much faster.
+LLM_DURATION_BUCKETS = [
+    0.01, 0.02, 0.04, 0.08, 0.16, 0.32, 0.64, 1.28, 2.56, 5.12, 10.24, 20.48, 40.96, 81.92,
+]  # fmt: skip
+MCP_DURATION_BUCKETS = [
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60,
+]  # fmt: skip
+TOKENS_PER_SECOND_BUCKETS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000]
+
+
+class LLMRequestTimer:
+    """Times one LLM request; see AgentMetrics.start_llm_request."""
+
+    def __init__(self, metrics: "AgentMetrics", attributes: Dict[str, str]):
+        self._metrics = metrics
+        self._attributes = attributes
+        self._start = time.perf_counter()
+        self._first_token_at: float | None = None
+
+    def first_token(self):
+        """Mark the arrival of the first streamed token. Later calls are ignored."""
+        if self._first_token_at is not None:
+            return
+        self._first_token_at = time.perf_counter()
+        self._metrics.llm_time_to_first_token.record(
+            self._first_token_at - self._start, self._attributes
+        )
+
+    def finish(
+        self, output_tokens: int | None = None, error: BaseException | None = None
+    ):
+        """
+        Record the request's duration and, when the number of generated tokens is
+        known, its output rate (measured from the first token when streaming).
+        """
+        end = time.perf_counter()
+        attributes = self._attributes
+        if error is not None:
+            attributes = {**attributes, ERROR_TYPE: type(error).__qualname__}
+        self._metrics.llm_duration.record(end - self._start, attributes)
+
+        if error is None and output_tokens:
+            generating = end - (self._first_token_at or self._start)
+            if generating > 0:
+                self._metrics.llm_output_tokens_per_second.record(
+                    output_tokens / generating, attributes
+                )
+
+
+class AgentMetrics:
+    """The instruments mcp-agent records to. Created from a meter by MetricsConfig."""
+
+    def __init__(self, meter: Meter):
+        self.llm_duration = meter.create_histogram(
+            "gen_ai.client.operation.duration",
+            unit="s",
+            description="Duration of LLM requests",
+            explicit_bucket_boundaries_advisory=LLM_DURATION_BUCKETS,
+        )
+        self.llm_time_to_first_token = meter.create_histogram(
+            "mcp_agent.llm.time_to_first_token",
+            unit="s",
+            description="Time until the first token of a streamed LLM response",
+            explicit_bucket_boundaries_advisory=LLM_DURATION_BUCKETS,
+        )
+        self.llm_output_tokens_per_second = meter.create_histogram(
+            "mcp_agent.llm.output_tokens_per_second",
+            unit="{token}/s",
+            description="Rate at which LLM responses are generated",
+            explicit_bucket_boundaries_advisory=TOKENS_PER_SECOND_BUCKETS,
+        )
+        self.tool_call_duration = meter.create_histogram(
+            "mcp_agent.mcp.tool_call.duration",
+            unit="s",
+            description="Duration of MCP tool calls, per server and tool",
+            explicit_bucket_boundaries_advisory=MCP_DURATION_BUCKETS,
+        )
+        self.connect_duration = meter.create_histogram(
+            "mcp_agent.mcp.connect.duration",
+            unit="s",
+            description="Time to launch and initialize a persistent MCP server connection",
+            explicit_bucket_boundaries_advisory=MCP_DURATION_BUCKETS,
+        )
+        meter.create_observable_gauge(
+            "mcp_agent.logger.queue_depth",
+            callbacks=[_observe_logger_queue_depth],
+            unit="{event}",
+            description="Number of log events waiting to be processed",
+        )
+        meter.create_observable_counter(
+            "mcp_agent.logger.dropped_events",
+            callbacks=[_observe_logger_dropped_events],
+            unit="{event}",
+            description="Number of log events dropped by the event bus",
+        )
+
+    def start_llm_request(
+        self, provider: str | None, model: str | None, operation: str = "chat"
+    ) -> LLMRequestTimer:
+        attributes = {GEN_AI_OPERATION_NAME: operation}
+        if provider:
+            attributes[GEN_AI_SYSTEM] = provider
+        if model:
+            attributes[GEN_AI_REQUEST_MODEL] = model
+        return LLMRequestTimer(self, attributes)
+
+    def record_tool_call(
+        self,
+        server_name: str,
+        tool_name: str,
+        duration: float,
+        error_type: str | None = None,
+    ):
+        attributes = {MCP_SERVER_NAME: server_name, MCP_TOOL_NAME: tool_name}
+        if error_type:
+            attributes[ERROR_TYPE] = error_type
+        self.tool_call_duration.record(duration, attributes)
+
+    def record_connect(
+        self, server_name: str, duration: float, error_type: str | None = None
+    ):
+        attributes = {MCP_SERVER_NAME: server_name}
+        if error_type:
+            attributes[ERROR_TYPE] = error_type
+        self.connect_duration.record(duration, attributes)
+
+
+def _observe_logger_queue_depth(options: CallbackOptions) -> Iterable[Observation]:
+    bus = AsyncEventBus._instance
+    if bus is not None:
+        yield Observation(bus.queue_depth)
+
+
+def _observe_logger_dropped_events(options: CallbackOptions) -> Iterable[Observation]:
+    bus = AsyncEventBus._instance
+    if bus is not None:
+        yield Observation(bus.dropped_events)
+
+
+class PrometheusTextReader(InMemoryMetricReader):
+    """
+    Metric reader that renders the current (cumulative) metrics in the Prometheus
+    text exposition format on demand, for serving from a scrape endpoint.
+    """
+
+    def render(self) -> str:
+        metrics_data = self.get_metrics_data()
+        if metrics_data is None:
+            return ""
+
+        lines: List[str] = []
+        for resource_metrics in metrics_data.resource_metrics:
+            for scope_metrics in resource_metrics.scope_metrics:
+                for metric in scope_metrics.metrics:
+                    lines.extend(_render_metric(metric))
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_:]")
+_UNIT_SUFFIXES = {"s": "seconds", "ms": "milliseconds", "By": "bytes", "1": "ratio"}
+
+
+def _prometheus_name(name: str, unit: str | None) -> str:
+    name = _INVALID_NAME_CHARS.sub("_", name)
+    # Annotations such as {token} carry no unit
+    unit = re.sub(r"\{[^}]*\}", "", unit or "").strip()
+    if unit.endswith("/s"):
+        suffix = (_UNIT_SUFFIXES.get(unit[:-2], unit[:-2]) + "_per_second").lstrip("_")
+    else:
+        suffix = _UNIT_SUFFIXES.get(unit, unit)
+    suffix = _INVALID_NAME_CHARS.sub("_", suffix)
+    if suffix and not name.endswith(suffix):
+        name = f"{name}_{suffix}"
+    if name[0].isdigit():
+        name = f"_{name}"
+    return name
+
+
+def _escape_label_value(value) -> str:
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _labels(attributes, extra: Sequence[tuple[str, str]] = ()) -> str:
+    pairs = [
+        f'{_INVALID_NAME_CHARS.sub("_", key)}="{_escape_label_value(value)}"'
+        for key, value in (attributes or {}).items()
+    ]
+    pairs.extend(f'{key}="{value}"' for key, value in extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _render_metric(metric) -> List[str]:
+    name = _prometheus_name(metric.name, metric.unit)
+    data = metric.data
+
+    if isinstance(data, Histogram):
+        kind = "histogram"
+    elif isinstance(data, Sum) and data.is_monotonic:
+        kind = "counter"
+        if not name.endswith("_total"):
+            name = f"{name}_total"
+    elif isinstance(data, (Sum, Gauge)):
+        kind = "gauge"
+    else:
+        return []
+
+    lines = []
+    if metric.description:
+        lines.append(f"# HELP {name} {_escape_label_value(metric.description)}")
+    lines.append(f"# TYPE {name} {kind}")
+
+    for point in data.data_points:
+        if kind != "histogram":
+            lines.append(
+                f"{name}{_labels(point.attributes)} {_format_value(point.value)}"
+            )
+            continue
+
+        cumulative = 0
+        bounds = list(point.explicit_bounds) + [math.inf]
+        for bound, count in zip(bounds, point.bucket_counts):
+            cumulative += count
+            labels = _labels(point.attributes, [("le", _format_value(float(bound)))])
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        labels = _labels(point.attributes)
+        lines.append(f"{name}_sum{labels} {_format_value(point.sum)}")
+        lines.append(f"{name}_count{labels} {point.count}")
+    return lines
+
+
+class MetricsConfig:
+    """Configuration for the metrics system, the counterpart of TracingConfig."""
+
+    def __init__(self):
+        self._meter_provider: MeterProvider | None = None
+        self._prometheus_reader: PrometheusTextReader | None = None
+        self.metrics: AgentMetrics | None = None
+
+    def configure(self, settings: OpenTelemetrySettings, session_id: str):
+        """Create a meter provider exporting to the readers listed in settings.metrics."""
+        metrics_settings = settings.metrics
+        if metrics_settings is None or not metrics_settings.exporters:
+            return
+
+        export_interval_ms = metrics_settings.export_interval * 1000
+        readers: List[MetricReader] = []
+        for exporter in metrics_settings.exporters:
+            if exporter == "console":
+                readers.append(
+                    PeriodicExportingMetricReader(
+                        ConsoleMetricExporter(),
+                        export_interval_millis=export_interval_ms,
+                    )
+                )
+            elif exporter == "otlp":
+                if settings.otlp_settings:
+                    # pylint: disable=import-outside-toplevel
+                    from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
+                        OTLPMetricExporter,
+                    )
+
+                    endpoint = otlp_signal_endpoint(
+                        settings.otlp_settings.endpoint, "metrics"
+                    )
+                    readers.append(
+                        PeriodicExportingMetricReader(
+                            OTLPMetricExporter(endpoint=endpoint),
+                            export_interval_millis=export_interval_ms,
+                        )
+                    )
+                else:
+                    logger.error(
+                        "OTLP metrics exporter is enabled but no OTLP settings endpoint is provided."
+                    )
+            elif exporter == "prometheus":
+                self._prometheus_reader = PrometheusTextReader()
+                readers.append(self._prometheus_reader)
+            else:
+                logger.error(
+                    f"Unknown metrics exporter '{exporter}' specified. Supported exporters: console, otlp, prometheus."
+                )
+
+        # Not registered globally, so separate apps in one process keep separate metrics
+        self._meter_provider = MeterProvider(
+            metric_readers=readers,
+            resource=create_service_resource(settings, session_id),
+            shutdown_on_exit=False,
+        )
+        self.metrics = AgentMetrics(self._meter_provider.get_meter("mcp_agent"))
+
+    def render_prometheus(self) -> str | None:
+        """The current metrics in Prometheus text format, or None if that exporter is off."""
+        if self._prometheus_reader is None:
+            return None
+        return self._prometheus_reader.render()
+
+    def flush(self, timeout_ms: int = 5000) -> bool:
+        """Export pending metrics to the periodic exporters."""
+        if not self._meter_provider:
+            return True
+        try:
+            return self._meter_provider.force_flush(timeout_millis=timeout_ms)
+        except Exception as e:
+            logger.error(f"Error flushing metrics: {e}")
+            return False
+
+    def shutdown(self):
+        """Shutdown the meter provider, stopping its periodic export threads."""
+        if not self._meter_provider:
+            return
+        try:
+            self._meter_provider.shutdown()
+        except Exception as e:
+            logger.error(f"Error shutting down meter provider: {e}")
+        self._meter_provider = None
+        self._prometheus_reader = None
+        self.metrics = None
+
+
+_noop_metrics: AgentMetrics | None = None
+
+
+def get_metrics(context: "Context | None" = None) -> AgentMetrics:
+    """
+    The instruments to record to for the given context. When metrics aren't
+    configured these are no-ops, so callers can record unconditionally.
+    """
+    metrics_config = getattr(context, "metrics_config", None) if context else None
+    if metrics_config is not None and metrics_config.metrics is not None:
+        return metrics_config.metrics
+
+    global _noop_metrics
+    if _noop_metrics is None:
+        _noop_metrics = AgentMetrics(NoOpMeterProvider().get_meter("mcp_agent"))
+    return _noop_metrics
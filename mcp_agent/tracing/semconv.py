@@ -209,6 +209,12 @@ The value of the resource uri.
 e.g. postgres://database/customers/schema; file://home/user/documents/report.pdf
 """
 
+MCP_SERVER_NAME = "mcp.server.name"
+"""
+The name of the MCP server as configured in the server registry
+e.g. fetch; filesystem
+"""
+
 MCP_SESSION_ID = "mcp.session.id"
 """
 Identifies MCP session.
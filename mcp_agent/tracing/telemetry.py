@@ -7,10 +7,10 @@ import asyncio
 from collections.abc import Sequence
 import functools
 import inspect
-from typing import Any, Dict, Callable, Optional, TYPE_CHECKING
+from typing import Any, Dict, Callable, Literal, NamedTuple, Optional, TYPE_CHECKING
 
 from opentelemetry import trace
-from opentelemetry.trace import SpanKind, Status, StatusCode
+from opentelemetry.trace import SpanKind
 
 from mcp_agent.core.context_dependent import ContextDependent
 from mcp.types import (
@@ -21,6 +21,16 @@ if TYPE_CHECKING:
     from mcp_agent.core.context import Context
 
 
+ArgCapture = Literal["none", "names", "shallow", "full"]
+"""
+How @telemetry.traced records a function's arguments on its span:
+- none: not at all
+- names: only the names of the arguments passed
+- shallow: primitive values as-is, anything else as its type name
+- full: every value, flattened into attributes (bounded by the attribute budget)
+"""
+
+
 class TelemetryManager(ContextDependent):
     """
     Simple manager for creating OpenTelemetry spans automatically.
@@ -35,48 +45,47 @@ class TelemetryManager(ContextDependent):
         name: str | None = None,
         kind: SpanKind = SpanKind.INTERNAL,
         attributes: Dict[str, Any] = None,
+        capture: ArgCapture = "full",
     ) -> Callable:
         """
         Decorator that automatically creates and manages a span for a function.
         Works for both async and sync functions.
+
+        When tracing is disabled for the context the function is called directly,
+        and arguments are only recorded (per `capture`) on spans that are recording.
+        Exceptions are recorded on the span and set its status to ERROR.
         """
 
         def decorator(func):
             span_name = name or f"{func.__qualname__}"
+            record_args = capture != "none"
+            arg_names = _positional_arg_names(func) if capture == "names" else ()
 
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs):
-                tracer = get_tracer(self.context)
-                with tracer.start_as_current_span(span_name, kind=kind) as span:
-                    if attributes:
-                        for k, v in attributes.items():
-                            span.set_attribute(k, v)
-                    # Record simple args
-                    self._record_args(span, args, kwargs)
-                    try:
-                        res = await func(*args, **kwargs)
-                        return res
-                    except Exception as e:
-                        span.record_exception(e)
-                        span.set_status(Status(StatusCode.ERROR))
-                        raise
+                context = self.context
+                if not context.tracing_enabled:
+                    return await func(*args, **kwargs)
+
+                with get_tracer(context).start_as_current_span(
+                    span_name, kind=kind, attributes=attributes
+                ) as span:
+                    if record_args and span.is_recording():
+                        _record_args(span, args, kwargs, capture, arg_names)
+                    return await func(*args, **kwargs)
 
             @functools.wraps(func)
             def sync_wrapper(*args, **kwargs):
-                tracer = get_tracer(self.context)
-                with tracer.start_as_current_span(span_name, kind=kind) as span:
-                    if attributes:
-                        for k, v in attributes.items():
-                            span.set_attribute(k, v)
-                    # Record simple args
-                    self._record_args(span, args, kwargs)
-                    try:
-                        res = func(*args, **kwargs)
-                        return res
-                    except Exception as e:
-                        span.record_exception(e)
-                        span.set_status(Status(StatusCode.ERROR))
-                        raise
+                context = self.context
+                if not context.tracing_enabled:
+                    return func(*args, **kwargs)
+
+                with get_tracer(context).start_as_current_span(
+                    span_name, kind=kind, attributes=attributes
+                ) as span:
+                    if record_args and span.is_recording():
+                        _record_args(span, args, kwargs, capture, arg_names)
+                    return func(*args, **kwargs)
 
             if asyncio.iscoroutinefunction(func):
                 return async_wrapper
@@ -85,28 +94,152 @@ class TelemetryManager(ContextDependent):
 
         return decorator
 
-    def _record_args(self, span, args, kwargs):
-        """Optionally record primitive args and function/coroutine metadata as span attributes."""
+
+def _positional_arg_names(func: Callable) -> tuple[str, ...]:
+    """Names of the positional parameters of `func`, excluding self/cls."""
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return ()
+    return tuple(
+        "" if parameter.name in ("self", "cls") else parameter.name
+        for parameter in parameters
+        if parameter.kind
+        in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    )
+
+
+def _record_args(
+    span: trace.Span,
+    args: tuple,
+    kwargs: Dict[str, Any],
+    capture: ArgCapture,
+    arg_names: tuple[str, ...],
+):
+    """Record a traced function's arguments on its span according to `capture`."""
+    if capture == "full":
         for i, arg in enumerate(args):
             record_attribute(span, f"arg_{i}", arg)
-
         record_attributes(span, kwargs)
 
+    elif capture == "shallow":
+        for i, arg in enumerate(args):
+            span.set_attribute(f"arg_{i}", _shallow_attribute(arg))
+        for key, value in kwargs.items():
+            span.set_attribute(key, _shallow_attribute(value))
+
+    elif capture == "names":
+        names = [
+            arg_names[i] if i < len(arg_names) else f"arg_{i}" for i in range(len(args))
+        ]
+        names = [name for name in names if name]
+        names.extend(kwargs)
+        span.set_attribute("arguments", names)
+
+
+def _shallow_attribute(value: Any) -> Any:
+    if isinstance(value, (bool, str, bytes, int, float)):
+        return _truncate(value, _attribute_budget.max_value_length)
+    if callable(value):
+        return getattr(value, "__qualname__", type(value).__name__)
+    return f"<{type(value).__name__}>"
+
+
+class AttributeBudget(NamedTuple):
+    """
+    Limits on how much data is flattened into span attributes, so that a large
+    tool result or a long message history doesn't turn into thousands of
+    attributes per call. See OpenTelemetrySettings for what each limit means.
+    """
+
+    max_attributes: int | None = 128
+    max_value_length: int | None = 4096
+    max_depth: int | None = 5
+    payload_sample_rate: float = 1.0
+
+
+_attribute_budget = AttributeBudget()
+
+
+def get_attribute_budget() -> AttributeBudget:
+    """Return the attribute budget applied when recording span attributes."""
+    return _attribute_budget
+
+
+def set_attribute_budget(budget: AttributeBudget):
+    """Set the attribute budget applied when recording span attributes."""
+    global _attribute_budget
+    _attribute_budget = budget
+
+
+def attribute_budget_exhausted(attributes: Dict[str, Any]) -> bool:
+    """Check whether a dict of attributes has reached the per-span attribute limit."""
+    limit = _attribute_budget.max_attributes
+    return limit is not None and len(attributes) >= limit
 
-def serialize_attribute(key: str, value: Any) -> Dict[str, Any]:
-    """Serialize a single attribute value into a flat dict of OpenTelemetry-compatible values."""
+
+def should_capture_payload(span: trace.Span) -> bool:
+    """
+    Whether to record message contents, tool arguments and tool results on the span.
+
+    False for spans that aren't recording. Otherwise the decision is made per trace
+    from the high 64 bits of the trace ID (the trace sampler uses the low 64 bits),
+    so either every span of a trace carries its payloads or none does.
+    """
+    if not span.is_recording():
+        return False
+
+    rate = _attribute_budget.payload_sample_rate
+    if rate >= 1.0:
+        return True
+    if rate <= 0.0:
+        return False
+    trace_id = span.get_span_context().trace_id
+    return (trace_id >> 64) < rate * _TRACE_ID_HIGH_BITS
+
+
+_TRACE_ID_HIGH_BITS = 1 << 64
+
+
+def serialize_attribute(
+    key: str, value: Any, limit: int | None = None
+) -> Dict[str, Any]:
+    """
+    Serialize a single attribute value into a flat dict of OpenTelemetry-compatible values.
+    Nesting, value length and the number of entries (at most `limit`) are bounded
+    by the attribute budget.
+    """
     serialized = {}
+    _flatten_attribute(serialized, key, value, 0, _attribute_budget, limit)
+    return serialized
 
-    if is_otel_serializable(value):
-        serialized[key] = value
 
-    elif isinstance(value, dict):
-        for sub_key, sub_value in value.items():
-            serialized.update(serialize_attribute(f"{key}.{sub_key}", sub_value))
+def _flatten_attribute(
+    serialized: Dict[str, Any],
+    key: str,
+    value: Any,
+    depth: int,
+    budget: AttributeBudget,
+    limit: int | None,
+):
+    if limit is not None and len(serialized) >= limit:
+        return
 
-    elif isinstance(value, (list, tuple)):
-        for idx, item in enumerate(value):
-            serialized.update(serialize_attribute(f"{key}.{idx}", item))
+    if is_otel_serializable(value):
+        serialized[key] = _truncate(value, budget.max_value_length)
+
+    elif isinstance(value, (dict, list, tuple)):
+        if budget.max_depth is not None and depth >= budget.max_depth:
+            serialized[key] = f"<{type(value).__name__} of {len(value)} items>"
+            return
+
+        items = value.items() if isinstance(value, dict) else enumerate(value)
+        for sub_key, sub_value in items:
+            if limit is not None and len(serialized) >= limit:
+                break
+            _flatten_attribute(
+                serialized, f"{key}.{sub_key}", sub_value, depth + 1, budget, limit
+            )
 
     elif isinstance(value, Callable):
         serialized[f"{key}_callable_name"] = getattr(value, "__qualname__", str(value))
@@ -118,40 +251,65 @@ def serialize_attribute(key: str, value: Any) -> Dict[str, Any]:
         serialized[f"{key}_is_coroutine"] = True
 
     else:
-        s = str(value)
-        # TODO: jerron - Truncate very long strings. Not sure if this is necessary.
-        serialized[key] = s if len(s) < 256 else s[:255] + "…"
+        max_length = budget.max_value_length
+        max_length = 256 if max_length is None else min(max_length, 256)
+        serialized[key] = _truncate(str(value), max_length)
 
-    return serialized
+
+def _truncate(value: Any, max_length: int | None) -> Any:
+    if isinstance(value, str) and max_length is not None and len(value) > max_length:
+        return value[: max_length - 1] + "…"
+    return value
 
 
 def serialize_attributes(
-    attributes: Dict[str, Any], prefix: str = ""
+    attributes: Dict[str, Any], prefix: str = "", limit: int | None = None
 ) -> Dict[str, Any]:
     """Serialize a dict of attributes into a flat OpenTelemetry-compatible dict."""
     serialized = {}
     prefix = f"{prefix}." if prefix else ""
+    if limit is None:
+        limit = _attribute_budget.max_attributes
 
     for key, value in attributes.items():
-        full_key = f"{prefix}{key}"
-        serialized.update(serialize_attribute(full_key, value))
+        if limit is not None and len(serialized) >= limit:
+            break
+        _flatten_attribute(
+            serialized, f"{prefix}{key}", value, 0, _attribute_budget, limit
+        )
 
     return serialized
 
 
+def _remaining_attributes(span: trace.Span) -> int | None:
+    """How many more attributes the span can take under the budget."""
+    limit = _attribute_budget.max_attributes
+    if limit is None:
+        return None
+    # SDK spans expose what has been recorded so far; others just get the full budget
+    recorded = getattr(span, "attributes", None)
+    return max(limit - len(recorded), 0) if recorded else limit
+
+
 def record_attribute(span: trace.Span, key, value):
     """Record a single serializable value on the span."""
+    if not span.is_recording():
+        return
+
     if is_otel_serializable(value):
         span.set_attribute(key, value)
     else:
-        serialized = serialize_attribute(key, value)
+        serialized = serialize_attribute(key, value, _remaining_attributes(span))
         for attr_key, attr_value in serialized.items():
             span.set_attribute(attr_key, attr_value)
 
 
 def record_attributes(span: trace.Span, attributes: Dict[str, Any], prefix: str = ""):
     """Record a dict of attributes on the span after serialization."""
-    serialized = serialize_attributes(attributes, prefix)
+    if not span.is_recording():
+        return
+
+    serialized = serialize_attributes(attributes, prefix, _remaining_attributes(span))
     for attr_key, attr_value in serialized.items():
         span.set_attribute(attr_key, attr_value)
 
@@ -172,7 +330,13 @@ def get_tracer(context: "Context") -> trace.Tracer:
     """
     Get the OpenTelemetry tracer for the context.
     """
-    return getattr(context, "tracer", None) or trace.get_tracer("mcp-agent")
+    return getattr(context, "tracer", None) or _default_tracer()
+
+
+@functools.cache
+def _default_tracer() -> trace.Tracer:
+    # Before a global provider is set this is a proxy that delegates to it once set
+    return trace.get_tracer("mcp-agent")
 
 
 def annotate_span_for_call_tool_result(span: trace.Span, result: CallToolResult):
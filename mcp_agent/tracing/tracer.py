@@ -3,18 +3,57 @@ import uuid
 from opentelemetry import trace
 from opentelemetry.propagate import set_global_textmap
 from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace import SpanLimits, TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 
 from mcp_agent.config import OpenTelemetrySettings
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.tracing.file_span_exporter import FileSpanExporter
+from mcp_agent.tracing.telemetry import AttributeBudget, set_attribute_budget
 
 logger = get_logger(__name__)
 
 
+def _or_unset(limit: int | None) -> int:
+    """SpanLimits treats None as "use the default"; map it to "no limit" instead."""
+    return SpanLimits.UNSET if limit is None else limit
+
+
+def create_service_resource(
+    settings: OpenTelemetrySettings, session_id: str
+) -> Resource:
+    """Create the resource identifying this service, shared by traces and metrics."""
+    # pylint: disable=import-outside-toplevel (do not import if otel is not enabled)
+    from importlib.metadata import version
+
+    service_version = settings.service_version
+    if not service_version:
+        try:
+            service_version = version("mcp-agent")
+        # pylint: disable=broad-exception-caught
+        except Exception:
+            service_version = "unknown"
+
+    service_name = settings.service_name
+    service_instance_id = settings.service_instance_id or session_id
+
+    return Resource.create(
+        attributes={
+            key: value
+            for key, value in {
+                "service.name": service_name,
+                "service.instance.id": service_instance_id,
+                "service.version": service_version,
+                "session.id": session_id,
+            }.items()
+            if value is not None
+        }
+    )
+
+
 class TracingConfig:
     """Configuration for the tracing system."""
 
@@ -25,6 +64,7 @@ class TracingConfig:
 
     def __init__(self):
         self._tracer_provider = None
+        self._file_exporters: list[FileSpanExporter] = []
 
     async def configure(
         self,
@@ -57,42 +97,39 @@ class TracingConfig:
             if hasattr(self._tracer_provider, "shutdown"):
                 self._tracer_provider.shutdown()
             self._tracer_provider = None
+            self._file_exporters = []
 
         # Set up global textmap propagator first
         set_global_textmap(TraceContextTextMapPropagator())
 
-        # pylint: disable=import-outside-toplevel (do not import if otel is not enabled)
-        from importlib.metadata import version
-
-        service_version = settings.service_version
-        if not service_version:
-            try:
-                service_version = version("mcp-agent")
-            # pylint: disable=broad-exception-caught
-            except Exception:
-                service_version = "unknown"
-
         session_id = session_id or str(uuid.uuid4())
-
         service_name = settings.service_name
-        service_instance_id = settings.service_instance_id or session_id
-
-        # Create resource identifying this service
-        resource = Resource.create(
-            attributes={
-                key: value
-                for key, value in {
-                    "service.name": service_name,
-                    "service.instance.id": service_instance_id,
-                    "service.version": service_version,
-                    "session.id": session_id,
-                }.items()
-                if value is not None
-            }
+        resource = create_service_resource(settings, session_id)
+
+        # Bound the attributes recorded per span, both when flattening values
+        # (record_attributes) and in the SDK for attributes set directly
+        set_attribute_budget(
+            AttributeBudget(
+                max_attributes=settings.max_span_attributes,
+                max_value_length=settings.max_attribute_length,
+                max_depth=settings.max_attribute_depth,
+                payload_sample_rate=settings.payload_sample_rate,
+            )
         )
+        span_limits = SpanLimits(
+            max_span_attributes=_or_unset(settings.max_span_attributes),
+            max_event_attributes=_or_unset(settings.max_span_attributes),
+            max_attribute_length=_or_unset(settings.max_attribute_length),
+        )
+
+        # Sample whole traces, following the parent's decision for child spans.
+        # Unsampled spans don't record, which lets annotation code skip its work.
+        sampler = ParentBased(TraceIdRatioBased(settings.sample_rate))
 
         # Create provider with resource
-        tracer_provider = TracerProvider(resource=resource)
+        tracer_provider = TracerProvider(
+            resource=resource, sampler=sampler, span_limits=span_limits
+        )
 
         for exporter in settings.exporters:
             if exporter == "console":
@@ -113,16 +150,18 @@ class TracingConfig:
                         "OTLP exporter is enabled but no OTLP settings endpoint is provided."
                     )
             elif exporter == "file":
-                tracer_provider.add_span_processor(
-                    BatchSpanProcessor(
-                        FileSpanExporter(
-                            service_name=settings.service_name,
-                            session_id=session_id,
-                            path_settings=settings.path_settings,
-                            custom_path=settings.path,
-                        )
-                    )
+                file_exporter = FileSpanExporter(
+                    service_name=settings.service_name,
+                    session_id=session_id,
+                    path_settings=settings.path_settings,
+                    custom_path=settings.path,
+                    file_format=settings.file_format,
+                    max_bytes=settings.file_max_bytes,
+                    compress_rotated=settings.file_compress_rotated,
                 )
+                tracer_provider.add_span_processor(BatchSpanProcessor(file_exporter))
+                # The span processor doesn't flush its exporter, so do it in flush()
+                self._file_exporters.append(file_exporter)
                 continue
             else:
                 logger.error(
@@ -193,6 +232,10 @@ class TracingConfig:
             try:
                 # force_flush returns True if all spans were successfully flushed
                 success = self._tracer_provider.force_flush(timeout_millis=timeout_ms)
+                for exporter in self._file_exporters:
+                    success = (
+                        exporter.force_flush(timeout_millis=timeout_ms) and success
+                    )
                 if not success:
                     logger.warning(
                         f"Failed to flush all traces within {timeout_ms}ms timeout"
@@ -217,5 +260,6 @@ class TracingConfig:
                 logger.debug("Shutting down tracer provider")
                 self._tracer_provider.shutdown()
                 self._tracer_provider = None
+                self._file_exporters = []
             except Exception as e:
                 logger.error(f"Error shutting down tracer provider: {e}")
@@ -3,10 +3,15 @@ Helper utilities that are commonly used throughout the framework,
 but which do not belong to any specific module.
 """
 
+import datetime
 import functools
+import gzip
 import json
+import os
+import shutil
+from pathlib import Path
 from types import MethodType
-from typing import Any, List, Callable, TypeVar
+from typing import Any, Dict, List, Callable, Tuple, TypeVar
 
 from pydantic import BaseModel
 
@@ -39,15 +44,105 @@ def to_string(obj: BaseModel | dict) -> str:
         return json.dumps(obj)
 
 
-def ensure_serializable(data: BaseModel) -> BaseModel:
+def _to_jsonable(value: Any) -> Any:
+    # use `vars` to coerce nested data into dictionaries
+    return json.loads(json.dumps(value, default=lambda x: vars(x)))
+
+
+class SerializationCache:
+    """
+    Remembers the JSON-safe form of list items (e.g. chat messages) by identity.
+
+    An LLM's message history grows by a few messages per turn while the earlier
+    messages stay the same objects, so reusing one cache across a generation loop
+    only converts each message once, instead of the whole history every turn.
+
+    Cached items are treated as immutable snapshots. As a cheap guard, an entry
+    is only reused while the item's top-level fields (dict items, or attributes)
+    are still the same objects (or equal ones), so a message whose field was
+    reassigned (e.g. `message["content"] = ...`) is converted again. Changes
+    made inside a field in place are not detected; call `clear` after them.
+    """
+
+    def __init__(self):
+        # id -> (item, top-level fields when converted, JSON-safe form). Keeping
+        # a reference to each item means its id can't be reused while cached.
+        self._entries: Dict[int, Tuple[Any, Any, Any]] = {}
+
+    def to_jsonable(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self._item_to_jsonable(item) for item in value]
+        if isinstance(value, dict):
+            return {k: self.to_jsonable(v) for k, v in value.items()}
+        return _to_jsonable(value)
+
+    def _item_to_jsonable(self, item: Any) -> Any:
+        entry = self._entries.get(id(item))
+        if entry is not None and entry[0] is item and entry[1] == _fields(item):
+            return entry[2]
+
+        result = _to_jsonable(item)
+        self._entries[id(item)] = (item, _fields(item), result)
+        return result
+
+    def clear(self):
+        self._entries.clear()
+
+
+def _fields(item: Any) -> Tuple[Tuple[str, Any], ...] | None:
+    """The top-level fields of a dict or object, or None if it has none."""
+    fields = item if isinstance(item, dict) else getattr(item, "__dict__", None)
+    return tuple(fields.items()) if fields is not None else None
+
+
+def ensure_serializable(
+    data: BaseModel, cache: SerializationCache | None = None
+) -> BaseModel:
     """
     Workaround for https://github.com/pydantic/pydantic/issues/7713, see https://github.com/pydantic/pydantic/issues/7713#issuecomment-2604574418
+
+    This is only needed when `data` crosses a process boundary (see
+    Executor.crosses_process_boundary). Pass a `cache` that lives across calls
+    to avoid re-converting list items (e.g. messages) that were seen before.
+    """
+    if cache is None:
+        cache = SerializationCache()
+
+    data_obj = {
+        name: cache.to_jsonable(getattr(data, name)) for name in type(data).model_fields
+    }
+    return type(data)(**data_obj)
+
+
+def rotate_file(filepath: Path, compress: bool = True) -> Path:
     """
-    try:
-        json.dumps(data)
-    except TypeError:
-        # use `vars` to coerce nested data into dictionaries
-        data_json_from_dicts = json.dumps(data, default=lambda x: vars(x))  # type: ignore
-        data_obj = json.loads(data_json_from_dicts)
-        data = type(data)(**data_obj)
-    return data
+    Move `filepath` aside to `{stem}.{timestamp}{suffix}`, gzipping it if `compress`.
+    The caller must have closed the file. Returns the path of the rotated segment.
+    """
+    timestamp = datetime.datetime.now().strftime("%Y%m%dT%H%M%S")
+    rotated = filepath.with_name(f"{filepath.stem}.{timestamp}{filepath.suffix}")
+    counter = 1
+    while rotated.exists() or Path(f"{rotated}.gz").exists():
+        rotated = filepath.with_name(
+            f"{filepath.stem}.{timestamp}-{counter}{filepath.suffix}"
+        )
+        counter += 1
+
+    os.replace(filepath, rotated)
+
+    if compress:
+        rotated = compress_file(rotated)
+
+    return rotated
+
+
+def compress_file(filepath: Path) -> Path:
+    """Gzip `filepath` to `{filepath}.gz` and remove it. Returns the compressed path."""
+    compressed = Path(f"{filepath}.gz")
+    with (
+        open(filepath, "rb") as src,
+        gzip.open(compressed, "wb", compresslevel=6) as dst,
+    ):
+        shutil.copyfileobj(src, dst)
+    filepath.unlink()
+    return compressed
@@ -195,6 +195,9 @@ def apply_tool_filter(llm_instance, tool_filter: Optional[ToolFilter]):
     if not hasattr(llm_instance, "_filter_lock"):
         llm_instance._filter_lock = asyncio.Lock()
 
+    # Offered tools are filtered (and cached per filter) by Agent.list_tools_for_provider
+    llm_instance.tool_filter = tool_filter
+
     # If no filter, restore original method
     if tool_filter is None:
         if hasattr(llm_instance, "_original_generate"):
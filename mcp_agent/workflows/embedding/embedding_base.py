@@ -1,6 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, List
 
+import numpy as np
 from numpy import float32
 from numpy.typing import NDArray
 from sklearn.metrics.pairwise import cosine_similarity
@@ -14,6 +16,12 @@ FloatArray = NDArray[float32]
 class EmbeddingModel(ABC, ContextDependent):
     """Abstract interface for embedding models"""
 
+    max_batch_size: int = 256
+    """Maximum number of texts the provider accepts in one embedding request"""
+
+    max_concurrency: int = 4
+    """Maximum number of embedding requests embed_batched sends at once"""
+
     @abstractmethod
     async def embed(self, data: List[str]) -> FloatArray:
         """
@@ -31,6 +39,33 @@ class EmbeddingModel(ABC, ContextDependent):
     def embedding_dim(self) -> int:
         """Return the dimensionality of the embeddings"""
 
+    async def embed_batched(self, data: List[str]) -> FloatArray:
+        """
+        Generate embeddings for any number of texts, split into requests of at
+        most max_batch_size texts with up to max_concurrency requests in flight.
+
+        Returns:
+            Array of embeddings in input order, shape (len(data), embedding_dim)
+        """
+        if not data:
+            return np.empty((0, self.embedding_dim), dtype=float32)
+        if len(data) <= self.max_batch_size:
+            return await self.embed(data)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def embed_batch(batch: List[str]) -> FloatArray:
+            async with semaphore:
+                return await self.embed(batch)
+
+        batches = await asyncio.gather(
+            *(
+                embed_batch(data[start : start + self.max_batch_size])
+                for start in range(0, len(data), self.max_batch_size)
+            )
+        )
+        return np.concatenate(batches)
+
 
 def compute_similarity_scores(
     embedding_a: FloatArray, embedding_b: FloatArray
@@ -52,6 +87,38 @@ def compute_similarity_scores(
     }
 
 
+def normalize_embeddings(embeddings: FloatArray) -> FloatArray:
+    """
+    Stack embeddings into a float32 matrix with unit-length rows, so that a
+    matrix product with a normalized query gives cosine similarities.
+    Zero vectors stay zero, matching cosine_similarity.
+    """
+    matrix = np.asarray(embeddings, dtype=float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return matrix / norms
+
+
+def top_k_indices(scores: FloatArray, top_k: int) -> NDArray[np.intp]:
+    """
+    Indices of the top_k highest scores, highest first. Ties keep index order,
+    and -inf scores (entries masked out by the caller) are never returned.
+    """
+    candidates = int(np.count_nonzero(scores != -np.inf))
+    top_k = min(top_k, candidates)
+    if top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    if top_k < len(scores):
+        # Partial selection, then sort only the selected scores
+        indices = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        indices = np.arange(len(scores))
+    return indices[np.lexsort((indices, -scores[indices]))]
+
+
 def compute_confidence(similarity_scores: Dict[str, float]) -> float:
     """
     Compute overall confidence score from individual similarity metrics
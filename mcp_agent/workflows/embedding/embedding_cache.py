@@ -0,0 +1,235 @@
+import hashlib
+import os
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+import numpy as np
+from numpy import float32
+
+from mcp_agent.tracing.telemetry import get_tracer
+from mcp_agent.workflows.embedding.embedding_base import EmbeddingModel, FloatArray
+
+if TYPE_CHECKING:
+    from mcp_agent.core.context import Context
+
+
+class DiskEmbeddingStore:
+    """
+    An append-only store of embeddings on disk, for one model.
+
+    Embeddings are rows of a raw float32 matrix file that is memory-mapped for
+    reads. The index file holds the sha256 digest of each row's text, one per
+    line, in row order. Rows are appended to the matrix before their digests are
+    appended to the index, so a process that stops between the two leaves rows
+    without digests rather than digests without rows; loading trims both files
+    back to the rows that were written in full.
+
+    Only one process should write to a store at a time.
+    """
+
+    MATRIX_FILE = "embeddings.f32"
+    INDEX_FILE = "index.txt"
+
+    def __init__(self, path: str | Path, embedding_dim: int):
+        self.path = Path(path)
+        self.embedding_dim = embedding_dim
+        self._rows: Dict[str, int] = {}
+        self._row_count = 0
+        self._matrix: np.memmap | None = None
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def get(self, key: str) -> FloatArray | None:
+        """Return a copy of the embedding stored under key, or None."""
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        if self._matrix is None or row >= self._matrix.shape[0]:
+            self._matrix = self._map()
+        return np.array(self._matrix[row])
+
+    def add(self, keys: List[str], embeddings: FloatArray):
+        """Append embeddings, one row per key. Keys already stored are skipped."""
+        new = [i for i, key in enumerate(keys) if key not in self._rows]
+        if not new:
+            return
+
+        rows = np.ascontiguousarray(embeddings[new], dtype=float32)
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(self.path / self.MATRIX_FILE, "ab") as matrix_file:
+            matrix_file.write(rows.tobytes())
+        with open(self.path / self.INDEX_FILE, "a", encoding="utf-8") as index_file:
+            index_file.write("".join(f"{keys[i]}\n" for i in new))
+
+        for i in new:
+            self._rows[keys[i]] = self._row_count
+            self._row_count += 1
+
+    def _load(self):
+        """Read the index, keeping only digests whose rows were written in full."""
+        index_path = self.path / self.INDEX_FILE
+        matrix_path = self.path / self.MATRIX_FILE
+        if not index_path.exists() or not matrix_path.exists():
+            return
+
+        row_bytes = self.embedding_dim * float32().itemsize
+        matrix_size = os.path.getsize(matrix_path)
+        with open(index_path, encoding="utf-8") as index_file:
+            index = index_file.read()
+
+        # The last entry is empty, or a digest cut short by an interrupted write
+        keys = index.split("\n")[:-1]
+        self._row_count = min(len(keys), matrix_size // row_bytes)
+        keys = keys[: self._row_count]
+        for row, key in enumerate(keys):
+            self._rows.setdefault(key, row)
+
+        # Drop what an interrupted write left behind, so appends stay aligned
+        if matrix_size != self._row_count * row_bytes:
+            os.truncate(matrix_path, self._row_count * row_bytes)
+        if len(keys) * 65 != len(index):
+            with open(index_path, "w", encoding="utf-8") as index_file:
+                index_file.write("".join(f"{key}\n" for key in keys))
+
+    def _map(self) -> np.memmap:
+        return np.memmap(
+            self.path / self.MATRIX_FILE,
+            dtype=float32,
+            mode="r",
+            shape=(self._row_count, self.embedding_dim),
+        )
+
+
+class CachedEmbeddingModel(EmbeddingModel):
+    """
+    Wraps an embedding model with a content-addressed cache, keyed by the model
+    and the sha256 digest of each text.
+
+    Lookups go to an in-memory LRU tier first, then to an optional on-disk tier
+    that survives restarts. Only the texts missing from both are embedded, with
+    a single batched call to the wrapped model.
+
+    Example usage:
+        embedding_model = CachedEmbeddingModel(
+            OpenAIEmbeddingModel(model="text-embedding-3-small"),
+            cache_dir=".mcp-agent/embeddings",
+        )
+        router = await EmbeddingRouter.create(
+            embedding_model=embedding_model, server_names=["fetch", "filesystem"]
+        )
+    """
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModel,
+        cache_dir: str | Path | None = None,
+        memory_cache_size: int = 10000,
+        model_name: str | None = None,
+        context: Optional["Context"] = None,
+        **kwargs,
+    ):
+        """
+        Args:
+            embedding_model: The model to embed cache misses with
+            cache_dir: Directory of the on-disk tier. None keeps embeddings in memory only
+            memory_cache_size: Embeddings kept in the in-memory tier
+            model_name: Name the cache is keyed by. Defaults to the wrapped
+                model's `model` attribute, or its class name
+        """
+        super().__init__(context=context or embedding_model._context, **kwargs)
+        self.embedding_model = embedding_model
+        self.max_batch_size = embedding_model.max_batch_size
+        self.max_concurrency = embedding_model.max_concurrency
+        self.memory_cache_size = memory_cache_size
+        self.model_name = (
+            model_name
+            or getattr(embedding_model, "model", None)
+            or type(embedding_model).__name__
+        )
+
+        self._memory: "OrderedDict[str, FloatArray]" = OrderedDict()
+        self._disk: DiskEmbeddingStore | None = None
+        if cache_dir is not None:
+            # One store per model and dimension, in a directory named after both
+            model_dir = re.sub(r"[^\w.-]", "_", self.model_name)
+            self._disk = DiskEmbeddingStore(
+                Path(cache_dir) / f"{model_dir}-{self.embedding_dim}",
+                self.embedding_dim,
+            )
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def embedding_dim(self) -> int:
+        return self.embedding_model.embedding_dim
+
+    async def embed(self, data: List[str]) -> FloatArray:
+        tracer = get_tracer(self.context)
+        with tracer.start_as_current_span(f"{self.__class__.__name__}.embed") as span:
+            embeddings = np.empty((len(data), self.embedding_dim), dtype=float32)
+            keys = [self._key(text) for text in data]
+
+            # Positions of each text that is in neither tier, by key
+            missing: Dict[str, List[int]] = {}
+            for i, key in enumerate(keys):
+                if key in missing:
+                    missing[key].append(i)
+                    continue
+                embedding = self._lookup(key)
+                if embedding is None:
+                    missing[key] = [i]
+                else:
+                    embeddings[i] = embedding
+
+            hits = len(data) - sum(len(positions) for positions in missing.values())
+            self.hits += hits
+            self.misses += len(missing)
+
+            if missing:
+                miss_keys = list(missing)
+                miss_embeddings = await self.embedding_model.embed_batched(
+                    [data[positions[0]] for positions in missing.values()]
+                )
+                for key, embedding in zip(miss_keys, miss_embeddings):
+                    embeddings[missing[key]] = embedding
+                    self._remember(key, embedding)
+                if self._disk is not None:
+                    self._disk.add(miss_keys, miss_embeddings)
+
+            if self.context.tracing_enabled:
+                span.set_attribute("cache.hits", hits)
+                span.set_attribute("cache.misses", len(missing))
+
+            return embeddings
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _lookup(self, key: str) -> FloatArray | None:
+        embedding = self._memory.get(key)
+        if embedding is not None:
+            self._memory.move_to_end(key)
+            return embedding
+
+        if self._disk is not None:
+            embedding = self._disk.get(key)
+            if embedding is not None:
+                self._remember(key, embedding)
+        return embedding
+
+    def _remember(self, key: str, embedding: FloatArray):
+        """Add an embedding to the in-memory tier, evicting the least recently used."""
+        if self.memory_cache_size <= 0:
+            return
+        self._memory[key] = np.array(embedding, dtype=float32)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_cache_size:
+            self._memory.popitem(last=False)
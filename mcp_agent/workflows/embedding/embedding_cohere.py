@@ -1,6 +1,6 @@
 from typing import List, Optional, TYPE_CHECKING
 
-from cohere import Client
+from cohere import AsyncClient
 from numpy import array, float32
 
 from mcp_agent.tracing.semconv import (
@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 class CohereEmbeddingModel(EmbeddingModel):
     """Cohere embedding model implementation"""
 
+    max_batch_size = 96
+
     def __init__(
         self,
         model: str = "embed-multilingual-v3.0",
@@ -26,7 +28,7 @@ class CohereEmbeddingModel(EmbeddingModel):
         **kwargs,
     ):
         super().__init__(context=context, **kwargs)
-        self.client = Client(api_key=self.context.config.cohere.api_key)
+        self.client = AsyncClient(api_key=self.context.config.cohere.api_key)
         self.model = model
         # Cache the dimension since it's fixed per model
         # https://docs.cohere.com/v2/docs/cohere-embed
@@ -48,7 +50,7 @@ class CohereEmbeddingModel(EmbeddingModel):
             span.set_attribute("data", data)
             span.set_attribute("embedding_dim", self.embedding_dim)
 
-            response = self.client.embed(
+            response = await self.client.embed(
                 texts=data,
                 model=self.model,
                 input_type="classification",
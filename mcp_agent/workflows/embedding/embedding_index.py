@@ -0,0 +1,552 @@
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Collection, Dict, List, Literal, Tuple
+
+import numpy as np
+from numpy import float32
+
+from mcp_agent.logging.logger import get_logger
+from mcp_agent.workflows.embedding.embedding_base import (
+    FloatArray,
+    normalize_embeddings,
+    top_k_indices,
+)
+
+logger = get_logger(__name__)
+
+IndexBackend = Literal["exact", "hnsw"]
+"""
+exact: brute-force cosine similarity with NumPy. Exact results, linear cost per query.
+hnsw: approximate search over an HNSW graph. Sublinear cost per query. Requires hnswlib.
+"""
+
+SearchResult = List[Tuple[str, float]]
+"""The (id, cosine similarity) pairs found for one query, best first"""
+
+
+def text_digest(*texts: str) -> str:
+    """The sha256 hex digest of the texts an embedding is computed from."""
+    return hashlib.sha256(json.dumps(texts).encode("utf-8")).hexdigest()
+
+
+class EmbeddingIndex(ABC):
+    """
+    A cosine similarity index over embeddings, each stored under a string id.
+
+    Entries can be added, replaced and removed at any time, so an index can follow
+    the servers, agents or intents it was built for as they change. Each entry may
+    belong to a group, and searches can be limited to some of the groups. Each
+    entry may also record the digest of the text it was embedded from (see
+    text_digest), so that users of a saved index can tell whether an entry is
+    still current before reusing it.
+    Indexes are saved to a directory and loaded back with EmbeddingIndex.load.
+    """
+
+    backend: IndexBackend
+    """The name the index is saved under, used by load to pick the class"""
+
+    METADATA_FILE = "index.json"
+
+    def __init__(self, embedding_dim: int):
+        self.embedding_dim = embedding_dim
+        # Groups are stored as small integer codes
+        self._group_codes: Dict[str, int] = {}
+        self._digests: Dict[str, str] = {}
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of entries in the index"""
+
+    @abstractmethod
+    def __contains__(self, id: str) -> bool:
+        """Return whether an entry is stored under id"""
+
+    @property
+    @abstractmethod
+    def ids(self) -> List[str]:
+        """Return the ids of all entries"""
+
+    def add(
+        self,
+        ids: List[str],
+        embeddings: FloatArray,
+        group: str | None = None,
+        digests: List[str] | None = None,
+    ):
+        """
+        Add embeddings, one per id. Entries already stored under an id are replaced.
+
+        Args:
+            ids: Ids of the new entries
+            embeddings: Array of shape (len(ids), embedding_dim). Need not be normalized
+            group: Group of the new entries, for searches limited to some groups
+            digests: Digest of the text each embedding was computed from (see text_digest)
+        """
+        if not len(ids):
+            return
+        self._add(ids, embeddings, group)
+        for i, id in enumerate(ids):
+            if digests is None:
+                self._digests.pop(id, None)
+            else:
+                self._digests[id] = digests[i]
+
+    def remove(self, ids: Collection[str]):
+        """Remove the entries stored under ids. Unknown ids are ignored."""
+        self._remove(ids)
+        for id in ids:
+            self._digests.pop(id, None)
+
+    def digest(self, id: str) -> str | None:
+        """Return the digest the entry under id was added with, or None."""
+        return self._digests.get(id)
+
+    @abstractmethod
+    def get(self, ids: List[str]) -> FloatArray:
+        """Return the normalized embeddings stored under ids, shape (len(ids), embedding_dim)"""
+
+    @abstractmethod
+    def search(
+        self,
+        queries: FloatArray,
+        top_k: int = 1,
+        groups: Collection[str] | None = None,
+    ) -> List[SearchResult]:
+        """
+        Find the entries most similar to each query.
+
+        Args:
+            queries: Array of shape (n, embedding_dim). Need not be normalized
+            top_k: Maximum number of entries to return per query. May return fewer.
+            groups: Only return entries of these groups. None searches all entries
+
+        Returns:
+            One list of (id, cosine similarity) pairs per query, best first
+        """
+
+    def save(self, path: str | Path):
+        """Save the index to the directory at path, creating it if needed."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        metadata = {
+            "backend": self.backend,
+            "embedding_dim": self.embedding_dim,
+            "groups": list(self._group_codes),
+            "digests": self._digests,
+            **self._save(path),
+        }
+        with open(path / self.METADATA_FILE, "w", encoding="utf-8") as f:
+            json.dump(metadata, f)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "EmbeddingIndex":
+        """Load an index saved with save, whichever its backend."""
+        path = Path(path)
+        with open(path / cls.METADATA_FILE, encoding="utf-8") as f:
+            metadata = json.load(f)
+
+        index_cls = _INDEX_BACKENDS[metadata["backend"]]
+        if cls is not EmbeddingIndex and not issubclass(index_cls, cls):
+            raise ValueError(
+                f"Index at {path} is a {index_cls.__name__}, not a {cls.__name__}"
+            )
+        index = index_cls._load(path, metadata)
+        index._digests = dict(metadata.get("digests", {}))
+        return index
+
+    @abstractmethod
+    def _add(self, ids: List[str], embeddings: FloatArray, group: str | None):
+        """Add or replace the entries under ids (see add)."""
+
+    @abstractmethod
+    def _remove(self, ids: Collection[str]):
+        """Remove the entries under ids, ignoring unknown ones (see remove)."""
+
+    @abstractmethod
+    def _save(self, path: Path) -> dict:
+        """Write the entries under path and return the metadata needed to load them."""
+
+    @classmethod
+    @abstractmethod
+    def _load(cls, path: Path, metadata: dict) -> "EmbeddingIndex":
+        """Create an index from the files and metadata written by _save."""
+
+    def _group_code(self, group: str | None) -> int:
+        """Return the code of group, assigning one if needed. None is -1."""
+        if group is None:
+            return -1
+        return self._group_codes.setdefault(group, len(self._group_codes))
+
+    def _search_codes(self, groups: Collection[str] | None) -> List[int] | None:
+        """Return the codes of the groups a search is limited to, or None for all."""
+        if groups is None:
+            return None
+        return [self._group_codes[g] for g in groups if g in self._group_codes]
+
+
+class ExactEmbeddingIndex(EmbeddingIndex):
+    """
+    Brute-force cosine similarity over a normalized float32 matrix.
+
+    Queries are scored against every entry with one matrix product per block of
+    queries, so results are exact. Well suited to up to tens of thousands of entries.
+    """
+
+    backend = "exact"
+
+    SEARCH_BLOCK_SIZE = 1024
+    """Queries scored per matrix product, to bound memory use"""
+
+    MATRIX_FILE = "embeddings.npy"
+
+    def __init__(self, embedding_dim: int):
+        super().__init__(embedding_dim)
+        # Rows beyond _size are spare capacity for future adds
+        self._matrix = np.empty((0, embedding_dim), dtype=float32)
+        self._group_rows = np.empty(0, dtype=np.int32)
+        self._size = 0
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._rows
+
+    @property
+    def ids(self) -> List[str]:
+        return list(self._ids)
+
+    def _add(self, ids: List[str], embeddings: FloatArray, group: str | None):
+        embeddings = normalize_embeddings(embeddings)
+        code = self._group_code(group)
+
+        new_count = sum(1 for id in dict.fromkeys(ids) if id not in self._rows)
+        self._reserve(self._size + new_count)
+        for id, embedding in zip(ids, embeddings):
+            row = self._rows.get(id)
+            if row is None:
+                row = self._rows[id] = self._size
+                self._ids.append(id)
+                self._size += 1
+            self._matrix[row] = embedding
+            self._group_rows[row] = code
+
+    def _remove(self, ids: Collection[str]):
+        for id in ids:
+            row = self._rows.pop(id, None)
+            if row is None:
+                continue
+
+            # Move the last entry into the freed row
+            last = self._size - 1
+            if row != last:
+                last_id = self._ids[last]
+                self._matrix[row] = self._matrix[last]
+                self._group_rows[row] = self._group_rows[last]
+                self._ids[row] = last_id
+                self._rows[last_id] = row
+            self._ids.pop()
+            self._size -= 1
+
+    def get(self, ids: List[str]) -> FloatArray:
+        return self._matrix[[self._rows[id] for id in ids]]
+
+    def search(
+        self,
+        queries: FloatArray,
+        top_k: int = 1,
+        groups: Collection[str] | None = None,
+    ) -> List[SearchResult]:
+        queries = normalize_embeddings(queries)
+        if self._size == 0:
+            return [[] for _ in range(len(queries))]
+
+        matrix = self._matrix[: self._size]
+        codes = self._search_codes(groups)
+        excluded = (
+            None if codes is None else ~np.isin(self._group_rows[: self._size], codes)
+        )
+
+        results: List[SearchResult] = []
+        for start in range(0, len(queries), self.SEARCH_BLOCK_SIZE):
+            scores = queries[start : start + self.SEARCH_BLOCK_SIZE] @ matrix.T
+            if excluded is not None:
+                scores[:, excluded] = -np.inf
+            for row in scores:
+                results.append(
+                    [(self._ids[i], float(row[i])) for i in top_k_indices(row, top_k)]
+                )
+        return results
+
+    def _reserve(self, size: int):
+        """Grow the matrix so it holds at least size rows."""
+        capacity = len(self._matrix)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, 64)
+        matrix = np.empty((capacity, self.embedding_dim), dtype=float32)
+        matrix[: self._size] = self._matrix[: self._size]
+        group_rows = np.empty(capacity, dtype=np.int32)
+        group_rows[: self._size] = self._group_rows[: self._size]
+        self._matrix, self._group_rows = matrix, group_rows
+
+    def _save(self, path: Path) -> dict:
+        np.save(path / self.MATRIX_FILE, self._matrix[: self._size])
+        return {
+            "ids": self._ids,
+            "group_codes": self._group_rows[: self._size].tolist(),
+        }
+
+    @classmethod
+    def _load(cls, path: Path, metadata: dict) -> "ExactEmbeddingIndex":
+        index = cls(metadata["embedding_dim"])
+        index._group_codes = {g: code for code, g in enumerate(metadata["groups"])}
+        index._matrix = np.load(path / cls.MATRIX_FILE).astype(float32, copy=False)
+        index._group_rows = np.asarray(metadata["group_codes"], dtype=np.int32)
+        index._ids = list(metadata["ids"])
+        index._rows = {id: row for row, id in enumerate(index._ids)}
+        index._size = len(index._ids)
+        return index
+
+
+class HNSWEmbeddingIndex(EmbeddingIndex):
+    """
+    Approximate cosine similarity search over an HNSW graph, using hnswlib.
+
+    Query cost grows roughly logarithmically with the number of entries, at the
+    price of occasionally missing a true nearest neighbour. Raising ef_search
+    trades latency for recall; see benchmarks/bench_embedding_index.py.
+    Removed entries are marked deleted and their slots reused by later adds.
+    """
+
+    backend = "hnsw"
+
+    GRAPH_FILE = "hnsw.bin"
+
+    def __init__(
+        self,
+        embedding_dim: int,
+        max_elements: int = 1024,
+        M: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+    ):
+        """
+        Args:
+            embedding_dim: Dimensionality of the embeddings
+            max_elements: Initial capacity. The graph is resized as entries are added
+            M: Links per node. Higher values raise recall and memory use
+            ef_construction: Candidate list size while building the graph
+            ef_search: Candidate list size while searching, at least top_k
+        """
+        super().__init__(embedding_dim)
+        self.M = M
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+
+        self._graph = _import_hnswlib().Index(space="ip", dim=embedding_dim)
+        self._graph.init_index(
+            max_elements=max_elements,
+            M=M,
+            ef_construction=ef_construction,
+            allow_replace_deleted=True,
+        )
+        self._labels: Dict[str, int] = {}
+        self._label_ids: Dict[int, str] = {}
+        self._label_groups: Dict[int, int] = {}
+        self._next_label = 0
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._labels
+
+    @property
+    def ids(self) -> List[str]:
+        return list(self._labels)
+
+    def _add(self, ids: List[str], embeddings: FloatArray, group: str | None):
+        embeddings = normalize_embeddings(embeddings)
+        code = self._group_code(group)
+
+        # Existing entries are updated in place. Only new entries may take the
+        # slots of removed ones, or hnswlib would keep both copies of an entry
+        updates, inserts = [], []
+        for i, id in enumerate(ids):
+            label = self._labels.get(id)
+            if label is None:
+                label = self._labels[id] = self._next_label
+                self._label_ids[label] = id
+                self._next_label += 1
+                inserts.append((i, label))
+            else:
+                updates.append((i, label))
+            self._label_groups[label] = code
+
+        needed = self._graph.get_current_count() + len(inserts)
+        if needed > self._graph.get_max_elements():
+            self._graph.resize_index(max(needed, 2 * self._graph.get_max_elements()))
+        for items, replace_deleted in ((inserts, True), (updates, False)):
+            if items:
+                rows, labels = zip(*items)
+                self._graph.add_items(
+                    embeddings[list(rows)],
+                    np.asarray(labels, dtype=np.int64),
+                    replace_deleted=replace_deleted,
+                )
+
+    def _remove(self, ids: Collection[str]):
+        for id in ids:
+            label = self._labels.pop(id, None)
+            if label is None:
+                continue
+            self._graph.mark_deleted(label)
+            del self._label_ids[label]
+            del self._label_groups[label]
+
+    def get(self, ids: List[str]) -> FloatArray:
+        if not ids:
+            return np.empty((0, self.embedding_dim), dtype=float32)
+        labels = [self._labels[id] for id in ids]
+        return np.asarray(self._graph.get_items(labels), dtype=float32)
+
+    def search(
+        self,
+        queries: FloatArray,
+        top_k: int = 1,
+        groups: Collection[str] | None = None,
+    ) -> List[SearchResult]:
+        queries = normalize_embeddings(queries)
+        codes = self._search_codes(groups)
+        if codes is None:
+            candidates = len(self._labels)
+            label_filter = None
+        else:
+            allowed = set(codes)
+            candidates = sum(1 for c in self._label_groups.values() if c in allowed)
+            label_groups = self._label_groups
+
+            def label_filter(label: int) -> bool:
+                return label_groups.get(label) in allowed
+
+        k = min(top_k, candidates)
+        if k <= 0 or not len(queries):
+            return [[] for _ in range(len(queries))]
+
+        self._graph.set_ef(max(self.ef_search, k))
+        try:
+            labels, distances = self._query(queries, k, label_filter)
+        except RuntimeError:
+            # hnswlib raises when the search reaches fewer than k entries for a
+            # query, which filters make more likely; retry each query alone
+            return [self._search_one(query, k, label_filter) for query in queries]
+        return [
+            self._results(row, distance) for row, distance in zip(labels, distances)
+        ]
+
+    def _query(self, queries: FloatArray, k: int, label_filter):
+        # Python filters are called under the GIL, so threads only add contention
+        return self._graph.knn_query(
+            queries,
+            k=k,
+            num_threads=1 if label_filter else -1,
+            filter=label_filter,
+        )
+
+    def _search_one(self, query: FloatArray, k: int, label_filter) -> SearchResult:
+        while k > 0:
+            try:
+                labels, distances = self._query(query[None], k, label_filter)
+                return self._results(labels[0], distances[0])
+            except RuntimeError:
+                k //= 2
+        return []
+
+    def _results(self, labels, distances) -> SearchResult:
+        # Inner product distance is 1 - similarity
+        return [
+            (self._label_ids[int(label)], 1.0 - float(distance))
+            for label, distance in zip(labels, distances)
+        ]
+
+    def _save(self, path: Path) -> dict:
+        self._graph.save_index(str(path / self.GRAPH_FILE))
+        return {
+            "M": self.M,
+            "ef_construction": self.ef_construction,
+            "ef_search": self.ef_search,
+            "labels": self._labels,
+            "label_groups": [
+                self._label_groups[label] for label in self._labels.values()
+            ],
+            "next_label": self._next_label,
+            "max_elements": self._graph.get_max_elements(),
+        }
+
+    @classmethod
+    def _load(cls, path: Path, metadata: dict) -> "HNSWEmbeddingIndex":
+        index = cls(
+            metadata["embedding_dim"],
+            max_elements=1,
+            M=metadata["M"],
+            ef_construction=metadata["ef_construction"],
+            ef_search=metadata["ef_search"],
+        )
+        index._graph.load_index(
+            str(path / cls.GRAPH_FILE),
+            max_elements=metadata["max_elements"],
+            allow_replace_deleted=True,
+        )
+        index._group_codes = {g: code for code, g in enumerate(metadata["groups"])}
+        index._labels = dict(metadata["labels"])
+        index._label_ids = {label: id for id, label in index._labels.items()}
+        index._label_groups = dict(
+            zip(index._labels.values(), metadata["label_groups"])
+        )
+        index._next_label = metadata["next_label"]
+        return index
+
+
+_INDEX_BACKENDS: Dict[str, type[EmbeddingIndex]] = {
+    ExactEmbeddingIndex.backend: ExactEmbeddingIndex,
+    HNSWEmbeddingIndex.backend: HNSWEmbeddingIndex,
+}
+
+
+def _import_hnswlib():
+    try:
+        import hnswlib
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            "HNSWEmbeddingIndex requires hnswlib. Install it with `pip install hnswlib`."
+        ) from e
+    return hnswlib
+
+
+def create_embedding_index(
+    embedding_dim: int, backend: IndexBackend = "exact", **kwargs
+) -> EmbeddingIndex:
+    """
+    Create an empty index. The hnsw backend falls back to exact search if
+    hnswlib is not installed.
+
+    Args:
+        embedding_dim: Dimensionality of the embeddings
+        backend: "exact" or "hnsw"
+        kwargs: Passed to the index class, e.g. M or ef_search for hnsw
+    """
+    if backend == "hnsw":
+        try:
+            _import_hnswlib()
+        except ModuleNotFoundError:
+            logger.warning(
+                "hnswlib is not installed; using exact search for the embedding index. "
+                "Install hnswlib for approximate search over large indexes."
+            )
+            return ExactEmbeddingIndex(embedding_dim)
+    return _INDEX_BACKENDS[backend](embedding_dim, **kwargs)
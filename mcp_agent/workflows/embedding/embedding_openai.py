@@ -1,7 +1,7 @@
 from typing import List, Optional, TYPE_CHECKING
 
 from numpy import array, float32, stack
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from mcp_agent.tracing.semconv import (
     GEN_AI_OPERATION_NAME,
@@ -19,11 +19,13 @@ if TYPE_CHECKING:
 class OpenAIEmbeddingModel(EmbeddingModel):
     """OpenAI embedding model implementation"""
 
+    max_batch_size = 2048
+
     def __init__(
         self, model: str = "text-embedding-3-small", context: Optional["Context"] = None
     ):
         super().__init__(context=context)
-        self.client = OpenAI(api_key=self.context.config.openai.api_key)
+        self.client = AsyncOpenAI(api_key=self.context.config.openai.api_key)
         self.model = model
         # Cache the dimension since it's fixed per model
         self._embedding_dim = {
@@ -39,7 +41,7 @@ class OpenAIEmbeddingModel(EmbeddingModel):
             span.set_attribute("data", data)
             span.set_attribute("embedding_dim", self.embedding_dim)
 
-            response = self.client.embeddings.create(
+            response = await self.client.embeddings.create(
                 model=self.model, input=data, encoding_format="float"
             )
 
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, TYPE_CHECKING
 from pydantic import BaseModel, Field
@@ -81,6 +82,26 @@ class IntentClassifier(ABC, ContextDependent):
             List of classification results, ordered by confidence
         """
 
+    async def classify_many(
+        self, requests: List[str], top_k: int = 1
+    ) -> List[List[IntentClassificationResult]]:
+        """
+        Classify several input requests. Returns one list of results per request,
+        in the order of the requests.
+
+        The default implementation classifies each request concurrently.
+        Subclasses override it when requests can be classified more efficiently together.
+
+        Args:
+            requests: The input texts to classify
+            top_k: Maximum number of top intent matches to return per request
+        """
+        return list(
+            await asyncio.gather(
+                *(self.classify(request, top_k) for request in requests)
+            )
+        )
+
     async def initialize(self):
         """Initialize the classifier. Override this method if needed."""
         self.initialized = True
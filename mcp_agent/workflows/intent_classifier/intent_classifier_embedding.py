@@ -1,15 +1,21 @@
-from typing import List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
+import numpy as np
 from numpy import mean
 from pydantic import ConfigDict
 
 from mcp_agent.tracing.semconv import GEN_AI_REQUEST_TOP_K
-from mcp_agent.tracing.telemetry import get_tracer, record_attributes
-from mcp_agent.workflows.embedding.embedding_base import (
-    FloatArray,
-    EmbeddingModel,
-    compute_confidence,
-    compute_similarity_scores,
+from mcp_agent.tracing.telemetry import (
+    get_tracer,
+    record_attributes,
+    should_capture_payload,
+)
+from mcp_agent.workflows.embedding.embedding_base import FloatArray, EmbeddingModel
+from mcp_agent.workflows.embedding.embedding_index import (
+    EmbeddingIndex,
+    ExactEmbeddingIndex,
+    SearchResult,
+    text_digest,
 )
 from mcp_agent.workflows.intent_classifier.intent_classifier_base import (
     Intent,
@@ -46,11 +52,20 @@ class EmbeddingIntentClassifier(IntentClassifier):
         self,
         intents: List[Intent],
         embedding_model: EmbeddingModel,
+        index: EmbeddingIndex | None = None,
         context: Optional["Context"] = None,
         **kwargs,
     ):
+        """
+        Args:
+            index: Similarity index of the intent embeddings, keyed by intent name.
+                Intents already in the index with the same texts are not embedded
+                again, so a saved index can be reused with EmbeddingIndex.load.
+                Defaults to an empty ExactEmbeddingIndex
+        """
         super().__init__(intents=intents, context=context, **kwargs)
         self.embedding_model = embedding_model
+        self.index = index or ExactEmbeddingIndex(embedding_model.embedding_dim)
         self.initialized = False
 
     @classmethod
@@ -58,6 +73,7 @@ class EmbeddingIntentClassifier(IntentClassifier):
         cls,
         intents: List[Intent],
         embedding_model: EmbeddingModel,
+        index: EmbeddingIndex | None = None,
     ) -> "EmbeddingIntentClassifier":
         """
         Factory method to create and initialize a classifier.
@@ -66,6 +82,7 @@ class EmbeddingIntentClassifier(IntentClassifier):
         instance = cls(
             intents=intents,
             embedding_model=embedding_model,
+            index=index,
         )
         await instance.initialize()
         return instance
@@ -73,29 +90,77 @@ class EmbeddingIntentClassifier(IntentClassifier):
     async def initialize(self):
         """
         Precompute embeddings for all intents by combining their
-        descriptions and examples
+        descriptions and examples. The texts of the intents missing from the
+        index are embedded together, in as few batched requests as the
+        embedding model allows.
         """
         if self.initialized:
             return
 
-        for intent in self.intents.values():
-            # Combine all text for a rich intent representation
-            intent_texts = [intent.name, intent.description] + intent.examples
+        # Entries left in the index by intents that no longer exist
+        self.index.remove([id for id in self.index.ids if id not in self.intents])
+        await self._embed_intents(list(self.intents.values()))
+        self.initialized = True
 
-            # Get embeddings for all texts
-            embeddings = await self.embedding_model.embed(intent_texts)
+    async def add_intents(self, intents: List[Intent]):
+        """
+        Add intents to classify into, embedding only new or changed intents.
+        Intents with the same name as existing ones replace them.
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        await self._embed_intents(intents)
+
+    def remove_intents(self, names: List[str]):
+        """Stop classifying into the intents with these names."""
+        for name in names:
+            self.intents.pop(name, None)
+        self.index.remove(names)
 
+    async def _embed_intents(self, intents: List[Intent]):
+        """
+        Give intents embeddings and add them to the index and the intents dict.
+        Embeddings already in the index under an intent's name are reused if they
+        were computed from the same texts.
+        """
+        # Combine all text for a rich intent representation, remembering
+        # which rows of the batch belong to each intent
+        texts: List[str] = []
+        intent_rows: Dict[str, slice] = {}
+        digests: List[str] = []
+        for intent in intents:
+            intent_texts = [intent.name]
+            if intent.description:
+                intent_texts.append(intent.description)
+            intent_texts.extend(intent.examples)
+            digest = text_digest(*intent_texts)
+            if self.index.digest(intent.name) == digest:
+                continue
+            intent_rows[intent.name] = slice(len(texts), len(texts) + len(intent_texts))
+            texts.extend(intent_texts)
+            digests.append(digest)
+
+        embeddings = await self.embedding_model.embed_batched(texts)
+        if intent_rows:
             # Use mean pooling to combine embeddings
-            embedding = mean(embeddings, axis=0)
+            self.index.add(
+                list(intent_rows),
+                np.stack(
+                    [mean(embeddings[rows], axis=0) for rows in intent_rows.values()]
+                ),
+                digests=digests,
+            )
 
+        names = [intent.name for intent in intents]
+        stored = self.index.get(names) if names else []
+        for intent, embedding in zip(intents, stored):
             # Create intents with embeddings
             self.intents[intent.name] = EmbeddingIntent(
-                **intent.model_dump(),
+                **intent.model_dump(exclude={"embedding"}),
                 embedding=embedding,
             )
 
-        self.initialized = True
-
     async def classify(
         self, request: str, top_k: int = 1
     ) -> List[IntentClassificationResult]:
@@ -113,66 +178,86 @@ class EmbeddingIntentClassifier(IntentClassifier):
         with tracer.start_as_current_span(
             f"{self.__class__.__name__}.classify"
         ) as span:
-            if self.context.tracing_enabled:
-                span.set_attribute("request", request)
+            # Skip building attributes for spans that aren't sampled
+            tracing = self.context.tracing_enabled and span.is_recording()
+            if tracing:
+                if should_capture_payload(span):
+                    span.set_attribute("request", request)
                 span.set_attribute("intents", list(self.intents.keys()))
-                for intent in self.intents.values():
-                    span.set_attribute(
-                        f"intent.{intent.name}.description", intent.description
-                    )
-                    if intent.examples:
-                        span.set_attribute(
-                            f"intent.{intent.name}.examples", intent.examples
-                        )
-                    if intent.metadata:
-                        record_attributes(
-                            span, intent.metadata, f"intent.{intent.name}.metadata"
-                        )
                 span.set_attribute(GEN_AI_REQUEST_TOP_K, top_k)
 
             if not self.initialized:
                 await self.initialize()
 
+            if not len(self.index):
+                return []
+
             # Get embedding for input
             embeddings = await self.embedding_model.embed([request])
-            request_embedding = embeddings[
-                0
-            ]  # Take first since we only embedded one text
-
-            results: List[IntentClassificationResult] = []
-            for intent_name, intent in self.intents.items():
-                if intent.embedding is None:
-                    continue
-
-                similarity_scores = compute_similarity_scores(
-                    request_embedding, intent.embedding
-                )
-
-                # Compute overall confidence score
-                confidence = compute_confidence(similarity_scores)
-
-                if self.context.tracing_enabled:
-                    span.set_attribute(
-                        f"classification.{intent_name}.p_score", confidence
-                    )
-                    for metric, score in similarity_scores.items():
-                        span.set_attribute(
-                            f"classification.{intent_name}.{metric}", score
-                        )
-
-                results.append(
-                    IntentClassificationResult(
-                        intent=intent_name,
-                        p_score=confidence,
-                    )
-                )
-
-            results.sort(key=lambda x: x.p_score, reverse=True)
-            top_results = results[:top_k]
-
-            if self.context.tracing_enabled:
+            matches = self.index.search(embeddings[:1], top_k)[0]
+            top_results = self._results(matches)
+
+            if tracing:
                 for i, result in enumerate(top_results):
                     span.set_attribute(f"result.{i}.intent", result.intent)
                     span.set_attribute(f"result.{i}.p_score", result.p_score)
 
+                # Per-intent details go last, so that with many intents the
+                # attribute budget cuts them rather than the results
+                classification_attributes: Dict[str, Dict[str, float]] = {
+                    name: {"p_score": score, "cosine": score} for name, score in matches
+                }
+                record_attributes(span, classification_attributes, "classification")
+                intent_attributes: Dict[str, Dict[str, Any]] = {}
+                for intent in self.intents.values():
+                    attributes = {"description": intent.description}
+                    if intent.examples:
+                        attributes["examples"] = intent.examples
+                    if intent.metadata:
+                        attributes["metadata"] = intent.metadata
+                    intent_attributes[intent.name] = attributes
+                record_attributes(span, intent_attributes, "intent")
+
             return top_results
+
+    async def classify_many(
+        self, requests: List[str], top_k: int = 1
+    ) -> List[List[IntentClassificationResult]]:
+        """
+        Classify several requests. The requests are embedded in provider-sized
+        batches and searched for together.
+
+        Args:
+            requests: Input texts to classify
+            top_k: Maximum number of top matches to return per request
+
+        Returns:
+            One list of classification results per request, ordered by confidence
+        """
+        tracer = get_tracer(self.context)
+        with tracer.start_as_current_span(
+            f"{self.__class__.__name__}.classify_many"
+        ) as span:
+            if self.context.tracing_enabled and span.is_recording():
+                span.set_attribute("requests.count", len(requests))
+                span.set_attribute("intents", list(self.intents.keys()))
+                span.set_attribute(GEN_AI_REQUEST_TOP_K, top_k)
+
+            if not self.initialized:
+                await self.initialize()
+
+            if not len(self.index) or not requests:
+                return [[] for _ in requests]
+
+            request_embeddings = await self.embedding_model.embed_batched(requests)
+            return [
+                self._results(matches)
+                for matches in self.index.search(request_embeddings, top_k)
+            ]
+
+    def _results(self, matches: SearchResult) -> List[IntentClassificationResult]:
+        """Turn the intents found for one request into results, best first."""
+        return [
+            IntentClassificationResult(intent=name, p_score=score)
+            for name, score in matches
+        ]
@@ -1,6 +1,7 @@
 from typing import List, Optional, TYPE_CHECKING
 
 from mcp_agent.workflows.embedding.embedding_cohere import CohereEmbeddingModel
+from mcp_agent.workflows.embedding.embedding_index import EmbeddingIndex
 from mcp_agent.workflows.intent_classifier.intent_classifier_base import Intent
 from mcp_agent.workflows.intent_classifier.intent_classifier_embedding import (
     EmbeddingIntentClassifier,
@@ -32,6 +33,7 @@ class CohereEmbeddingIntentClassifier(EmbeddingIntentClassifier):
         cls,
         intents: List[Intent],
         embedding_model: CohereEmbeddingModel | None = None,
+        index: EmbeddingIndex | None = None,
         context: Optional["Context"] = None,
     ) -> "CohereEmbeddingIntentClassifier":
         """
@@ -39,7 +41,10 @@ class CohereEmbeddingIntentClassifier(EmbeddingIntentClassifier):
         Use this instead of constructor since we need async initialization.
         """
         instance = cls(
-            intents=intents, embedding_model=embedding_model, context=context
+            intents=intents,
+            embedding_model=embedding_model,
+            index=index,
+            context=context,
         )
         await instance.initialize()
         return instance
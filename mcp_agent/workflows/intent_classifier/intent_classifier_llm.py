@@ -1,9 +1,12 @@
-from typing import List, Literal, Optional, TYPE_CHECKING
+import asyncio
+from typing import Dict, List, Literal, Optional, TYPE_CHECKING
+
+from opentelemetry import trace
 from pydantic import BaseModel
 
 from mcp_agent.tracing.semconv import GEN_AI_REQUEST_TOP_K
 from mcp_agent.tracing.telemetry import get_tracer, record_attributes
-from mcp_agent.workflows.llm.augmented_llm import AugmentedLLM
+from mcp_agent.workflows.llm.augmented_llm import AugmentedLLM, RequestParams
 from mcp_agent.workflows.intent_classifier.intent_classifier_base import (
     Intent,
     IntentClassifier,
@@ -44,6 +47,42 @@ Return up to {top_k} most likely intents. Only include intents with reasonable c
 If no intents match well, return an empty list.
 """
 
+DEFAULT_BATCH_INTENT_CLASSIFICATION_INSTRUCTION = """
+You are a precise intent classifier that analyzes user requests to determine their intended action or purpose.
+Below are the available intents with their descriptions and examples:
+
+{context}
+
+Your task is to analyze each of the following numbered requests independently and determine its most likely intent(s). Consider:
+- How well the request matches the intent descriptions and examples
+- Any specific entities or parameters that should be extracted
+- The confidence level in the classification
+
+{requests}
+
+Respond in JSON format, with one entry per request:
+{{
+    "requests": [
+        {{
+            "request_index": <request number>,
+            "classifications": [
+                {{
+                    "intent": <intent name>,
+                    "confidence": <float between 0 and 1>,
+                    "extracted_entities": {{
+                        "entity_name": "entity_value"
+                    }},
+                    "reasoning": <brief explanation>
+                }}
+            ]
+        }}
+    ]
+}}
+
+Return up to {top_k} most likely intents per request. Only include intents with reasonable confidence (>0.5).
+If no intents match a request well, return an empty list for it.
+"""
+
 
 class LLMIntentClassificationResult(IntentClassificationResult):
     """The result of intent classification using an LLM."""
@@ -61,6 +100,21 @@ class StructuredIntentResponse(BaseModel):
     classifications: List[LLMIntentClassificationResult]
 
 
+class StructuredRequestIntentResponse(BaseModel):
+    """The classifications of one request of a batch"""
+
+    request_index: int
+    """The number of the request in the prompt, starting at 1"""
+
+    classifications: List[LLMIntentClassificationResult]
+
+
+class StructuredBatchIntentResponse(BaseModel):
+    """The complete structured response from the LLM to a batch of requests"""
+
+    requests: List[StructuredRequestIntentResponse]
+
+
 class LLMIntentClassifier(IntentClassifier):
     """
     An intent classifier that uses an LLM to determine the user's intent.
@@ -70,6 +124,12 @@ class LLMIntentClassifier(IntentClassifier):
     - Entity extraction alongside classification
     """
 
+    requests_per_prompt: int = 10
+    """Maximum number of requests classify_many packs into one prompt"""
+
+    max_concurrent_prompts: int = 4
+    """Maximum number of classification prompts classify_many has in flight at once"""
+
     def __init__(
         self,
         llm: AugmentedLLM,
@@ -163,18 +223,7 @@ class LLMIntentClassifier(IntentClassifier):
             if not response or not response.classifications:
                 return []
 
-            results = []
-            for classification in response.classifications:
-                intent = self.intents.get(classification.intent)
-                if not intent:
-                    span.record_exception(
-                        ValueError(f"Invalid intent name '{classification.intent}'")
-                    )
-                    # Skip invalid categories
-                    # TODO: saqadri - log or raise an error
-                    continue
-
-                results.append(classification)
+            results = self._valid_classifications(response.classifications, span)
 
             top_results = results[:top_k]
 
@@ -188,6 +237,109 @@ class LLMIntentClassifier(IntentClassifier):
 
             return top_results
 
+    async def classify_many(
+        self, requests: List[str], top_k: int = 1
+    ) -> List[List[LLMIntentClassificationResult]]:
+        """
+        Classify several requests, packing up to requests_per_prompt of them into
+        each prompt. With a custom classification_instruction, which only has
+        room for one request, each request is classified with its own prompt.
+        """
+        if self.classification_instruction:
+            return await super().classify_many(requests, top_k)
+
+        tracer = get_tracer(self.context)
+        with tracer.start_as_current_span(
+            f"{self.__class__.__name__}.classify_many"
+        ) as span:
+            if self.context.tracing_enabled:
+                span.set_attribute("requests.count", len(requests))
+                span.set_attribute("intents", list(self.intents.keys()))
+                span.set_attribute(GEN_AI_REQUEST_TOP_K, top_k)
+
+            if not self.initialized:
+                await self.initialize()
+
+            semaphore = asyncio.Semaphore(self.max_concurrent_prompts)
+
+            async def classify_chunk(
+                chunk: List[str],
+            ) -> List[List[LLMIntentClassificationResult]]:
+                async with semaphore:
+                    return await self._classify_chunk(chunk, top_k)
+
+            chunks = await asyncio.gather(
+                *(
+                    classify_chunk(requests[start : start + self.requests_per_prompt])
+                    for start in range(0, len(requests), self.requests_per_prompt)
+                )
+            )
+            return [results for chunk in chunks for results in chunk]
+
+    async def _classify_chunk(
+        self, requests: List[str], top_k: int
+    ) -> List[List[LLMIntentClassificationResult]]:
+        """Classify a chunk of requests with a single prompt."""
+        tracer = get_tracer(self.context)
+        with tracer.start_as_current_span(
+            f"{self.__class__.__name__}._classify_chunk"
+        ) as span:
+            requests_text = "\n\n".join(
+                f"Request {index}: {request}"
+                for index, request in enumerate(requests, 1)
+            )
+            prompt = DEFAULT_BATCH_INTENT_CLASSIFICATION_INSTRUCTION.format(
+                context=self._generate_context(), requests=requests_text, top_k=top_k
+            )
+
+            # Chunks are classified concurrently, so each prompt must stand alone
+            response = await self.llm.generate_structured(
+                message=prompt,
+                response_model=StructuredBatchIntentResponse,
+                request_params=RequestParams(use_history=False),
+            )
+
+            if self.context.tracing_enabled:
+                span.set_attribute("requests.count", len(requests))
+                span.add_event("classification.response", {"prompt": prompt})
+
+            classifications_by_index: Dict[
+                int, List[LLMIntentClassificationResult]
+            ] = {}
+            if response and response.requests:
+                for r in response.requests:
+                    classifications_by_index.setdefault(
+                        r.request_index, r.classifications
+                    )
+
+            # Requests the response left out get no classifications
+            return [
+                self._valid_classifications(
+                    classifications_by_index.get(index, []), span
+                )[:top_k]
+                for index in range(1, len(requests) + 1)
+            ]
+
+    def _valid_classifications(
+        self,
+        classifications: List[LLMIntentClassificationResult],
+        span: trace.Span,
+    ) -> List[LLMIntentClassificationResult]:
+        """Drop classifications whose intent is not one of the known intents."""
+        results = []
+        for classification in classifications:
+            intent = self.intents.get(classification.intent)
+            if not intent:
+                span.record_exception(
+                    ValueError(f"Invalid intent name '{classification.intent}'")
+                )
+                # Skip invalid categories
+                # TODO: saqadri - log or raise an error
+                continue
+
+            results.append(classification)
+        return results
+
     def _extract_classification_attributes_for_tracing(
         self, classification: LLMIntentClassificationResult, prefix: str = ""
     ) -> dict:
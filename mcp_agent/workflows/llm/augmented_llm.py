@@ -1,9 +1,14 @@
+import asyncio
+import json
 from abc import abstractmethod
 
 from typing import (
     Any,
+    AsyncIterator,
+    Dict,
     Generic,
     List,
+    Literal,
     Optional,
     Protocol,
     Type,
@@ -39,6 +44,7 @@ from mcp_agent.tracing.telemetry import (
     get_tracer,
     record_attribute,
     record_attributes,
+    should_capture_payload,
 )
 from mcp_agent.workflows.llm.llm_selector import ModelSelector
 
@@ -46,6 +52,7 @@ if TYPE_CHECKING:
     from mcp_agent.core.context import Context
     from mcp_agent.logging.logger import Logger
     from mcp_agent.agents.agent import Agent
+    from mcp_agent.utils.tool_filter import ToolFilter
 
 
 MessageParamT = TypeVar("MessageParamT")
@@ -164,6 +171,134 @@ class RequestParams(CreateMessageRequestParams):
     """
 
 
+class StreamEvent(BaseModel):
+    """
+    An incremental event emitted by AugmentedLLM.generate_stream.
+    """
+
+    type: Literal["text_delta", "tool_call", "tool_result", "message"]
+    """
+    - text_delta: a chunk of generated text, in `text`
+    - tool_call: a tool call whose arguments are complete and which has been started
+    - tool_result: the provider message holding a tool call's result, in `message`
+    - message: the complete response message of an iteration, in `message`
+    """
+
+    iteration: int = 0
+    """The generation loop iteration that produced the event."""
+
+    text: str | None = None
+    tool_call_id: str | None = None
+    tool_name: str | None = None
+    arguments: str | None = None
+    """The JSON-encoded tool call arguments."""
+
+    message: Any = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class StreamedToolCall(BaseModel):
+    """A tool call assembled from streamed deltas."""
+
+    index: int
+    id: str | None = None
+    name: str = ""
+    arguments: str = ""
+
+
+class ToolCallAssembler:
+    """
+    Assembles tool calls from incremental stream deltas, and reports each call
+    as soon as its JSON arguments are complete, so that it can be started while
+    the rest of the response is still streaming.
+    """
+
+    def __init__(self):
+        self._calls: Dict[int, StreamedToolCall] = {}
+        self._completed: set[int] = set()
+
+    def add_delta(
+        self,
+        index: int,
+        id: str | None = None,
+        name: str | None = None,
+        arguments: str | None = None,
+    ) -> List[StreamedToolCall]:
+        """
+        Add a delta for the tool call at `index`.
+        Returns the tool calls that became complete as a result.
+        """
+        completed: List[StreamedToolCall] = []
+
+        # A delta for a new tool call means every earlier call is complete
+        for other in self._calls.values():
+            if other.index < index and other.index not in self._completed:
+                self._completed.add(other.index)
+                completed.append(other)
+
+        call = self._calls.get(index)
+        if call is None:
+            call = self._calls[index] = StreamedToolCall(index=index)
+        if id:
+            call.id = id
+        if name:
+            call.name += name
+        if arguments:
+            call.arguments += arguments
+
+        if index not in self._completed and self._arguments_complete(call):
+            self._completed.add(index)
+            completed.append(call)
+
+        return completed
+
+    def flush(self) -> List[StreamedToolCall]:
+        """Mark all remaining tool calls complete (e.g. at the end of the stream)."""
+        remaining = [c for c in self.calls if c.index not in self._completed]
+        self._completed.update(c.index for c in remaining)
+        return remaining
+
+    @property
+    def calls(self) -> List[StreamedToolCall]:
+        return [self._calls[i] for i in sorted(self._calls)]
+
+    @staticmethod
+    def _arguments_complete(call: StreamedToolCall) -> bool:
+        # Only attempt a parse when the arguments could be a complete JSON object
+        if not call.id or not call.name or not call.arguments.rstrip().endswith("}"):
+            return False
+        try:
+            json.loads(call.arguments)
+            return True
+        except json.JSONDecodeError:
+            return False
+
+
+class StreamingToolCalls:
+    """
+    Runs tool calls started during streaming concurrently with the rest of the
+    stream, and collects their results in the order they were started.
+    """
+
+    def __init__(self):
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self, coro) -> None:
+        self._tasks.append(asyncio.create_task(coro))
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def results(self) -> List[Any | BaseException]:
+        return await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def cancel(self) -> None:
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+
+
 class AugmentedLLMProtocol(Protocol, Generic[MessageParamT, MessageT]):
     """Protocol defining the interface for augmented LLMs"""
 
@@ -181,6 +316,13 @@ class AugmentedLLMProtocol(Protocol, Generic[MessageParamT, MessageT]):
     ) -> str:
         """Request an LLM generation and return the string representation of the result"""
 
+    def generate_stream(
+        self,
+        message: MessageTypes,
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """Request an LLM generation and stream the result as it is produced"""
+
     async def generate_structured(
         self,
         message: MessageTypes,
@@ -224,11 +366,12 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol[MessageParamT, Message
     selecting appropriate tools, and determining what information to retain.
     """
 
-    # TODO: saqadri - add streaming support (e.g. generate_stream)
     # TODO: saqadri - consider adding middleware patterns for pre/post processing of messages, for now we have pre/post_tool_call
 
     provider: str | None = None
     logger: Union["Logger", None] = None
+    tool_filter: Union["ToolFilter", None] = None
+    """Limits the tools offered to the LLM (see apply_tool_filter)"""
 
     def __init__(
         self,
@@ -310,6 +453,30 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol[MessageParamT, Message
     ) -> ModelT:
         """Request a structured LLM generation and return the result as a Pydantic model."""
 
+    async def generate_stream(
+        self,
+        message: MessageTypes,
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Request an LLM generation, yielding text deltas, tool calls and tool results
+        as they are produced.
+
+        This default implementation waits for `generate` to complete and replays its
+        responses. Providers with streaming APIs override it; they also fall back to
+        it when the executor can't stream (e.g. Temporal activities return whole values).
+        """
+        responses = await self.generate(message=message, request_params=request_params)
+        for i, response in enumerate(responses):
+            text = self.message_str(response, content_only=True)
+            if text:
+                yield StreamEvent(type="text_delta", iteration=i, text=text)
+            yield StreamEvent(type="message", iteration=i, message=response)
+
+    def _can_stream(self) -> bool:
+        """Whether provider calls can be streamed directly instead of through the executor."""
+        return self.executor is None or self.executor.execution_engine == "asyncio"
+
     async def select_model(
         self, request_params: RequestParams | None = None
     ) -> str | None:
@@ -597,7 +764,7 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol[MessageParamT, Message
         message: str | MessageParamT | List[MessageParamT],
     ) -> None:
         """Annotate the span with the message content."""
-        if not self.context.tracing_enabled:
+        if not self.context.tracing_enabled or not should_capture_payload(span):
             return
 
         if isinstance(message, str):
@@ -639,7 +806,7 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol[MessageParamT, Message
                 else "Error calling tool"
             )
             span.record_exception(Exception(error_message))
-        else:
+        elif should_capture_payload(span):
             for idx, content in enumerate(result.content):
                 span.set_attribute(f"{prefix}.content.{idx}.type", content.type)
                 if content.type == "text":
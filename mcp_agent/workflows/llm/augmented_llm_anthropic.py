@@ -1,8 +1,16 @@
-from typing import Any, Iterable, List, Type, Union, cast
+import json
+from typing import Any, AsyncIterator, Iterable, List, Type, Union, cast
 
 from pydantic import BaseModel
 
-from anthropic import Anthropic, AnthropicBedrock, AnthropicVertex
+from anthropic import (
+    Anthropic,
+    AnthropicBedrock,
+    AnthropicVertex,
+    AsyncAnthropic,
+    AsyncAnthropicBedrock,
+    AsyncAnthropicVertex,
+)
 from anthropic.types import (
     ContentBlock,
     DocumentBlockParam,
@@ -30,12 +38,15 @@ from mcp.types import (
     StopReason,
     TextContent,
     TextResourceContents,
+    Tool,
 )
 
 # from mcp_agent import console
 # from mcp_agent.agents.agent import HUMAN_INPUT_TOOL_NAME
 from mcp_agent.config import AnthropicSettings
+from mcp_agent.core.context import get_current_context
 from mcp_agent.executor.workflow_task import workflow_task
+from mcp_agent.tracing.metrics import get_metrics
 from mcp_agent.tracing.semconv import (
     GEN_AI_AGENT_NAME,
     GEN_AI_REQUEST_MODEL,
@@ -43,9 +54,27 @@ from mcp_agent.tracing.semconv import (
     GEN_AI_USAGE_INPUT_TOKENS,
     GEN_AI_USAGE_OUTPUT_TOKENS,
 )
-from mcp_agent.tracing.telemetry import get_tracer, is_otel_serializable, telemetry
-from mcp_agent.utils.common import ensure_serializable, typed_dict_extras, to_string
+from mcp_agent.tracing.telemetry import (
+    attribute_budget_exhausted,
+    get_tracer,
+    is_otel_serializable,
+    should_capture_payload,
+    telemetry,
+)
+from mcp_agent.utils.common import (
+    SerializationCache,
+    ensure_serializable,
+    typed_dict_extras,
+    to_string,
+)
 from mcp_agent.utils.pydantic_type_serializer import serialize_model, deserialize_model
+from mcp_agent.workflows.llm.client_pool import (
+    ClientKey,
+    ProviderClientPool,
+    client_key,
+    get_client_pool,
+    url_host,
+)
 from mcp_agent.workflows.llm.augmented_llm import (
     AugmentedLLM,
     ModelT,
@@ -54,6 +83,8 @@ from mcp_agent.workflows.llm.augmented_llm import (
     ProviderToMCPConverter,
     RequestParams,
     CallToolResult,
+    StreamEvent,
+    StreamingToolCalls,
 )
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.workflows.llm.multipart_converter_anthropic import AnthropicConverter
@@ -108,6 +139,57 @@ def create_anthropic_instance(settings: AnthropicSettings):
     return anthropic
 
 
+def anthropic_client_key(settings: AnthropicSettings) -> ClientKey:
+    """Pool key for the Anthropic client described by the given settings."""
+    return client_key(
+        "anthropic",
+        provider=settings.provider,
+        api_key=settings.api_key,
+        aws_access_key_id=settings.aws_access_key_id,
+        aws_secret_access_key=settings.aws_secret_access_key,
+        aws_session_token=settings.aws_session_token,
+        aws_region=settings.aws_region,
+        location=settings.location,
+        project=settings.project,
+    )
+
+
+def create_async_anthropic_instance(
+    settings: AnthropicSettings, pool: ProviderClientPool
+):
+    """
+    Create a long-lived async anthropic client instance, backed by a keep-alive
+    connection pool, based on settings
+    """
+    http_client = pool.create_async_http_client()
+    if settings.provider == "bedrock":
+        anthropic = AsyncAnthropicBedrock(
+            aws_access_key=settings.aws_access_key_id,
+            aws_secret_key=settings.aws_secret_access_key,
+            aws_session_token=settings.aws_session_token,
+            aws_region=settings.aws_region,
+            http_client=http_client,
+        )
+    elif settings.provider == "vertexai":
+        anthropic = AsyncAnthropicVertex(
+            region=settings.location,
+            project_id=settings.project,
+            http_client=http_client,
+        )
+    else:
+        anthropic = AsyncAnthropic(api_key=settings.api_key, http_client=http_client)
+    return anthropic
+
+
+def anthropic_tool_param(tool: Tool) -> ToolParam:
+    """Convert an MCP tool into an Anthropic tool."""
+    return {
+        "name": tool.name,
+        "description": tool.description,
+        "input_schema": tool.inputSchema,
+    }
+
+
 class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
     """
     The basic building block of agentic systems is an LLM enhanced with augmentations
@@ -184,15 +266,7 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
                 AnthropicConverter.convert_mixed_messages_to_anthropic(message)
             )
 
-            list_tools_result = await self.agent.list_tools()
-            available_tools: List[ToolParam] = [
-                {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "input_schema": tool.inputSchema,
-                }
-                for tool in list_tools_result.tools
-            ]
+            available_tools = await self._list_available_tools()
 
             responses: List[Message] = []
             model = await self.select_model(params)
@@ -200,9 +274,13 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
             if model:
                 span.set_attribute(GEN_AI_REQUEST_MODEL, model)
 
+            # Reused across iterations so earlier messages are only serialized once
+            serialization_cache = SerializationCache()
+
             total_input_tokens = 0
             total_output_tokens = 0
             finish_reasons = []
+            metrics = get_metrics(self.context)
 
             for i in range(params.max_iterations):
                 if (
@@ -210,28 +288,14 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
                     and responses
                     and responses[-1].stop_reason == "tool_use"
                 ):
-                    final_prompt_message = MessageParam(
-                        role="user",
-                        content="""We've reached the maximum number of iterations. 
-                        Please stop using tools now and provide your final comprehensive answer based on all tool results so far. 
-                        At the beginning of your response, clearly indicate that your answer may be incomplete due to reaching the maximum number of tool usage iterations, 
-                        and explain what additional information you would have needed to provide a more complete answer.""",
-                    )
-                    messages.append(final_prompt_message)
+                    messages.append(self._final_iteration_message())
 
-                arguments = {
-                    "model": model,
-                    "max_tokens": params.maxTokens,
-                    "messages": messages,
-                    "system": self.instruction or params.systemPrompt,
-                    "stop_sequences": params.stopSequences or [],
-                    "tools": available_tools,
-                }
-
-                if params.metadata:
-                    arguments = {**arguments, **params.metadata}
+                arguments = self._completion_arguments(
+                    model, messages, available_tools, params
+                )
 
-                self.logger.debug(f"{arguments}")
+                if self.logger.is_enabled_for("debug"):
+                    self.logger.debug(f"{arguments}")
                 self._log_chat_progress(chat_turn=(len(messages) + 1) // 2, model=model)
 
                 request = RequestCompletionRequest(
@@ -241,12 +305,17 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
 
                 self._annotate_span_for_completion_request(span, request, i)
 
+                if self.executor.crosses_process_boundary:
+                    request = ensure_serializable(request, cache=serialization_cache)
+
+                timer = metrics.start_llm_request(self.provider, model)
                 response: Message = await self.executor.execute(
                     AnthropicCompletionTasks.request_completion_task,
-                    ensure_serializable(request),
+                    request,
                 )
 
                 if isinstance(response, BaseException):
+                    timer.finish(error=response)
                     self.logger.error(f"Error: {response}")
                     span.record_exception(response)
                     span.set_status(trace.Status(trace.StatusCode.ERROR))
@@ -257,6 +326,7 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
                     data=response,
                 )
 
+                timer.finish(output_tokens=response.usage.output_tokens)
                 self._annotate_span_for_completion_response(span, response, i)
 
                 total_input_tokens += response.usage.input_tokens
@@ -319,19 +389,10 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
                             # )
                             # console.console.print(panel)
 
-                            tool_call_request = CallToolRequest(
-                                method="tools/call",
-                                params=CallToolRequestParams(
-                                    name=tool_name, arguments=tool_args
-                                ),
+                            message = await self._call_tool_use(
+                                tool_name, tool_args, tool_use_id
                             )
 
-                            result = await self.call_tool(
-                                request=tool_call_request, tool_call_id=tool_use_id
-                            )
-
-                            message = self.from_mcp_tool_result(result, tool_use_id)
-
                             messages.append(message)
 
             if params.use_history:
@@ -393,6 +454,183 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
             span.set_attribute("response", res)
             return res
 
+    async def _list_available_tools(self) -> List[ToolParam]:
+        return await self.agent.list_tools_for_provider(
+            "anthropic", anthropic_tool_param, tool_filter=self.tool_filter
+        )
+
+    def _completion_arguments(
+        self,
+        model: str,
+        messages: List[MessageParam],
+        available_tools: List[ToolParam],
+        params: RequestParams,
+    ) -> dict[str, Any]:
+        arguments = {
+            "model": model,
+            "max_tokens": params.maxTokens,
+            "messages": messages,
+            "system": self.instruction or params.systemPrompt,
+            "stop_sequences": params.stopSequences or [],
+            "tools": available_tools,
+        }
+
+        if params.metadata:
+            arguments = {**arguments, **params.metadata}
+
+        return arguments
+
+    def _final_iteration_message(self) -> MessageParam:
+        return MessageParam(
+            role="user",
+            content="""We've reached the maximum number of iterations. 
+                        Please stop using tools now and provide your final comprehensive answer based on all tool results so far. 
+                        At the beginning of your response, clearly indicate that your answer may be incomplete due to reaching the maximum number of tool usage iterations, 
+                        and explain what additional information you would have needed to provide a more complete answer.""",
+        )
+
+    async def _call_tool_use(
+        self, tool_name: str, tool_args: Any, tool_use_id: str
+    ) -> MessageParam:
+        tool_call_request = CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name=tool_name, arguments=tool_args),
+        )
+
+        result = await self.call_tool(
+            request=tool_call_request, tool_call_id=tool_use_id
+        )
+
+        return self.from_mcp_tool_result(result, tool_use_id)
+
+    async def generate_stream(
+        self,
+        message,
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Process a query using an LLM and available tools, streaming the response.
+        Text is yielded as it arrives, and each tool_use block is started as soon as
+        it is complete, while the rest of the response is still being generated.
+        """
+        if not self._can_stream():
+            async for event in super().generate_stream(message, request_params):
+                yield event
+            return
+
+        tracer = get_tracer(self.context)
+        span = tracer.start_span(
+            f"{self.__class__.__name__}.{self.name}.generate_stream"
+        )
+        try:
+            span.set_attribute(GEN_AI_AGENT_NAME, self.agent.name)
+
+            config = self.context.config.anthropic
+            messages: List[MessageParam] = []
+            params = self.get_request_params(request_params)
+
+            if params.use_history:
+                messages.extend(self.history.get())
+            messages.extend(
+                AnthropicConverter.convert_mixed_messages_to_anthropic(message)
+            )
+
+            available_tools = await self._list_available_tools()
+
+            model = await self.select_model(params)
+            if model:
+                span.set_attribute(GEN_AI_REQUEST_MODEL, model)
+
+            pool = get_client_pool(self.context)
+            key = anthropic_client_key(config)
+            anthropic = pool.get_client(
+                key, lambda: create_async_anthropic_instance(config, pool)
+            )
+
+            metrics = get_metrics(self.context)
+            stop_reason = None
+            for i in range(params.max_iterations):
+                if i == params.max_iterations - 1 and stop_reason == "tool_use":
+                    messages.append(self._final_iteration_message())
+
+                arguments = self._completion_arguments(
+                    model, messages, available_tools, params
+                )
+                self._log_chat_progress(chat_turn=(len(messages) + 1) // 2, model=model)
+
+                running = StreamingToolCalls()
+                timer = metrics.start_llm_request(self.provider, model)
+                try:
+                    async with pool.limit(url_host(anthropic.base_url)):
+                        async with anthropic.messages.stream(**arguments) as stream:
+                            async for event in stream:
+                                if event.type == "content_block_delta":
+                                    timer.first_token()
+                                if (
+                                    event.type == "content_block_delta"
+                                    and event.delta.type == "text_delta"
+                                ):
+                                    yield StreamEvent(
+                                        type="text_delta",
+                                        iteration=i,
+                                        text=event.delta.text,
+                                    )
+                                elif (
+                                    event.type == "content_block_stop"
+                                    and event.content_block.type == "tool_use"
+                                ):
+                                    tool_use = event.content_block
+                                    running.start(
+                                        self._call_tool_use(
+                                            tool_use.name, tool_use.input, tool_use.id
+                                        )
+                                    )
+                                    yield StreamEvent(
+                                        type="tool_call",
+                                        iteration=i,
+                                        tool_call_id=tool_use.id,
+                                        tool_name=tool_use.name,
+                                        arguments=json.dumps(tool_use.input),
+                                    )
+                            response = await stream.get_final_message()
+                except BaseException as e:
+                    running.cancel()
+                    timer.finish(error=e)
+                    if isinstance(e, Exception):
+                        self.logger.error(f"Error: {e}")
+                        span.record_exception(e)
+                        span.set_status(trace.Status(trace.StatusCode.ERROR))
+                    raise
+                timer.finish(output_tokens=response.usage.output_tokens)
+
+                messages.append(self.convert_message_to_message_param(response))
+                stop_reason = response.stop_reason
+                yield StreamEvent(type="message", iteration=i, message=response)
+
+                if stop_reason != "tool_use":
+                    self.logger.debug(
+                        f"Iteration {i}: Stopping because finish_reason is '{stop_reason}'"
+                    )
+                    span.set_attribute(GEN_AI_RESPONSE_FINISH_REASONS, [stop_reason])
+                    break
+
+                for result in await running.results():
+                    if isinstance(result, BaseException):
+                        self.logger.error(
+                            f"Warning: Unexpected error during tool execution: {result}. Continuing..."
+                        )
+                        span.record_exception(result)
+                        continue
+                    messages.append(result)
+                    yield StreamEvent(type="tool_result", iteration=i, message=result)
+
+            if params.use_history:
+                self.history.set(messages)
+
+            self._log_chat_finished(model=model)
+        finally:
+            span.end()
+
     async def generate_structured(
         self,
         message,
@@ -675,7 +913,7 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
         self, span: trace.Span, request: RequestCompletionRequest, turn: int
     ):
         """Annotate the span with the completion request as an event."""
-        if not self.context.tracing_enabled:
+        if not self.context.tracing_enabled or not span.is_recording():
             return
 
         event_data = {
@@ -684,12 +922,7 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
 
         for key, value in request.payload.items():
             if key == "messages":
-                for i, message in enumerate(cast(List[MessageParam], value)):
-                    event_data.update(
-                        self._extract_message_param_attributes_for_tracing(
-                            message, prefix=f"messages.{i}"
-                        )
-                    )
+                continue
 
             elif key == "tools":
                 if value is not None:
@@ -698,6 +931,18 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
             elif is_otel_serializable(value):
                 event_data[key] = value
 
+        # Record the most recent messages first, up to the attribute budget
+        if should_capture_payload(span):
+            messages = cast(List[MessageParam], request.payload.get("messages") or [])
+            for i, message in reversed(list(enumerate(messages))):
+                if attribute_budget_exhausted(event_data):
+                    break
+                event_data.update(
+                    self._extract_message_param_attributes_for_tracing(
+                        message, prefix=f"messages.{i}"
+                    )
+                )
+
         # Event name is based on the latest message role
         event_name = f"completion.request.{turn}"
         latest_message_role = request.payload.get("messages", [{}])[-1].get("role")
@@ -711,7 +956,7 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
         self, span: trace.Span, response: Message, turn: int
     ):
         """Annotate the span with the completion response as an event."""
-        if not self.context.tracing_enabled:
+        if not self.context.tracing_enabled or not span.is_recording():
             return
 
         event_data = {
@@ -726,7 +971,7 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
 class AnthropicCompletionTasks:
     @staticmethod
     @workflow_task
-    @telemetry.traced()
+    @telemetry.traced(capture="shallow")
     async def request_completion_task(
         request: RequestCompletionRequest,
     ) -> Message:
@@ -734,16 +979,22 @@ class AnthropicCompletionTasks:
         Request a completion from Anthropic's API.
         """
 
-        anthropic = create_anthropic_instance(request.config)
+        pool = get_client_pool()
+        key = anthropic_client_key(request.config)
+        anthropic = pool.get_client(
+            key, lambda: create_async_anthropic_instance(request.config, pool)
+        )
 
         payload = request.payload
-        response = anthropic.messages.create(**payload)
-        response = ensure_serializable(response)
+        async with pool.limit(url_host(anthropic.base_url)):
+            response = await anthropic.messages.create(**payload)
+        if get_current_context().executor.crosses_process_boundary:
+            response = ensure_serializable(response)
         return response
 
     @staticmethod
     @workflow_task
-    @telemetry.traced()
+    @telemetry.traced(capture="shallow")
     async def request_structured_completion_task(
         request: RequestStructuredCompletionRequest,
     ):
@@ -762,10 +1013,15 @@ class AnthropicCompletionTasks:
             )
 
         # We pass the text through instructor to extract structured data
-        client = instructor.from_anthropic(create_anthropic_instance(request.config))
+        pool = get_client_pool()
+        anthropic = pool.get_client(
+            anthropic_client_key(request.config),
+            lambda: create_async_anthropic_instance(request.config, pool),
+        )
+        client = instructor.from_anthropic(anthropic)
 
         # Extract structured data from natural language
-        structured_response = client.chat.completions.create(
+        structured_response = await client.chat.completions.create(
             model=request.model,
             response_model=response_model,
             messages=[{"role": "user", "content": request.response_str}],
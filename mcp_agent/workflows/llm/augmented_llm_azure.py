@@ -1,6 +1,6 @@
 import json
-from typing import Any, Iterable, Optional, Type, Union
-from azure.ai.inference import ChatCompletionsClient
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional, Type, Union
+from azure.ai.inference.aio import ChatCompletionsClient
 from azure.ai.inference.models import (
     ChatCompletions,
     ChatResponseMessage,
@@ -10,6 +10,7 @@ from azure.ai.inference.models import (
     DeveloperMessage,
     SystemMessage,
     ChatCompletionsToolDefinition,
+    FunctionCall,
     FunctionDefinition,
     CompletionsFinishReason,
     ChatCompletionsToolCall,
@@ -22,7 +23,7 @@ from azure.ai.inference.models import (
     ChatRole,
 )
 from azure.core.credentials import AzureKeyCredential
-from azure.identity import DefaultAzureCredential
+from azure.identity.aio import DefaultAzureCredential
 from opentelemetry import trace
 
 from pydantic import BaseModel
@@ -35,10 +36,12 @@ from mcp.types import (
     ModelPreferences,
     TextContent,
     TextResourceContents,
+    Tool,
 )
 
 from mcp_agent.config import AzureSettings
 from mcp_agent.executor.workflow_task import workflow_task
+from mcp_agent.tracing.metrics import get_metrics
 from mcp_agent.tracing.semconv import (
     GEN_AI_AGENT_NAME,
     GEN_AI_REQUEST_MODEL,
@@ -48,6 +51,12 @@ from mcp_agent.tracing.semconv import (
 )
 from mcp_agent.tracing.telemetry import get_tracer
 from mcp_agent.utils.common import typed_dict_extras
+from mcp_agent.workflows.llm.client_pool import (
+    ClientKey,
+    client_key,
+    get_client_pool,
+    url_host,
+)
 from mcp_agent.workflows.llm.augmented_llm import (
     AugmentedLLM,
     ModelT,
@@ -55,6 +64,10 @@ from mcp_agent.workflows.llm.augmented_llm import (
     MCPMessageResult,
     ProviderToMCPConverter,
     RequestParams,
+    StreamEvent,
+    StreamedToolCall,
+    StreamingToolCalls,
+    ToolCallAssembler,
 )
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.workflows.llm.multipart_converter_azure import AzureConverter
@@ -80,6 +93,39 @@ class ResponseMessage(ChatResponseMessage):
     content: Optional[str]
 
 
+def azure_client_key(config: AzureSettings) -> ClientKey:
+    """Pool key for the Azure client described by the given settings."""
+    return client_key("azure", **config.model_dump())
+
+
+def create_azure_client(config: AzureSettings) -> ChatCompletionsClient:
+    """Create a long-lived async Azure chat completions client based on settings"""
+    if config.api_key:
+        return ChatCompletionsClient(
+            endpoint=config.endpoint,
+            credential=AzureKeyCredential(config.api_key),
+            **config.model_dump(exclude={"endpoint", "credential"}),
+        )
+
+    return ChatCompletionsClient(
+        endpoint=config.endpoint,
+        credential=DefaultAzureCredential(),
+        credential_scopes=config.credential_scopes,
+        **config.model_dump(exclude={"endpoint", "credential", "credential_scopes"}),
+    )
+
+
+def azure_tool_definition(tool: Tool) -> ChatCompletionsToolDefinition:
+    """Convert an MCP tool into an Azure function tool definition."""
+    return ChatCompletionsToolDefinition(
+        function=FunctionDefinition(
+            name=tool.name,
+            description=tool.description,
+            parameters=tool.inputSchema,
+        )
+    )
+
+
 class AzureAugmentedLLM(AugmentedLLM[MessageParam, ResponseMessage]):
     """
     The basic building block of agentic systems is an LLM enhanced with augmentations
@@ -155,18 +201,7 @@ class AzureAugmentedLLM(AugmentedLLM[MessageParam, ResponseMessage]):
 
             messages.extend(AzureConverter.convert_mixed_messages_to_azure(message))
 
-            response = await self.agent.list_tools()
-
-            tools: list[ChatCompletionsToolDefinition] = [
-                ChatCompletionsToolDefinition(
-                    function=FunctionDefinition(
-                        name=tool.name,
-                        description=tool.description,
-                        parameters=tool.inputSchema,
-                    )
-                )
-                for tool in response.tools
-            ]
+            tools = await self._list_available_tools()
 
             span.set_attribute(
                 "available_tools",
@@ -180,21 +215,13 @@ class AzureAugmentedLLM(AugmentedLLM[MessageParam, ResponseMessage]):
             total_input_tokens = 0
             total_output_tokens = 0
             finish_reasons = []
+            metrics = get_metrics(self.context)
 
             for i in range(params.max_iterations):
-                arguments = {
-                    "messages": messages,
-                    "temperature": params.temperature,
-                    "model": model,
-                    "max_tokens": params.maxTokens,
-                    "stop": params.stopSequences,
-                    "tools": tools,
-                }
-
-                if params.metadata:
-                    arguments = {**arguments, **params.metadata}
-
-                self.logger.debug(f"{arguments}")
+                arguments = self._completion_arguments(model, messages, tools, params)
+
+                if self.logger.is_enabled_for("debug"):
+                    self.logger.debug(f"{arguments}")
                 self._log_chat_progress(chat_turn=(len(messages) + 1) // 2, model=model)
 
                 request = RequestCompletionRequest(
@@ -203,12 +230,14 @@ class AzureAugmentedLLM(AugmentedLLM[MessageParam, ResponseMessage]):
                 )
                 self._annotate_span_for_completion_request(span, request, i)
 
+                timer = metrics.start_llm_request(self.provider, model)
                 response = await self.executor.execute(
                     AzureCompletionTasks.request_completion_task,
                     request,
                 )
 
                 if isinstance(response, BaseException):
+                    timer.finish(error=response)
                     self.logger.error(f"Error: {response}")
                     span.record_exception(response)
                     span.set_status(trace.Status(trace.StatusCode.ERROR))
@@ -216,6 +245,7 @@ class AzureAugmentedLLM(AugmentedLLM[MessageParam, ResponseMessage]):
 
                 self.logger.debug(f"{model} response:", data=response)
 
+                timer.finish(output_tokens=response.usage["completion_tokens"])
                 self._annotate_span_for_completion_response(span, response, i)
 
                 total_input_tokens += response.usage["prompt_tokens"]
@@ -315,6 +345,220 @@ class AzureAugmentedLLM(AugmentedLLM[MessageParam, ResponseMessage]):
 
         return "\n".join(final_text)
 
+    async def _list_available_tools(self) -> list[ChatCompletionsToolDefinition]:
+        return await self.agent.list_tools_for_provider(
+            "azure", azure_tool_definition, tool_filter=self.tool_filter
+        )
+
+    def _completion_arguments(
+        self,
+        model: str,
+        messages: list[MessageParam],
+        tools: list[ChatCompletionsToolDefinition],
+        params: RequestParams,
+    ) -> dict[str, Any]:
+        arguments = {
+            "messages": messages,
+            "temperature": params.temperature,
+            "model": model,
+            "max_tokens": params.maxTokens,
+            "stop": params.stopSequences,
+            "tools": tools,
+        }
+
+        if params.metadata:
+            arguments = {**arguments, **params.metadata}
+
+        return arguments
+
+    async def generate_stream(
+        self,
+        message,
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Process a query using an LLM and available tools, streaming the response.
+        Text is yielded as it arrives, and each tool call is started as soon as its
+        arguments have been fully streamed.
+        """
+        if not self._can_stream():
+            async for event in super().generate_stream(message, request_params):
+                yield event
+            return
+
+        tracer = get_tracer(self.context)
+        span = tracer.start_span(f"llm_azure.{self.name}.generate_stream")
+        try:
+            span.set_attribute(GEN_AI_AGENT_NAME, self.agent.name)
+
+            messages: list[MessageParam] = []
+            params = self.get_request_params(request_params)
+
+            if params.use_history:
+                messages.extend(self.history.get())
+
+            system_prompt = self.instruction or params.systemPrompt
+            if system_prompt and len(messages) == 0:
+                messages.append(SystemMessage(content=system_prompt))
+
+            messages.extend(AzureConverter.convert_mixed_messages_to_azure(message))
+
+            tools = await self._list_available_tools()
+
+            model = await self.select_model(params)
+            if model:
+                span.set_attribute(GEN_AI_REQUEST_MODEL, model)
+
+            config = self.context.config.azure
+            pool = get_client_pool(self.context)
+            key = azure_client_key(config)
+            azure_client = pool.get_client(key, lambda: create_azure_client(config))
+            metrics = get_metrics(self.context)
+
+            for i in range(params.max_iterations):
+                arguments = self._completion_arguments(model, messages, tools, params)
+                self._log_chat_progress(chat_turn=(len(messages) + 1) // 2, model=model)
+
+                content_parts: list[str] = []
+                assembler = ToolCallAssembler()
+                # Tool call updates are keyed by id; continuation updates omit it
+                tool_call_indexes: dict[str, int] = {}
+                tool_calls: list[ChatCompletionsToolCall] = []
+                running = StreamingToolCalls()
+                finish_reason = None
+                output_tokens = None
+
+                timer = metrics.start_llm_request(self.provider, model)
+                try:
+                    async with pool.limit(url_host(config.endpoint)):
+                        stream = await azure_client.complete(stream=True, **arguments)
+                        # Close the response even if the consumer stops early
+                        try:
+                            async for update in stream:
+                                if update.usage:
+                                    output_tokens = update.usage.completion_tokens
+                                if not update.choices:
+                                    continue
+
+                                choice = update.choices[0]
+                                delta = choice.delta
+                                if delta and (delta.content or delta.tool_calls):
+                                    timer.first_token()
+                                if delta and delta.content:
+                                    content_parts.append(delta.content)
+                                    yield StreamEvent(
+                                        type="text_delta",
+                                        iteration=i,
+                                        text=delta.content,
+                                    )
+
+                                completed = []
+                                for tool_call_delta in (
+                                    delta.tool_calls if delta else None
+                                ) or []:
+                                    if tool_call_delta.id:
+                                        index = tool_call_indexes.setdefault(
+                                            tool_call_delta.id, len(tool_call_indexes)
+                                        )
+                                    else:
+                                        index = max(len(tool_call_indexes) - 1, 0)
+                                    function = tool_call_delta.function
+                                    completed.extend(
+                                        assembler.add_delta(
+                                            index,
+                                            id=tool_call_delta.id,
+                                            name=function.name if function else None,
+                                            arguments=function.arguments
+                                            if function
+                                            else None,
+                                        )
+                                    )
+                                if choice.finish_reason:
+                                    finish_reason = choice.finish_reason
+                                    completed.extend(assembler.flush())
+
+                                for event in self._start_tool_calls(
+                                    completed, i, tool_calls, running
+                                ):
+                                    yield event
+
+                            # Calls still open if the stream ended without a finish_reason
+                            for event in self._start_tool_calls(
+                                assembler.flush(), i, tool_calls, running
+                            ):
+                                yield event
+                        finally:
+                            await stream.aclose()
+                except BaseException as e:
+                    running.cancel()
+                    timer.finish(error=e)
+                    if isinstance(e, Exception):
+                        self.logger.error(f"Error: {e}")
+                        span.record_exception(e)
+                        span.set_status(trace.Status(trace.StatusCode.ERROR))
+                    raise
+                timer.finish(output_tokens=output_tokens)
+
+                response_message = ResponseMessage(
+                    role=ChatRole.ASSISTANT,
+                    content="".join(content_parts) or None,
+                    tool_calls=tool_calls or None,
+                )
+                messages.append(self.convert_message_to_message_param(response_message))
+                yield StreamEvent(type="message", iteration=i, message=response_message)
+
+                if not running:
+                    self.logger.debug(
+                        f"Iteration {i}: Stopping because finish_reason is '{finish_reason}'"
+                    )
+                    break
+
+                for result in await running.results():
+                    if isinstance(result, BaseException):
+                        self.logger.error(
+                            f"Warning: Unexpected error during tool execution: {result}. Continuing..."
+                        )
+                        span.record_exception(result)
+                        continue
+                    elif isinstance(result, ToolMessage):
+                        messages.append(result)
+                        yield StreamEvent(
+                            type="tool_result",
+                            iteration=i,
+                            tool_call_id=result.tool_call_id,
+                            message=result,
+                        )
+
+            if params.use_history:
+                self.history.set(messages)
+
+            self._log_chat_finished(model=model)
+        finally:
+            span.end()
+
+    def _start_tool_calls(
+        self,
+        calls: list[StreamedToolCall],
+        iteration: int,
+        tool_calls: list[ChatCompletionsToolCall],
+        running: StreamingToolCalls,
+    ) -> Iterator[StreamEvent]:
+        """Start executing streamed tool calls that are complete, and report each one."""
+        for call in calls:
+            tool_call = ChatCompletionsToolCall(
+                id=call.id,
+                function=FunctionCall(name=call.name, arguments=call.arguments),
+            )
+            tool_calls.append(tool_call)
+            running.start(self.execute_tool_call(tool_call))
+            yield StreamEvent(
+                type="tool_call",
+                iteration=iteration,
+                tool_call_id=call.id,
+                tool_name=call.name,
+                arguments=call.arguments,
+            )
+
     async def generate_structured(
         self,
         message,
@@ -433,7 +677,7 @@ class AzureAugmentedLLM(AugmentedLLM[MessageParam, ResponseMessage]):
         self, span: trace.Span, request: RequestCompletionRequest, turn: int
     ) -> None:
         """Annotate the span with the completion request as an event."""
-        if not self.context.tracing_enabled:
+        if not self.context.tracing_enabled or not span.is_recording():
             return
 
         event_data = {
@@ -456,7 +700,7 @@ class AzureAugmentedLLM(AugmentedLLM[MessageParam, ResponseMessage]):
         self, span: trace.Span, response: ResponseMessage, turn: int
     ) -> None:
         """Annotate the span with the completion response as an event."""
-        if not self.context.tracing_enabled:
+        if not self.context.tracing_enabled or not span.is_recording():
             return
 
         event_data = {
@@ -501,24 +745,13 @@ class AzureCompletionTasks:
         """
         Request a completion from Azure's API.
         """
-        if request.config.api_key:
-            azure_client = ChatCompletionsClient(
-                endpoint=request.config.endpoint,
-                credential=AzureKeyCredential(request.config.api_key),
-                **request.config.model_dump(exclude={"endpoint", "credential"}),
-            )
-        else:
-            azure_client = ChatCompletionsClient(
-                endpoint=request.config.endpoint,
-                credential=DefaultAzureCredential(),
-                credential_scopes=request.config.credential_scopes,
-                **request.config.model_dump(
-                    exclude={"endpoint", "credential", "credential_scopes"}
-                ),
-            )
+        pool = get_client_pool()
+        key = azure_client_key(request.config)
+        azure_client = pool.get_client(key, lambda: create_azure_client(request.config))
 
         payload = request.payload
-        response = azure_client.complete(**payload)
+        async with pool.limit(url_host(request.config.endpoint)):
+            response = await azure_client.complete(**payload)
         return response
 
 
@@ -12,11 +12,19 @@ from mcp.types import (
     TextContent,
     TextResourceContents,
     BlobResourceContents,
+    Tool,
 )
 from mcp_agent.config import BedrockSettings
 from mcp_agent.executor.workflow_task import workflow_task
 from mcp_agent.utils.common import typed_dict_extras
 from mcp_agent.utils.pydantic_type_serializer import serialize_model, deserialize_model
+from mcp_agent.workflows.llm.client_pool import (
+    ClientKey,
+    ProviderClientPool,
+    client_key,
+    get_client_pool,
+    url_host,
+)
 from mcp_agent.workflows.llm.augmented_llm import (
     AugmentedLLM,
     ModelT,
@@ -26,6 +34,7 @@ from mcp_agent.workflows.llm.augmented_llm import (
     RequestParams,
 )
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.tracing.metrics import get_metrics
 from mcp_agent.workflows.llm.multipart_converter_bedrock import BedrockConverter
 
 if TYPE_CHECKING:
@@ -36,6 +45,7 @@ if TYPE_CHECKING:
         MessageUnionTypeDef,
         ContentBlockUnionTypeDef,
         ToolConfigurationTypeDef,
+        ToolTypeDef,
     )
 else:
     MessageOutputTypeDef = object
@@ -44,6 +54,18 @@ else:
     MessageUnionTypeDef = object
     ContentBlockUnionTypeDef = object
     ToolConfigurationTypeDef = object
+    ToolTypeDef = object
+
+
+def bedrock_tool(tool: Tool) -> ToolTypeDef:
+    """Convert an MCP tool into a Bedrock Converse tool spec."""
+    return {
+        "toolSpec": {
+            "name": tool.name,
+            "description": tool.description,
+            "inputSchema": {"json": tool.inputSchema},
+        }
+    }
 
 
 class BedrockAugmentedLLM(AugmentedLLM[MessageUnionTypeDef, MessageUnionTypeDef]):
@@ -103,24 +125,16 @@ class BedrockAugmentedLLM(AugmentedLLM[MessageUnionTypeDef, MessageUnionTypeDef]
 
         messages.extend(BedrockConverter.convert_mixed_messages_to_bedrock(message))
 
-        response = await self.agent.list_tools()
-
         tool_config: ToolConfigurationTypeDef = {
-            "tools": [
-                {
-                    "toolSpec": {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "inputSchema": {"json": tool.inputSchema},
-                    }
-                }
-                for tool in response.tools
-            ],
+            "tools": await self.agent.list_tools_for_provider(
+                "bedrock", bedrock_tool, tool_filter=self.tool_filter
+            ),
             "toolChoice": {"auto": {}},
         }
 
         responses: list[MessageUnionTypeDef] = []
         model = await self.select_model(params)
+        metrics = get_metrics(self.context)
 
         for i in range(params.max_iterations):
             inference_config = {
@@ -151,9 +165,11 @@ class BedrockAugmentedLLM(AugmentedLLM[MessageUnionTypeDef, MessageUnionTypeDef]
                     "additionalModelRequestFields": params.metadata,
                 }
 
-            self.logger.debug(f"{arguments}")
+            if self.logger.is_enabled_for("debug"):
+                self.logger.debug(f"{arguments}")
             self._log_chat_progress(chat_turn=(len(messages) + 1) // 2, model=model)
 
+            timer = metrics.start_llm_request(self.provider, model)
             response: ConverseResponseTypeDef = await self.executor.execute(
                 BedrockCompletionTasks.request_completion_task,
                 RequestCompletionRequest(
@@ -163,9 +179,12 @@ class BedrockAugmentedLLM(AugmentedLLM[MessageUnionTypeDef, MessageUnionTypeDef]
             )
 
             if isinstance(response, BaseException):
+                timer.finish(error=response)
                 self.logger.error(f"Error: {response}")
                 break
 
+            timer.finish(output_tokens=response.get("usage", {}).get("outputTokens"))
+
             self.logger.debug(f"{model} response:", data=response)
 
             response_as_message = self.convert_message_to_message_param(
@@ -369,6 +388,31 @@ class RequestStructuredCompletionRequest(BaseModel):
     model: str
 
 
+def bedrock_client_key(config: BedrockSettings | None) -> ClientKey:
+    """Pool key for the Bedrock runtime client described by the given settings."""
+    return client_key("bedrock", **(config.model_dump() if config else {}))
+
+
+def create_bedrock_client(config: BedrockSettings | None, pool: ProviderClientPool):
+    """Create a long-lived Bedrock runtime client based on settings"""
+    from botocore.config import Config
+
+    client_config = Config(max_pool_connections=pool.settings.max_connections_per_host)
+    if config:
+        session = Session(profile_name=config.profile)
+        return session.client(
+            "bedrock-runtime",
+            aws_access_key_id=config.aws_access_key_id,
+            aws_secret_access_key=config.aws_secret_access_key,
+            aws_session_token=config.aws_session_token,
+            region_name=config.aws_region,
+            config=client_config,
+        )
+
+    session = Session()
+    return session.client("bedrock-runtime", config=client_config)
+
+
 class BedrockCompletionTasks:
     @staticmethod
     @workflow_task
@@ -379,21 +423,16 @@ class BedrockCompletionTasks:
         Request a completion from Bedrock's API.
         """
 
-        if request.config:
-            session = Session(profile_name=request.config.profile)
-            bedrock_client = session.client(
-                "bedrock-runtime",
-                aws_access_key_id=request.config.aws_access_key_id,
-                aws_secret_access_key=request.config.aws_secret_access_key,
-                aws_session_token=request.config.aws_session_token,
-                region_name=request.config.aws_region,
-            )
-        else:
-            session = Session()
-            bedrock_client = session.client("bedrock-runtime")
+        pool = get_client_pool()
+        key = bedrock_client_key(request.config)
+        bedrock_client = pool.get_client(
+            key, lambda: create_bedrock_client(request.config, pool)
+        )
 
         payload = request.payload
-        response = bedrock_client.converse(**payload)
+        async with pool.limit(url_host(bedrock_client.meta.endpoint_url)):
+            # boto3 has no async client, so run the call off the event loop
+            response = await pool.run_in_thread(bedrock_client.converse, **payload)
         return response
 
     @staticmethod
@@ -415,23 +454,17 @@ class BedrockCompletionTasks:
                 "Either response_model or serialized_response_model must be provided for structured completion."
             )
 
-        if request.config:
-            session = Session(profile_name=request.config.profile)
-            bedrock_client = session.client(
-                "bedrock-runtime",
-                aws_access_key_id=request.config.aws_access_key_id,
-                aws_secret_access_key=request.config.aws_secret_access_key,
-                aws_session_token=request.config.aws_session_token,
-                region_name=request.config.aws_region,
-            )
-        else:
-            session = Session()
-            bedrock_client = session.client("bedrock-runtime")
+        pool = get_client_pool()
+        bedrock_client = pool.get_client(
+            bedrock_client_key(request.config),
+            lambda: create_bedrock_client(request.config, pool),
+        )
 
         client = instructor.from_bedrock(bedrock_client)
 
         # Extract structured data from natural language
-        structured_response = client.chat.completions.create(
+        structured_response = await pool.run_in_thread(
+            client.chat.completions.create,
             modelId=request.model,
             messages=[{"role": "user", "content": request.response_str}],
             response_model=response_model,
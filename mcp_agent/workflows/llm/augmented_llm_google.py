@@ -1,5 +1,6 @@
-from typing import Type
+from typing import AsyncIterator, Type
 import base64
+import json
 
 from pydantic import BaseModel
 
@@ -14,12 +15,19 @@ from mcp.types import (
     TextContent,
     TextResourceContents,
     BlobResourceContents,
+    Tool,
 )
 
 from mcp_agent.config import GoogleSettings
 from mcp_agent.executor.workflow_task import workflow_task
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.tracing.metrics import get_metrics
 from mcp_agent.utils.pydantic_type_serializer import serialize_model, deserialize_model
+from mcp_agent.workflows.llm.client_pool import (
+    ClientKey,
+    client_key,
+    get_client_pool,
+)
 from mcp_agent.workflows.llm.augmented_llm import (
     AugmentedLLM,
     MCPMessageParam,
@@ -28,6 +36,8 @@ from mcp_agent.workflows.llm.augmented_llm import (
     ProviderToMCPConverter,
     RequestParams,
     CallToolResult,
+    StreamEvent,
+    StreamingToolCalls,
 )
 from mcp_agent.workflows.llm.multipart_converter_google import GoogleConverter
 
@@ -87,47 +97,20 @@ class GoogleAugmentedLLM(
 
         messages.extend(GoogleConverter.convert_mixed_messages_to_google(message))
 
-        response = await self.agent.list_tools()
-
-        tools = [
-            types.Tool(
-                function_declarations=[
-                    types.FunctionDeclaration(
-                        name=tool.name,
-                        description=tool.description,
-                        parameters=transform_mcp_tool_schema(tool.inputSchema),
-                    )
-                ]
-            )
-            for tool in response.tools
-        ]
+        tools = await self._list_available_tools()
 
         responses: list[types.Content] = []
         model = await self.select_model(params)
+        metrics = get_metrics(self.context)
 
         for i in range(params.max_iterations):
-            inference_config = types.GenerateContentConfig(
-                max_output_tokens=params.maxTokens,
-                temperature=params.temperature,
-                stop_sequences=params.stopSequences or [],
-                system_instruction=self.instruction or params.systemPrompt,
-                tools=tools,
-                automatic_function_calling=types.AutomaticFunctionCallingConfig(
-                    disable=True
-                ),
-                candidate_count=1,
-                **(params.metadata or {}),
-            )
+            arguments = self._completion_arguments(model, messages, tools, params)
 
-            arguments = {
-                "model": model,
-                "contents": messages,
-                "config": inference_config,
-            }
-
-            self.logger.debug(f"{arguments}")
+            if self.logger.is_enabled_for("debug"):
+                self.logger.debug(f"{arguments}")
             self._log_chat_progress(chat_turn=(len(messages) + 1) // 2, model=model)
 
+            timer = metrics.start_llm_request(self.provider, model)
             response: types.GenerateContentResponse = await self.executor.execute(
                 GoogleCompletionTasks.request_completion_task,
                 RequestCompletionRequest(
@@ -137,9 +120,16 @@ class GoogleAugmentedLLM(
             )
 
             if isinstance(response, BaseException):
+                timer.finish(error=response)
                 self.logger.error(f"Error: {response}")
                 break
 
+            timer.finish(
+                output_tokens=response.usage_metadata.candidates_token_count
+                if response.usage_metadata
+                else None
+            )
+
             self.logger.debug(f"{model} response:", data=response)
 
             if not response.candidates:
@@ -236,6 +226,177 @@ class GoogleAugmentedLLM(
 
         return response.text or ""
 
+    async def _list_available_tools(self) -> list[types.Tool]:
+        return await self.agent.list_tools_for_provider(
+            "google", google_tool, tool_filter=self.tool_filter
+        )
+
+    def _completion_arguments(
+        self,
+        model: str,
+        messages: list[types.Content],
+        tools: list[types.Tool],
+        params: RequestParams,
+    ) -> dict:
+        inference_config = types.GenerateContentConfig(
+            max_output_tokens=params.maxTokens,
+            temperature=params.temperature,
+            stop_sequences=params.stopSequences or [],
+            system_instruction=self.instruction or params.systemPrompt,
+            tools=tools,
+            automatic_function_calling=types.AutomaticFunctionCallingConfig(
+                disable=True
+            ),
+            candidate_count=1,
+            **(params.metadata or {}),
+        )
+
+        return {
+            "model": model,
+            "contents": messages,
+            "config": inference_config,
+        }
+
+    async def generate_stream(
+        self,
+        message,
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Process a query using an LLM and available tools, streaming the response.
+        Gemini streams function calls as whole parts, so each one is started as
+        soon as it arrives, while the rest of the response is still being generated.
+        """
+        if not self._can_stream():
+            async for event in super().generate_stream(message, request_params):
+                yield event
+            return
+
+        messages: list[types.Content] = []
+        params = self.get_request_params(request_params)
+
+        if params.use_history:
+            messages.extend(self.history.get())
+
+        messages.extend(GoogleConverter.convert_mixed_messages_to_google(message))
+
+        tools = await self._list_available_tools()
+        model = await self.select_model(params)
+
+        config = self.context.config.google
+        pool = get_client_pool(self.context)
+        key = google_client_key(config)
+        google_client = pool.get_client(key, lambda: create_google_client(config))
+        metrics = get_metrics(self.context)
+
+        for i in range(params.max_iterations):
+            arguments = self._completion_arguments(model, messages, tools, params)
+            self._log_chat_progress(chat_turn=(len(messages) + 1) // 2, model=model)
+
+            parts: list[types.Part] = []
+            running = StreamingToolCalls()
+            finish_reason = None
+            output_tokens = None
+
+            timer = metrics.start_llm_request(self.provider, model)
+            try:
+                async with pool.limit(google_client_host(config)):
+                    stream = await google_client.aio.models.generate_content_stream(
+                        **arguments
+                    )
+                    # Close the response even if the consumer stops early
+                    try:
+                        async for chunk in stream:
+                            if chunk.usage_metadata:
+                                output_tokens = (
+                                    chunk.usage_metadata.candidates_token_count
+                                )
+                            if not chunk.candidates:
+                                continue
+
+                            candidate = chunk.candidates[0]
+                            finish_reason = candidate.finish_reason or finish_reason
+                            if not candidate.content or not candidate.content.parts:
+                                continue
+                            timer.first_token()
+
+                            for part in candidate.content.parts:
+                                if part.function_call:
+                                    parts.append(part)
+                                    running.start(
+                                        self.execute_tool_call(part.function_call)
+                                    )
+                                    yield StreamEvent(
+                                        type="tool_call",
+                                        iteration=i,
+                                        tool_call_id=part.function_call.id,
+                                        tool_name=part.function_call.name,
+                                        arguments=json.dumps(
+                                            part.function_call.args or {}
+                                        ),
+                                    )
+                                elif part.text and not part.thought:
+                                    # Merge text chunks so history holds one part per block
+                                    if parts and _is_plain_text(parts[-1]):
+                                        parts[-1] = types.Part.from_text(
+                                            text=parts[-1].text + part.text
+                                        )
+                                    else:
+                                        parts.append(part)
+                                    yield StreamEvent(
+                                        type="text_delta", iteration=i, text=part.text
+                                    )
+                                else:
+                                    parts.append(part)
+                    finally:
+                        await stream.aclose()
+            except BaseException as e:
+                running.cancel()
+                timer.finish(error=e)
+                if isinstance(e, Exception):
+                    self.logger.error(f"Error: {e}")
+                raise
+            timer.finish(output_tokens=output_tokens)
+
+            if not parts:
+                break
+
+            content = types.Content(role="model", parts=parts)
+            messages.append(self.convert_message_to_message_param(content))
+            yield StreamEvent(type="message", iteration=i, message=content)
+
+            if not running:
+                self.logger.debug(
+                    f"Iteration {i}: Stopping because finish_reason is '{finish_reason}'"
+                )
+                break
+
+            function_response_parts: list[types.Part] = []
+            for result in await running.results():
+                if result and not isinstance(result, BaseException) and result.parts:
+                    function_response_parts.extend(result.parts)
+                else:
+                    self.logger.error(
+                        f"Warning: Unexpected error during tool execution: {result}. Continuing..."
+                    )
+                    function_response_parts.append(
+                        types.Part.from_text(text=f"Error executing tool: {result}")
+                    )
+
+            # Combine all parallel function responses into a single message
+            function_response_content = types.Content(
+                role="tool", parts=function_response_parts
+            )
+            messages.append(function_response_content)
+            yield StreamEvent(
+                type="tool_result", iteration=i, message=function_response_content
+            )
+
+        if params.use_history:
+            self.history.set(messages)
+
+        self._log_chat_finished(model=model)
+
     async def generate_structured(
         self,
         message,
@@ -334,6 +495,35 @@ class RequestStructuredCompletionRequest(BaseModel):
     model: str
 
 
+def google_client_key(config: GoogleSettings) -> ClientKey:
+    """Pool key for the Google GenAI client described by the given settings."""
+    return client_key(
+        "google",
+        api_key=config.api_key,
+        vertexai=config.vertexai,
+        project=config.project,
+        location=config.location,
+    )
+
+
+def google_client_host(config: GoogleSettings) -> str:
+    """Host that requests of the Google GenAI client described by the settings go to."""
+    if config and config.vertexai:
+        return f"{config.location or 'us-central1'}-aiplatform.googleapis.com"
+    return "generativelanguage.googleapis.com"
+
+
+def create_google_client(config: GoogleSettings) -> Client:
+    """Create a long-lived Google GenAI client based on settings"""
+    if config and config.vertexai:
+        return Client(
+            vertexai=config.vertexai,
+            project=config.project,
+            location=config.location,
+        )
+    return Client(api_key=config.api_key)
+
+
 class GoogleCompletionTasks:
     @staticmethod
     @workflow_task
@@ -344,17 +534,15 @@ class GoogleCompletionTasks:
         Request a completion from Google's API.
         """
 
-        if request.config and request.config.vertexai:
-            google_client = Client(
-                vertexai=request.config.vertexai,
-                project=request.config.project,
-                location=request.config.location,
-            )
-        else:
-            google_client = Client(api_key=request.config.api_key)
+        pool = get_client_pool()
+        key = google_client_key(request.config)
+        google_client = pool.get_client(
+            key, lambda: create_google_client(request.config)
+        )
 
         payload = request.payload
-        response = google_client.models.generate_content(**payload)
+        async with pool.limit(google_client_host(request.config)):
+            response = await google_client.aio.models.generate_content(**payload)
         return response
 
     @staticmethod
@@ -376,20 +564,18 @@ class GoogleCompletionTasks:
                 "Either response_model or serialized_response_model must be provided for structured completion."
             )
 
-        if request.config and request.config.vertexai:
-            google_client = Client(
-                vertexai=request.config.vertexai,
-                project=request.config.project,
-                location=request.config.location,
-            )
-        else:
-            google_client = Client(api_key=request.config.api_key)
+        google_client = get_client_pool().get_client(
+            google_client_key(request.config),
+            lambda: create_google_client(request.config),
+        )
 
         client = instructor.from_genai(
-            google_client, mode=instructor.Mode.GENAI_STRUCTURED_OUTPUTS
+            google_client,
+            mode=instructor.Mode.GENAI_STRUCTURED_OUTPUTS,
+            use_async=True,
         )
 
-        structured_response = client.chat.completions.create(
+        structured_response = await client.chat.completions.create(
             model=request.model,
             response_model=response_model,
             system="Convert the provided text into the required response model. Do not change the text or add any additional text. Just convert it into the required response model.",
@@ -519,6 +705,27 @@ class GoogleMCPTypeConverter(ProviderToMCPConverter[types.Content, types.Content
         return function_response_content
 
 
+def google_tool(tool: Tool) -> types.Tool:
+    """Convert an MCP tool into a Gemini function declaration tool."""
+    return types.Tool(
+        function_declarations=[
+            types.FunctionDeclaration(
+                name=tool.name,
+                description=tool.description,
+                parameters=transform_mcp_tool_schema(tool.inputSchema),
+            )
+        ]
+    )
+
+
+def _is_plain_text(part: types.Part) -> bool:
+    return (
+        part.text is not None
+        and not part.thought
+        and not getattr(part, "thought_signature", None)
+    )
+
+
 def transform_mcp_tool_schema(schema: dict) -> dict:
     """Transform JSON Schema to OpenAPI Schema format compatible with Gemini.
 
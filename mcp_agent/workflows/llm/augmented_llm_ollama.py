@@ -1,7 +1,5 @@
 from typing import Type
 
-from openai import OpenAI
-
 from mcp_agent.executor.workflow_task import workflow_task
 from mcp_agent.utils.pydantic_type_serializer import serialize_model, deserialize_model
 from mcp_agent.workflows.llm.augmented_llm import (
@@ -11,7 +9,10 @@ from mcp_agent.workflows.llm.augmented_llm import (
 from mcp_agent.workflows.llm.augmented_llm_openai import (
     OpenAIAugmentedLLM,
     RequestStructuredCompletionRequest,
+    create_openai_client,
+    openai_client_key,
 )
+from mcp_agent.workflows.llm.client_pool import get_client_pool
 
 
 class OllamaAugmentedLLM(OpenAIAugmentedLLM):
@@ -99,18 +100,18 @@ class OllamaCompletionTasks:
                 "Either response_model or serialized_response_model must be provided for structured completion."
             )
 
-        # Next we pass the text through instructor to extract structured data
-        client = instructor.from_openai(
-            OpenAI(
-                api_key=request.config.api_key,
-                base_url=request.config.base_url,
-                http_client=request.config.http_client,
-            ),
-            mode=instructor.Mode.JSON,
+        pool = get_client_pool()
+        openai_client = pool.get_client(
+            openai_client_key(request.config),
+            lambda: create_openai_client(request.config, pool),
+            owned=getattr(request.config, "http_client", None) is None,
         )
 
+        # Next we pass the text through instructor to extract structured data
+        client = instructor.from_openai(openai_client, mode=instructor.Mode.JSON)
+
         # Extract structured data from natural language
-        structured_response = client.chat.completions.create(
+        structured_response = await client.chat.completions.create(
             model=request.model,
             response_model=response_model,
             messages=[
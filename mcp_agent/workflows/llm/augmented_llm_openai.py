@@ -1,12 +1,13 @@
 import json
 import re
 import functools
-from typing import Any, Dict, Iterable, List, Type, cast
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Type, cast
 
+import httpx
 from pydantic import BaseModel
 
 
-from openai import OpenAI, AsyncOpenAI
+from openai import AsyncOpenAI
 from openai.types.chat import (
     ChatCompletionAssistantMessageParam,
     ChatCompletionContentPartParam,
@@ -22,6 +23,7 @@ from openai.types.chat import (
     ChatCompletionUserMessageParam,
     ChatCompletion,
 )
+from openai.types.chat.chat_completion_message_tool_call import Function
 from opentelemetry import trace
 from mcp.types import (
     CallToolRequestParams,
@@ -29,14 +31,16 @@ from mcp.types import (
     CallToolResult,
     EmbeddedResource,
     ImageContent,
-    ListToolsResult,
     ModelPreferences,
     TextContent,
     TextResourceContents,
+    Tool,
 )
 
 from mcp_agent.config import OpenAISettings
+from mcp_agent.core.context import get_current_context
 from mcp_agent.executor.workflow_task import workflow_task
+from mcp_agent.tracing.metrics import get_metrics
 from mcp_agent.tracing.telemetry import get_tracer, telemetry
 from mcp_agent.tracing.semconv import (
     GEN_AI_AGENT_NAME,
@@ -47,10 +51,25 @@ from mcp_agent.tracing.semconv import (
     GEN_AI_USAGE_INPUT_TOKENS,
     GEN_AI_USAGE_OUTPUT_TOKENS,
 )
-from mcp_agent.tracing.telemetry import is_otel_serializable
-from mcp_agent.utils.common import ensure_serializable, typed_dict_extras
+from mcp_agent.tracing.telemetry import (
+    attribute_budget_exhausted,
+    is_otel_serializable,
+    should_capture_payload,
+)
+from mcp_agent.utils.common import (
+    SerializationCache,
+    ensure_serializable,
+    typed_dict_extras,
+)
 from mcp_agent.utils.mime_utils import image_url_to_mime_and_base64
 from mcp_agent.utils.pydantic_type_serializer import serialize_model, deserialize_model
+from mcp_agent.workflows.llm.client_pool import (
+    ClientKey,
+    ProviderClientPool,
+    client_key,
+    get_client_pool,
+    url_host,
+)
 from mcp_agent.workflows.llm.augmented_llm import (
     AugmentedLLM,
     MessageTypes,
@@ -59,6 +78,10 @@ from mcp_agent.workflows.llm.augmented_llm import (
     MCPMessageResult,
     ProviderToMCPConverter,
     RequestParams,
+    StreamEvent,
+    StreamedToolCall,
+    StreamingToolCalls,
+    ToolCallAssembler,
 )
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.workflows.llm.multipart_converter_openai import OpenAIConverter
@@ -78,6 +101,52 @@ class RequestStructuredCompletionRequest(BaseModel):
     user: str | None = None
 
 
+def openai_client_key(config: OpenAISettings) -> ClientKey:
+    """Pool key for the OpenAI client described by the given settings."""
+    return client_key(
+        "openai",
+        api_key=config.api_key,
+        base_url=config.base_url,
+        default_headers=getattr(config, "default_headers", None),
+        http_client=getattr(config, "http_client", None),
+    )
+
+
+def create_openai_client(
+    config: OpenAISettings, pool: ProviderClientPool
+) -> AsyncOpenAI:
+    """
+    Create a long-lived async OpenAI client backed by a keep-alive connection pool.
+    A user-provided `http_client` must be an `httpx.AsyncClient` and is used as
+    is; it belongs to the caller, so pool it with `owned=False`.
+    """
+    http_client = getattr(config, "http_client", None)
+    if http_client is not None and not isinstance(http_client, httpx.AsyncClient):
+        raise TypeError(
+            "OpenAI http_client must be an httpx.AsyncClient, "
+            f"got {type(http_client).__name__}"
+        )
+    return AsyncOpenAI(
+        api_key=config.api_key,
+        base_url=config.base_url,
+        http_client=http_client or pool.create_async_http_client(),
+        default_headers=getattr(config, "default_headers", None),
+    )
+
+
+def openai_tool_param(tool: Tool) -> ChatCompletionToolParam:
+    """Convert an MCP tool into an OpenAI function tool."""
+    return ChatCompletionToolParam(
+        type="function",
+        function={
+            "name": tool.name,
+            "description": tool.description,
+            "parameters": tool.inputSchema,
+            # TODO: saqadri - determine if we should specify "strict" to True by default
+        },
+    )
+
+
 class OpenAIAugmentedLLM(
     AugmentedLLM[ChatCompletionMessageParam, ChatCompletionMessage]
 ):
@@ -184,19 +253,7 @@ class OpenAIAugmentedLLM(
                 )
             messages.extend((OpenAIConverter.convert_mixed_messages_to_openai(message)))
 
-            response: ListToolsResult = await self.agent.list_tools()
-            available_tools: List[ChatCompletionToolParam] = [
-                ChatCompletionToolParam(
-                    type="function",
-                    function={
-                        "name": tool.name,
-                        "description": tool.description,
-                        "parameters": tool.inputSchema,
-                        # TODO: saqadri - determine if we should specify "strict" to True by default
-                    },
-                )
-                for tool in response.tools
-            ]
+            available_tools = await self._list_available_tools()
 
             if self.context.tracing_enabled:
                 span.set_attribute(
@@ -217,40 +274,21 @@ class OpenAIAugmentedLLM(
             if self.context.tracing_enabled and user:
                 span.set_attribute("user", user)
 
+            # Reused across iterations so earlier messages are only serialized once
+            serialization_cache = SerializationCache()
+
             total_input_tokens = 0
             total_output_tokens = 0
             finish_reasons = []
+            metrics = get_metrics(self.context)
 
             for i in range(params.max_iterations):
-                arguments = {
-                    "model": model,
-                    "messages": messages,
-                    "tools": available_tools,
-                }
-
-                if user:
-                    arguments["user"] = user
-
-                if params.stopSequences is not None:
-                    arguments["stop"] = params.stopSequences
-
-                if self._reasoning(model):
-                    arguments = {
-                        **arguments,
-                        # DEPRECATED: https://platform.openai.com/docs/api-reference/chat/create#chat-create-max_tokens
-                        # "max_tokens": params.maxTokens,
-                        "max_completion_tokens": params.maxTokens,
-                        "reasoning_effort": self._reasoning_effort,
-                    }
-                else:
-                    arguments = {**arguments, "max_tokens": params.maxTokens}
-                    # if available_tools:
-                    #     arguments["parallel_tool_calls"] = params.parallel_tool_calls
-
-                if params.metadata:
-                    arguments = {**arguments, **params.metadata}
+                arguments = self._completion_arguments(
+                    model, messages, available_tools, params, user
+                )
 
-                self.logger.debug(f"{arguments}")
+                if self.logger.is_enabled_for("debug"):
+                    self.logger.debug(f"{arguments}")
                 self._log_chat_progress(chat_turn=len(messages) // 2, model=model)
 
                 request = RequestCompletionRequest(
@@ -260,9 +298,13 @@ class OpenAIAugmentedLLM(
 
                 self._annotate_span_for_completion_request(span, request, i)
 
+                if self.executor.crosses_process_boundary:
+                    request = ensure_serializable(request, cache=serialization_cache)
+
+                timer = metrics.start_llm_request(self.provider, model)
                 response: ChatCompletion = await self.executor.execute(
                     OpenAICompletionTasks.request_completion_task,
-                    ensure_serializable(request),
+                    request,
                 )
 
                 self.logger.debug(
@@ -271,11 +313,13 @@ class OpenAIAugmentedLLM(
                 )
 
                 if isinstance(response, BaseException):
+                    timer.finish(error=response)
                     self.logger.error(f"Error: {response}")
                     span.record_exception(response)
                     span.set_status(trace.Status(trace.StatusCode.ERROR))
                     break
 
+                timer.finish(output_tokens=response.usage.completion_tokens)
                 self._annotate_span_for_completion_response(span, response, i)
 
                 total_input_tokens += response.usage.prompt_tokens
@@ -371,6 +415,49 @@ class OpenAIAugmentedLLM(
 
             return responses
 
+    async def _list_available_tools(self) -> List[ChatCompletionToolParam]:
+        return await self.agent.list_tools_for_provider(
+            "openai", openai_tool_param, tool_filter=self.tool_filter
+        )
+
+    def _completion_arguments(
+        self,
+        model: str,
+        messages: List[ChatCompletionMessageParam],
+        available_tools: List[ChatCompletionToolParam] | None,
+        params: RequestParams,
+        user: str | None,
+    ) -> Dict[str, Any]:
+        arguments = {
+            "model": model,
+            "messages": messages,
+            "tools": available_tools,
+        }
+
+        if user:
+            arguments["user"] = user
+
+        if params.stopSequences is not None:
+            arguments["stop"] = params.stopSequences
+
+        if self._reasoning(model):
+            arguments = {
+                **arguments,
+                # DEPRECATED: https://platform.openai.com/docs/api-reference/chat/create#chat-create-max_tokens
+                # "max_tokens": params.maxTokens,
+                "max_completion_tokens": params.maxTokens,
+                "reasoning_effort": self._reasoning_effort,
+            }
+        else:
+            arguments = {**arguments, "max_tokens": params.maxTokens}
+            # if available_tools:
+            #     arguments["parallel_tool_calls"] = params.parallel_tool_calls
+
+        if params.metadata:
+            arguments = {**arguments, **params.metadata}
+
+        return arguments
+
     async def generate_str(
         self,
         message,
@@ -411,6 +498,216 @@ class OpenAIAugmentedLLM(
             span.set_attribute("response", res)
             return res
 
+    async def generate_stream(
+        self,
+        message,
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Process a query using an LLM and available tools, streaming the response.
+        Text is yielded as it arrives, and each tool call is started as soon as its
+        arguments have been fully streamed, while the rest of the response is still
+        being generated.
+        """
+        if not self._can_stream():
+            async for event in super().generate_stream(message, request_params):
+                yield event
+            return
+
+        tracer = get_tracer(self.context)
+        span = tracer.start_span(
+            f"{self.__class__.__name__}.{self.name}.generate_stream"
+        )
+        try:
+            span.set_attribute(GEN_AI_AGENT_NAME, self.agent.name)
+
+            messages: List[ChatCompletionMessageParam] = []
+            params = self.get_request_params(request_params)
+
+            if params.use_history:
+                messages.extend(self.history.get())
+
+            system_prompt = self.instruction or params.systemPrompt
+            if system_prompt and len(messages) == 0:
+                messages.append(
+                    ChatCompletionSystemMessageParam(
+                        role="system", content=system_prompt
+                    )
+                )
+            messages.extend((OpenAIConverter.convert_mixed_messages_to_openai(message)))
+
+            available_tools = await self._list_available_tools() or None
+
+            model = await self.select_model(params)
+            if model:
+                span.set_attribute(GEN_AI_REQUEST_MODEL, model)
+
+            user = params.user or getattr(self.context.config.openai, "user", None)
+
+            # Fixes an issue with openai validation that does not allow non alphanumeric characters, dashes, and underscores
+            sanitized_name = (
+                re.sub(r"[^a-zA-Z0-9_-]", "_", self.name)
+                if isinstance(self.name, str)
+                else None
+            )
+
+            config = self.context.config.openai
+            pool = get_client_pool(self.context)
+            key = openai_client_key(config)
+            openai_client = pool.get_client(
+                key,
+                lambda: create_openai_client(config, pool),
+                owned=getattr(config, "http_client", None) is None,
+            )
+
+            metrics = get_metrics(self.context)
+
+            for i in range(params.max_iterations):
+                arguments = self._completion_arguments(
+                    model, messages, available_tools, params, user
+                )
+                self._log_chat_progress(chat_turn=len(messages) // 2, model=model)
+
+                content_parts: List[str] = []
+                assembler = ToolCallAssembler()
+                tool_calls: List[ChatCompletionMessageToolCall] = []
+                running = StreamingToolCalls()
+                finish_reason = None
+                output_tokens = None
+
+                timer = metrics.start_llm_request(self.provider, model)
+                try:
+                    async with pool.limit(url_host(openai_client.base_url)):
+                        stream = await openai_client.chat.completions.create(
+                            **arguments,
+                            stream=True,
+                            # Report token usage in a final chunk with no choices
+                            stream_options={"include_usage": True},
+                        )
+                        # Close the response even if the consumer stops early
+                        async with stream:
+                            async for chunk in stream:
+                                # The final chunk, enabled by stream_options.include_usage
+                                if chunk.usage:
+                                    output_tokens = chunk.usage.completion_tokens
+                                if not chunk.choices:
+                                    continue
+
+                                choice = chunk.choices[0]
+                                delta = choice.delta
+                                if delta.content or delta.tool_calls:
+                                    timer.first_token()
+                                if delta.content:
+                                    content_parts.append(delta.content)
+                                    yield StreamEvent(
+                                        type="text_delta",
+                                        iteration=i,
+                                        text=delta.content,
+                                    )
+
+                                completed = []
+                                for tool_call_delta in delta.tool_calls or []:
+                                    function = tool_call_delta.function
+                                    completed.extend(
+                                        assembler.add_delta(
+                                            tool_call_delta.index,
+                                            id=tool_call_delta.id,
+                                            name=function.name if function else None,
+                                            arguments=function.arguments
+                                            if function
+                                            else None,
+                                        )
+                                    )
+                                if choice.finish_reason:
+                                    finish_reason = choice.finish_reason
+                                    completed.extend(assembler.flush())
+
+                                for event in self._start_tool_calls(
+                                    completed, i, tool_calls, running
+                                ):
+                                    yield event
+
+                            # Calls still open if the stream ended without a finish_reason
+                            for event in self._start_tool_calls(
+                                assembler.flush(), i, tool_calls, running
+                            ):
+                                yield event
+                except BaseException as e:
+                    running.cancel()
+                    timer.finish(error=e)
+                    if isinstance(e, Exception):
+                        self.logger.error(f"Error: {e}")
+                        span.record_exception(e)
+                        span.set_status(trace.Status(trace.StatusCode.ERROR))
+                    raise
+                timer.finish(output_tokens=output_tokens)
+
+                response_message = ChatCompletionMessage(
+                    role="assistant",
+                    content="".join(content_parts) or None,
+                    tool_calls=tool_calls or None,
+                )
+                messages.append(
+                    self.convert_message_to_message_param(
+                        response_message, name=sanitized_name
+                    )
+                )
+                yield StreamEvent(type="message", iteration=i, message=response_message)
+
+                if not running:
+                    self.logger.debug(
+                        f"Iteration {i}: Stopping because finish_reason is '{finish_reason}'"
+                    )
+                    span.set_attribute("finish_reason", str(finish_reason))
+                    break
+
+                for result in await running.results():
+                    if isinstance(result, BaseException):
+                        self.logger.error(
+                            f"Warning: Unexpected error during tool execution: {result}. Continuing..."
+                        )
+                        span.record_exception(result)
+                        continue
+                    if result is not None:
+                        messages.append(result)
+                        yield StreamEvent(
+                            type="tool_result",
+                            iteration=i,
+                            tool_call_id=result.get("tool_call_id"),
+                            message=result,
+                        )
+
+            if params.use_history:
+                self.history.set(messages)
+
+            self._log_chat_finished(model=model)
+        finally:
+            span.end()
+
+    def _start_tool_calls(
+        self,
+        calls: List[StreamedToolCall],
+        iteration: int,
+        tool_calls: List[ChatCompletionMessageToolCall],
+        running: StreamingToolCalls,
+    ) -> Iterator[StreamEvent]:
+        """Start executing streamed tool calls that are complete, and report each one."""
+        for call in calls:
+            tool_call = ChatCompletionMessageToolCall(
+                id=call.id,
+                type="function",
+                function=Function(name=call.name, arguments=call.arguments),
+            )
+            tool_calls.append(tool_call)
+            running.start(self.execute_tool_call(tool_call))
+            yield StreamEvent(
+                type="tool_call",
+                iteration=iteration,
+                tool_call_id=call.id,
+                tool_name=call.name,
+                arguments=call.arguments,
+            )
+
     async def generate_structured(
         self,
         message,
@@ -582,7 +879,7 @@ class OpenAIAugmentedLLM(
         message: MessageTypes,
     ) -> None:
         """Annotate the span with the message content."""
-        if not self.context.tracing_enabled:
+        if not self.context.tracing_enabled or not should_capture_payload(span):
             return
         if isinstance(message, str):
             span.set_attribute("message.content", message)
@@ -607,7 +904,7 @@ class OpenAIAugmentedLLM(
         self, span: trace.Span, request: RequestCompletionRequest, turn: int
     ) -> None:
         """Annotate the span with the completion request as an event."""
-        if not self.context.tracing_enabled:
+        if not self.context.tracing_enabled or not span.is_recording():
             return
 
         event_data = {
@@ -620,103 +917,7 @@ class OpenAIAugmentedLLM(
 
         for key, value in request.payload.items():
             if key == "messages":
-                for i, message in enumerate(
-                    cast(List[ChatCompletionMessageParam], value)
-                ):
-                    role = message.get("role")
-                    event_data[f"messages.{i}.role"] = role
-                    message_content = message.get("content")
-
-                    match role:
-                        case "developer" | "system" | "user":
-                            if isinstance(message_content, str):
-                                event_data[f"messages.{i}.content"] = message_content
-                            elif message_content is not None:
-                                for j, part in enumerate(message_content):
-                                    event_data[f"messages.{i}.content.{j}.type"] = part[
-                                        "type"
-                                    ]
-                                    if part["type"] == "text":
-                                        event_data[f"messages.{i}.content.{j}.text"] = (
-                                            part["text"]
-                                        )
-                                    elif part["type"] == "image_url":
-                                        event_data[
-                                            f"messages.{i}.content.{j}.image_url.url"
-                                        ] = part["image_url"]["url"]
-                                        event_data[
-                                            f"messages.{i}.content.{j}.image_url.detail"
-                                        ] = part["image_url"]["detail"]
-                                    elif part["type"] == "input_audio":
-                                        event_data[
-                                            f"messages.{i}.content.{j}.input_audio.format"
-                                        ] = part["input_audio"]["format"]
-                        case "assistant":
-                            if isinstance(message_content, str):
-                                event_data[f"messages.{i}.content"] = message_content
-                            elif message_content is not None:
-                                for j, part in enumerate(message_content):
-                                    event_data[f"messages.{i}.content.{j}.type"] = part[
-                                        "type"
-                                    ]
-                                    if part["type"] == "text":
-                                        event_data[f"messages.{i}.content.{j}.text"] = (
-                                            part["text"]
-                                        )
-                                    elif part["type"] == "refusal":
-                                        event_data[
-                                            f"messages.{i}.content.{j}.refusal"
-                                        ] = part["refusal"]
-                            if message.get("audio") is not None:
-                                event_data[f"messages.{i}.audio.id"] = message.get(
-                                    "audio"
-                                ).get("id")
-                            if message.get("function_call") is not None:
-                                event_data[f"messages.{i}.function_call.name"] = (
-                                    message.get("function_call").get("name")
-                                )
-                                event_data[f"messages.{i}.function_call.arguments"] = (
-                                    message.get("function_call").get("arguments")
-                                )
-                            if message.get("name") is not None:
-                                event_data[f"messages.{i}.name"] = message.get("name")
-                            if message.get("refusal") is not None:
-                                event_data[f"messages.{i}.refusal"] = message.get(
-                                    "refusal"
-                                )
-                            if message.get("tool_calls") is not None:
-                                for j, tool_call in enumerate(
-                                    message.get("tool_calls")
-                                ):
-                                    event_data[
-                                        f"messages.{i}.tool_calls.{j}.{GEN_AI_TOOL_CALL_ID}"
-                                    ] = tool_call.id
-                                    event_data[
-                                        f"messages.{i}.tool_calls.{j}.function.name"
-                                    ] = tool_call.function.name
-                                    event_data[
-                                        f"messages.{i}.tool_calls.{j}.function.arguments"
-                                    ] = tool_call.function.arguments
-
-                        case "tool":
-                            event_data[f"messages.{i}.{GEN_AI_TOOL_CALL_ID}"] = (
-                                message.get("tool_call_id")
-                            )
-                            if isinstance(message_content, str):
-                                event_data[f"messages.{i}.content"] = message_content
-                            elif message_content is not None:
-                                for j, part in enumerate(message_content):
-                                    event_data[f"messages.{i}.content.{j}.type"] = part[
-                                        "type"
-                                    ]
-                                    if part["type"] == "text":
-                                        event_data[f"messages.{i}.content.{j}.text"] = (
-                                            part["text"]
-                                        )
-                        case "function":
-                            event_data[f"messages.{i}.name"] = message.get("name")
-                            event_data[f"messages.{i}.content"] = message_content
-
+                continue
             elif key == "tools":
                 if value is not None:
                     event_data["tools"] = [
@@ -725,6 +926,104 @@ class OpenAIAugmentedLLM(
             elif is_otel_serializable(value):
                 event_data[key] = value
 
+        # Record the most recent messages first, up to the attribute budget
+        messages = cast(
+            List[ChatCompletionMessageParam], request.payload.get("messages") or []
+        )
+        if should_capture_payload(span):
+            for i, message in reversed(list(enumerate(messages))):
+                if attribute_budget_exhausted(event_data):
+                    break
+                role = message.get("role")
+                event_data[f"messages.{i}.role"] = role
+                message_content = message.get("content")
+
+                match role:
+                    case "developer" | "system" | "user":
+                        if isinstance(message_content, str):
+                            event_data[f"messages.{i}.content"] = message_content
+                        elif message_content is not None:
+                            for j, part in enumerate(message_content):
+                                event_data[f"messages.{i}.content.{j}.type"] = part[
+                                    "type"
+                                ]
+                                if part["type"] == "text":
+                                    event_data[f"messages.{i}.content.{j}.text"] = part[
+                                        "text"
+                                    ]
+                                elif part["type"] == "image_url":
+                                    event_data[
+                                        f"messages.{i}.content.{j}.image_url.url"
+                                    ] = part["image_url"]["url"]
+                                    event_data[
+                                        f"messages.{i}.content.{j}.image_url.detail"
+                                    ] = part["image_url"]["detail"]
+                                elif part["type"] == "input_audio":
+                                    event_data[
+                                        f"messages.{i}.content.{j}.input_audio.format"
+                                    ] = part["input_audio"]["format"]
+                    case "assistant":
+                        if isinstance(message_content, str):
+                            event_data[f"messages.{i}.content"] = message_content
+                        elif message_content is not None:
+                            for j, part in enumerate(message_content):
+                                event_data[f"messages.{i}.content.{j}.type"] = part[
+                                    "type"
+                                ]
+                                if part["type"] == "text":
+                                    event_data[f"messages.{i}.content.{j}.text"] = part[
+                                        "text"
+                                    ]
+                                elif part["type"] == "refusal":
+                                    event_data[f"messages.{i}.content.{j}.refusal"] = (
+                                        part["refusal"]
+                                    )
+                        if message.get("audio") is not None:
+                            event_data[f"messages.{i}.audio.id"] = message.get(
+                                "audio"
+                            ).get("id")
+                        if message.get("function_call") is not None:
+                            event_data[f"messages.{i}.function_call.name"] = (
+                                message.get("function_call").get("name")
+                            )
+                            event_data[f"messages.{i}.function_call.arguments"] = (
+                                message.get("function_call").get("arguments")
+                            )
+                        if message.get("name") is not None:
+                            event_data[f"messages.{i}.name"] = message.get("name")
+                        if message.get("refusal") is not None:
+                            event_data[f"messages.{i}.refusal"] = message.get("refusal")
+                        if message.get("tool_calls") is not None:
+                            for j, tool_call in enumerate(message.get("tool_calls")):
+                                event_data[
+                                    f"messages.{i}.tool_calls.{j}.{GEN_AI_TOOL_CALL_ID}"
+                                ] = tool_call.id
+                                event_data[
+                                    f"messages.{i}.tool_calls.{j}.function.name"
+                                ] = tool_call.function.name
+                                event_data[
+                                    f"messages.{i}.tool_calls.{j}.function.arguments"
+                                ] = tool_call.function.arguments
+
+                    case "tool":
+                        event_data[f"messages.{i}.{GEN_AI_TOOL_CALL_ID}"] = message.get(
+                            "tool_call_id"
+                        )
+                        if isinstance(message_content, str):
+                            event_data[f"messages.{i}.content"] = message_content
+                        elif message_content is not None:
+                            for j, part in enumerate(message_content):
+                                event_data[f"messages.{i}.content.{j}.type"] = part[
+                                    "type"
+                                ]
+                                if part["type"] == "text":
+                                    event_data[f"messages.{i}.content.{j}.text"] = part[
+                                        "text"
+                                    ]
+                    case "function":
+                        event_data[f"messages.{i}.name"] = message.get("name")
+                        event_data[f"messages.{i}.content"] = message_content
+
         # Event name is based on the latest message role
         event_name = f"completion.request.{turn}"
         latest_message_role = request.payload.get("messages", [{}])[-1].get("role")
@@ -738,7 +1037,7 @@ class OpenAIAugmentedLLM(
         self, span: trace.Span, response: ChatCompletion, turn: int
     ) -> None:
         """Annotate the span with the completion response as an event."""
-        if not self.context.tracing_enabled:
+        if not self.context.tracing_enabled or not span.is_recording():
             return
 
         event_data = {
@@ -849,7 +1148,7 @@ class OpenAIAugmentedLLM(
 class OpenAICompletionTasks:
     @staticmethod
     @workflow_task
-    @telemetry.traced()
+    @telemetry.traced(capture="shallow")
     async def request_completion_task(
         request: RequestCompletionRequest,
     ) -> ChatCompletion:
@@ -857,25 +1156,24 @@ class OpenAICompletionTasks:
         Request a completion from OpenAI's API.
         """
 
-        openai_client = OpenAI(
-            api_key=request.config.api_key,
-            base_url=request.config.base_url,
-            http_client=request.config.http_client
-            if hasattr(request.config, "http_client")
-            else None,
-            default_headers=request.config.default_headers
-            if hasattr(request.config, "default_headers")
-            else None,
+        pool = get_client_pool()
+        key = openai_client_key(request.config)
+        openai_client = pool.get_client(
+            key,
+            lambda: create_openai_client(request.config, pool),
+            owned=getattr(request.config, "http_client", None) is None,
         )
 
         payload = request.payload
-        response = openai_client.chat.completions.create(**payload)
-        response = ensure_serializable(response)
+        async with pool.limit(url_host(openai_client.base_url)):
+            response = await openai_client.chat.completions.create(**payload)
+        if get_current_context().executor.crosses_process_boundary:
+            response = ensure_serializable(response)
         return response
 
     @staticmethod
     @workflow_task
-    @telemetry.traced()
+    @telemetry.traced(capture="shallow")
     async def request_structured_completion_task(
         request: RequestStructuredCompletionRequest,
     ) -> ModelT:
@@ -894,18 +1192,17 @@ class OpenAICompletionTasks:
                 "Either response_model or serialized_response_model must be provided for structured completion."
             )
 
+        pool = get_client_pool()
+        key = openai_client_key(request.config)
+        openai_client = pool.get_client(
+            key,
+            lambda: create_openai_client(request.config, pool),
+            owned=getattr(request.config, "http_client", None) is None,
+        )
+
         # Next we pass the text through instructor to extract structured data
         client = instructor.from_openai(
-            AsyncOpenAI(
-                api_key=request.config.api_key,
-                base_url=request.config.base_url,
-                http_client=request.config.http_client
-                if hasattr(request.config, "http_client")
-                else None,
-                default_headers=request.config.default_headers
-                if hasattr(request.config, "default_headers")
-                else None,
-            ),
+            openai_client,
             mode=instructor.Mode.TOOLS_STRICT,
         )
 
@@ -922,16 +1219,7 @@ class OpenAICompletionTasks:
         except InstructorRetryException:
             # Retry the request with JSON mode
             client = instructor.from_openai(
-                AsyncOpenAI(
-                    api_key=request.config.api_key,
-                    base_url=request.config.base_url,
-                    http_client=request.config.http_client
-                    if hasattr(request.config, "http_client")
-                    else None,
-                    default_headers=request.config.default_headers
-                    if hasattr(request.config, "default_headers")
-                    else None,
-                ),
+                openai_client,
                 mode=instructor.Mode.JSON,
             )
 
@@ -0,0 +1,252 @@
+"""
+A per-context pool of long-lived LLM provider clients.
+
+Provider SDK clients own an HTTP connection pool, so creating one per request
+means a fresh TLS handshake on every LLM turn. The pool hands out one shared
+client per distinct provider configuration and event loop, and closes them all
+when the context is cleaned up.
+"""
+
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import inspect
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    TYPE_CHECKING,
+)
+
+import httpx
+
+from mcp_agent.config import ClientPoolSettings
+from mcp_agent.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from mcp_agent.core.context import Context
+
+logger = get_logger(__name__)
+
+ClientT = TypeVar("ClientT")
+
+ClientKey = Tuple[Hashable, ...]
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert a settings value into something that can be used in a dict key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        # Non-hashable objects (e.g. a programmatically supplied http_client)
+        # are keyed by identity
+        return id(value)
+
+
+def client_key(provider: str, /, **fields: Any) -> ClientKey:
+    """
+    Build a pool key for a provider client from the settings that affect it
+    (e.g. api_key, base_url, headers, region).
+    """
+    return (provider, *sorted((k, _freeze(v)) for k, v in fields.items()))
+
+
+def url_host(url: Any) -> str:
+    """The host of a URL, with its port if it has one, for per-host request limits."""
+    url = httpx.URL(str(url))
+    return f"{url.host}:{url.port}" if url.port else url.host
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class _PooledClient:
+    def __init__(self, client: Any, owned: bool):
+        self.client = client
+        self.owned = owned
+
+
+class ProviderClientPool:
+    """
+    Hands out shared provider clients keyed by provider settings.
+    Clients are created lazily on first use and live until `close` is called.
+
+    Async clients and semaphores are bound to the event loop they are first used
+    on, so each running loop gets its own clients and request limiters.
+    """
+
+    def __init__(self, settings: ClientPoolSettings | None = None):
+        self.settings = settings or ClientPoolSettings()
+        # Clients by running loop (None outside a loop), then by key
+        self._clients: Dict[
+            asyncio.AbstractEventLoop | None, Dict[ClientKey, _PooledClient]
+        ] = {}
+        # Request limiters by running loop, then by host
+        self._limiters: Dict[
+            asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]
+        ] = {}
+        self._thread_pool: concurrent.futures.ThreadPoolExecutor | None = None
+        # Tasks may run on executor threads (e.g. Temporal activities)
+        self._lock = threading.Lock()
+
+    def get_client(
+        self, key: ClientKey, factory: Callable[[], ClientT], owned: bool = True
+    ) -> ClientT:
+        """
+        Return the pooled client for `key` on the running event loop, creating
+        it with `factory` if needed.
+
+        Args:
+            key: The provider settings the client is created from (see client_key)
+            factory: Creates the client
+            owned: Whether `close` closes the client. Pass False for clients that
+                wrap resources the caller supplied, e.g. a user-provided http_client
+        """
+        loop = _running_loop()
+        pooled = self._clients.get(loop, {}).get(key)
+        if pooled is not None:
+            return pooled.client
+
+        with self._lock:
+            self._discard_closed_loops()
+            clients = self._clients.setdefault(loop, {})
+            pooled = clients.get(key)
+            if pooled is None:
+                logger.debug(f"Creating pooled client for provider '{key[0]}'")
+                pooled = _PooledClient(factory(), owned)
+                clients[key] = pooled
+        return pooled.client
+
+    def limit(self, host: str):
+        """
+        Async context manager bounding the number of in-flight requests to `host`
+        (see url_host) on the running event loop.
+        """
+        max_requests = self.settings.max_concurrent_requests_per_host
+        if not max_requests:
+            return contextlib.nullcontext()
+
+        loop = asyncio.get_running_loop()
+        limiter = self._limiters.get(loop, {}).get(host)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.setdefault(loop, {}).setdefault(
+                    host, asyncio.Semaphore(max_requests)
+                )
+        return limiter
+
+    def _discard_closed_loops(self):
+        """
+        Forget clients and limiters of loops that have been closed (e.g. by an
+        earlier asyncio.run). Their clients can no longer be closed cleanly.
+        """
+        for loop in [loop for loop in self._clients if loop and loop.is_closed()]:
+            del self._clients[loop]
+        for loop in [loop for loop in self._limiters if loop.is_closed()]:
+            del self._limiters[loop]
+
+    @property
+    def http_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.settings.max_connections_per_host,
+            max_keepalive_connections=self.settings.max_keepalive_connections,
+            keepalive_expiry=self.settings.keepalive_expiry,
+        )
+
+    def create_async_http_client(self, **kwargs) -> httpx.AsyncClient:
+        """
+        Create a keep-alive httpx client to back an SDK client owned by this pool.
+        """
+        return httpx.AsyncClient(limits=self.http_limits, **kwargs)
+
+    async def run_in_thread(
+        self, func: Callable[..., ClientT], *args, **kwargs
+    ) -> ClientT:
+        """
+        Run a blocking provider call on the pool's bounded thread pool so that it
+        does not stall the event loop.
+        """
+        if self._thread_pool is None:
+            with self._lock:
+                if self._thread_pool is None:
+                    self._thread_pool = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.settings.max_blocking_threads,
+                        thread_name_prefix="mcp-agent-provider",
+                    )
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._thread_pool, functools.partial(func, *args, **kwargs)
+        )
+
+    async def close(self):
+        """
+        Close every pooled client the pool owns. Clients of another loop that is
+        still running are closed on that loop; those of closed loops are dropped.
+        """
+        with self._lock:
+            clients = self._clients
+            self._clients = {}
+            self._limiters = {}
+            thread_pool, self._thread_pool = self._thread_pool, None
+
+        if thread_pool is not None:
+            thread_pool.shutdown(wait=False)
+
+        current_loop = _running_loop()
+        for loop, loop_clients in clients.items():
+            owned = [
+                (key, pooled.client)
+                for key, pooled in loop_clients.items()
+                if pooled.owned
+            ]
+            if loop is None or loop is current_loop:
+                await self._close_clients(owned)
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(self._close_clients(owned), loop)
+
+    @staticmethod
+    async def _close_clients(clients: List[Tuple[ClientKey, Any]]):
+        for key, client in clients:
+            close = getattr(client, "aclose", None) or getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"Error closing pooled client for '{key[0]}': {e}")
+
+
+def get_client_pool(context: Optional["Context"] = None) -> ProviderClientPool:
+    """
+    Get the client pool for the given context, falling back to the global context.
+    """
+    if context is None:
+        from mcp_agent.core.context import get_current_context
+
+        context = get_current_context()
+
+    pool = getattr(context, "client_pool", None)
+    if pool is None:
+        settings = context.config.client_pool if context.config else None
+        pool = ProviderClientPool(settings=settings)
+        context.client_pool = pool
+    return pool
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Callable, Dict, Generic, List, Optional, TypeVar, TYPE_CHECKING
 
@@ -137,6 +138,24 @@ class Router(ABC, ContextDependent):
             top_k: The maximum number of top routing results to return. May return fewer.
         """
 
+    async def route_many(
+        self, requests: List[str], top_k: int = 1
+    ) -> List[List[RouterResult[str | Agent | Callable]]]:
+        """
+        Route several input requests. Returns one list of results per request,
+        in the order of the requests.
+
+        The default implementation routes each request concurrently.
+        Subclasses override it when requests can be routed more efficiently together.
+
+        Args:
+            requests: The inputs to route.
+            top_k: The maximum number of top routing results to return per request.
+        """
+        return list(
+            await asyncio.gather(*(self.route(request, top_k) for request in requests))
+        )
+
     @abstractmethod
     async def route_to_server(
         self, request: str, top_k: int = 1
@@ -1,13 +1,14 @@
-from typing import Callable, List, Optional, TYPE_CHECKING
+from typing import Callable, Dict, List, Optional, TYPE_CHECKING
 
 from numpy import mean
 
 from mcp_agent.agents.agent import Agent
-from mcp_agent.workflows.embedding.embedding_base import (
-    EmbeddingModel,
-    FloatArray,
-    compute_similarity_scores,
-    compute_confidence,
+from mcp_agent.workflows.embedding.embedding_base import EmbeddingModel, FloatArray
+from mcp_agent.workflows.embedding.embedding_index import (
+    EmbeddingIndex,
+    ExactEmbeddingIndex,
+    SearchResult,
+    text_digest,
 )
 from mcp_agent.workflows.router.router_base import (
     Router,
@@ -54,9 +55,17 @@ class EmbeddingRouter(Router):
         server_names: List[str] | None = None,
         agents: List[Agent] | None = None,
         functions: List[Callable] | None = None,
+        index: EmbeddingIndex | None = None,
         context: Optional["Context"] = None,
         **kwargs,
     ):
+        """
+        Args:
+            index: Similarity index of the category embeddings, keyed by category
+                name. Categories already in the index with the same text are not
+                embedded again, so a saved index can be reused with
+                EmbeddingIndex.load. Defaults to an empty ExactEmbeddingIndex
+        """
         super().__init__(
             server_names=server_names,
             agents=agents,
@@ -66,6 +75,7 @@ class EmbeddingRouter(Router):
         )
 
         self.embedding_model = embedding_model
+        self.index = index or ExactEmbeddingIndex(embedding_model.embedding_dim)
 
     @classmethod
     async def create(
@@ -74,6 +84,7 @@ class EmbeddingRouter(Router):
         server_names: List[str] | None = None,
         agents: List[Agent] | None = None,
         functions: List[Callable] | None = None,
+        index: EmbeddingIndex | None = None,
         context: Optional["Context"] = None,
     ) -> "EmbeddingRouter":
         """
@@ -85,26 +96,18 @@ class EmbeddingRouter(Router):
             server_names=server_names,
             agents=agents,
             functions=functions,
+            index=index,
             context=context,
         )
         await instance.initialize()
         return instance
 
     async def initialize(self):
-        """Initialize by computing embeddings for all categories"""
-
-        async def create_category_with_embedding(
-            category: RouterCategory,
-        ) -> EmbeddingRouterCategory:
-            # Get formatted text representation of category
-            category_text = self.format_category(category)
-            embedding = await self._compute_embedding([category_text])
-            category_with_embedding = EmbeddingRouterCategory(
-                **category.model_dump(), embedding=embedding
-            )
-
-            return category_with_embedding
-
+        """
+        Initialize by computing embeddings for all categories. The formatted
+        categories missing from the index are embedded together, in as few
+        batched requests as the embedding model allows.
+        """
         if self.initialized:
             return
 
@@ -112,22 +115,117 @@ class EmbeddingRouter(Router):
         await super().initialize()
         self.initialized = False  # We are not initialized yet
 
-        for name, category in self.server_categories.items():
-            category_with_embedding = await create_category_with_embedding(category)
-            self.server_categories[name] = category_with_embedding
-            self.categories[name] = category_with_embedding
+        # Entries left in the index by categories that no longer exist
+        self.index.remove([id for id in self.index.ids if id not in self.categories])
+        await self._embed_categories(
+            {
+                "servers": self.server_categories,
+                "agents": self.agent_categories,
+                "functions": self.function_categories,
+            }
+        )
+        self.initialized = True
 
-        for name, category in self.agent_categories.items():
-            category_with_embedding = await create_category_with_embedding(category)
-            self.agent_categories[name] = category_with_embedding
-            self.categories[name] = category_with_embedding
+    async def add_categories(
+        self,
+        server_names: List[str] | None = None,
+        agents: List[Agent] | None = None,
+        functions: List[Callable] | None = None,
+    ):
+        """
+        Add servers, agents or functions to route to, embedding only new or
+        changed categories. Categories with the same name as existing ones
+        replace them.
+        """
+        if not self.initialized:
+            await self.initialize()
 
-        for name, category in self.function_categories.items():
-            category_with_embedding = await create_category_with_embedding(category)
-            self.function_categories[name] = category_with_embedding
-            self.categories[name] = category_with_embedding
+        server_names = server_names or []
+        agents = agents or []
+        functions = functions or []
+        self.server_names.extend(server_names)
+        self.agents.extend(agents)
+        self.functions.extend(functions)
+
+        await self._embed_categories(
+            {
+                "servers": {
+                    c.name: c for c in map(self.get_server_category, server_names)
+                },
+                "agents": {c.name: c for c in map(self.get_agent_category, agents)},
+                "functions": {
+                    c.name: c for c in map(self.get_function_category, functions)
+                },
+            }
+        )
 
-        self.initialized = True
+    def remove_categories(self, names: List[str]):
+        """Stop routing to the servers, agents or functions with these category names."""
+        removed = [
+            kind_categories.pop(name)
+            for kind_categories in (
+                self.server_categories,
+                self.agent_categories,
+                self.function_categories,
+            )
+            for name in names
+            if name in kind_categories
+        ]
+        for name in names:
+            self.categories.pop(name, None)
+        self.index.remove(names)
+
+        targets = [category.category for category in removed]
+        self.server_names = [s for s in self.server_names if s not in targets]
+        self.agents = [a for a in self.agents if not any(a is t for t in targets)]
+        self.functions = [f for f in self.functions if not any(f is t for t in targets)]
+
+    async def _embed_categories(self, categories: Dict[str, Dict[str, RouterCategory]]):
+        """
+        Give categories of each kind embeddings and add them to the index and the
+        category dicts. Embeddings already in the index under a category's name
+        are reused if they were computed from the same text.
+        """
+        kind_dicts = {
+            "servers": self.server_categories,
+            "agents": self.agent_categories,
+            "functions": self.function_categories,
+        }
+        entries = [
+            (kind, name, category)
+            for kind, kind_categories in categories.items()
+            for name, category in kind_categories.items()
+        ]
+        # Get formatted text representation of each category
+        texts = [self.format_category(category) for _, _, category in entries]
+        digests = [text_digest(text) for text in texts]
+        missing = [
+            i
+            for i, (_, name, _) in enumerate(entries)
+            if self.index.digest(name) != digests[i]
+        ]
+
+        embeddings = await self.embedding_model.embed_batched(
+            [texts[i] for i in missing]
+        )
+        for kind in categories:
+            rows = [row for row, i in enumerate(missing) if entries[i][0] == kind]
+            if rows:
+                self.index.add(
+                    [entries[missing[row]][1] for row in rows],
+                    embeddings[rows],
+                    kind,
+                    digests=[digests[missing[row]] for row in rows],
+                )
+
+        names = [name for _, name, _ in entries]
+        stored = self.index.get(names) if names else []
+        for (kind, name, category), embedding in zip(entries, stored):
+            category_with_embedding = EmbeddingRouterCategory(
+                **category.model_dump(), embedding=embedding
+            )
+            kind_dicts[kind][name] = category_with_embedding
+            self.categories[name] = category_with_embedding
 
     async def route(
         self, request: str, top_k: int = 1
@@ -138,6 +236,25 @@ class EmbeddingRouter(Router):
 
         return await self._route_with_embedding(request, top_k)
 
+    async def route_many(
+        self, requests: List[str], top_k: int = 1
+    ) -> List[List[RouterResult[str | Agent | Callable]]]:
+        """
+        Route several requests based on embedding similarity. The requests are
+        embedded in provider-sized batches and searched for together.
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        if not len(self.index) or not requests:
+            return [[] for _ in requests]
+
+        request_embeddings = await self.embedding_model.embed_batched(requests)
+        return [
+            self._results(matches)
+            for matches in self.index.search(request_embeddings, top_k)
+        ]
+
     async def route_to_server(
         self, request: str, top_k: int = 1
     ) -> List[RouterResult[str]]:
@@ -194,41 +311,30 @@ class EmbeddingRouter(Router):
         include_agents: bool = True,
         include_functions: bool = True,
     ) -> List[RouterResult]:
-        def create_result(category: RouterCategory, request_embedding):
-            if category.embedding is None:
-                return None
-
-            similarity = compute_similarity_scores(
-                request_embedding, category.embedding
-            )
-
-            return RouterResult(
-                p_score=compute_confidence(similarity), result=category.category
-            )
-
+        if not len(self.index):
+            return []
         request_embedding = await self._compute_embedding([request])
 
-        results: List[RouterResult] = []
-        if include_servers:
-            for _, category in self.server_categories.items():
-                result = create_result(category, request_embedding)
-                if result:
-                    results.append(result)
-
-        if include_agents:
-            for _, category in self.agent_categories.items():
-                result = create_result(category, request_embedding)
-                if result:
-                    results.append(result)
-
-        if include_functions:
-            for _, category in self.function_categories.items():
-                result = create_result(category, request_embedding)
-                if result:
-                    results.append(result)
-
-        results.sort(key=lambda x: x.p_score, reverse=True)
-        return results[:top_k]
+        kinds = None
+        if not (include_servers and include_agents and include_functions):
+            kinds = [
+                kind
+                for kind, included in (
+                    ("servers", include_servers),
+                    ("agents", include_agents),
+                    ("functions", include_functions),
+                )
+                if included
+            ]
+        matches = self.index.search(request_embedding[None], top_k, kinds)[0]
+        return self._results(matches)
+
+    def _results(self, matches: SearchResult) -> List[RouterResult]:
+        """Turn the categories found for one request into results, best first."""
+        return [
+            RouterResult(p_score=score, result=self.categories[name].category)
+            for name, score in matches
+        ]
 
     async def _compute_embedding(self, data: List[str]):
         # Get embedding for the provided text
@@ -2,6 +2,7 @@ from typing import Callable, List, Optional, TYPE_CHECKING
 
 from mcp_agent.agents.agent import Agent
 from mcp_agent.workflows.embedding.embedding_cohere import CohereEmbeddingModel
+from mcp_agent.workflows.embedding.embedding_index import EmbeddingIndex
 from mcp_agent.workflows.router.router_embedding import EmbeddingRouter
 
 if TYPE_CHECKING:
@@ -42,6 +43,7 @@ class CohereEmbeddingRouter(EmbeddingRouter):
         server_names: List[str] | None = None,
         agents: List[Agent] | None = None,
         functions: List[Callable] | None = None,
+        index: EmbeddingIndex | None = None,
         context: Optional["Context"] = None,
     ) -> "CohereEmbeddingRouter":
         """
@@ -53,6 +55,7 @@ class CohereEmbeddingRouter(EmbeddingRouter):
             agents=agents,
             functions=functions,
             embedding_model=embedding_model,
+            index=index,
             context=context,
         )
         await instance.initialize()
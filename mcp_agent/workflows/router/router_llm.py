@@ -1,4 +1,5 @@
-from typing import Callable, List, Literal, Optional, TYPE_CHECKING
+import asyncio
+from typing import Callable, Dict, List, Literal, Optional, TYPE_CHECKING
 
 from opentelemetry import trace
 from pydantic import BaseModel
@@ -6,7 +7,7 @@ from pydantic import BaseModel
 from mcp_agent.agents.agent import Agent
 from mcp_agent.tracing.semconv import GEN_AI_REQUEST_TOP_K
 from mcp_agent.tracing.telemetry import get_tracer
-from mcp_agent.workflows.llm.augmented_llm import AugmentedLLM
+from mcp_agent.workflows.llm.augmented_llm import AugmentedLLM, RequestParams
 from mcp_agent.workflows.router.router_base import ResultT, Router, RouterResult
 from mcp_agent.logging.logger import get_logger
 
@@ -45,6 +46,40 @@ Only include categories that are truly relevant. You may return fewer than {top_
 If none of the categories are relevant, return an empty list.
 """
 
+DEFAULT_BATCH_ROUTING_INSTRUCTION = """
+You are a highly accurate request router that directs incoming requests to the most appropriate category.
+A category is a specialized destination, such as a Function, an MCP Server (a collection of tools/functions), or an Agent (a collection of servers).
+Below are the available routing categories, each with their capabilities and descriptions:
+
+{context}
+
+Your task is to analyze each of the following numbered requests independently and determine the most appropriate categories for it from the options above. Consider:
+- The specific capabilities and tools each destination offers
+- How well the request matches the category's description
+- Whether the request might benefit from multiple categories (up to {top_k})
+
+{requests}
+
+Respond in JSON format, with one entry per request:
+{{
+    "requests": [
+        {{
+            "request_index": <request number>,
+            "categories": [
+                {{
+                    "category": <category name>,
+                    "confidence": <high, medium or low>,
+                    "reasoning": <brief explanation>
+                }}
+            ]
+        }}
+    ]
+}}
+
+Only include categories that are truly relevant. You may return fewer than {top_k} for a request if appropriate.
+If none of the categories are relevant to a request, return an empty list for it.
+"""
+
 
 class LLMRouterResult(RouterResult[ResultT]):
     """A class that represents the result of an LLMRouter.route request"""
@@ -79,11 +114,34 @@ class StructuredResponse(BaseModel):
     """A list of categories to route the input to."""
 
 
+class StructuredRequestResponse(BaseModel):
+    """The categories an LLM router chose for one request of a batch"""
+
+    request_index: int
+    """The number of the request in the prompt, starting at 1."""
+
+    categories: List[StructuredResponseCategory]
+    """A list of categories to route the request to."""
+
+
+class StructuredBatchResponse(BaseModel):
+    """A class that represents the structured response of an LLM router to a batch of requests"""
+
+    requests: List[StructuredRequestResponse]
+    """The categories chosen for each request."""
+
+
 class LLMRouter(Router):
     """
     A router that uses an LLM to route an input to a specific category.
     """
 
+    requests_per_prompt: int = 10
+    """Maximum number of requests route_many packs into one routing prompt"""
+
+    max_concurrent_prompts: int = 4
+    """Maximum number of routing prompts route_many has in flight at once"""
+
     def __init__(
         self,
         llm: AugmentedLLM,
@@ -144,6 +202,43 @@ class LLMRouter(Router):
             self._annotate_span_for_router_result(span, res)
             return res
 
+    async def route_many(
+        self, requests: List[str], top_k: int = 1
+    ) -> List[List[LLMRouterResult[str | Agent | Callable]]]:
+        """
+        Route several requests, packing up to requests_per_prompt of them into
+        each routing prompt. With a custom routing_instruction, which only has
+        room for one request, each request is routed with its own prompt.
+        """
+        if self.routing_instruction:
+            return await super().route_many(requests, top_k)
+
+        tracer = get_tracer(self.context)
+        with tracer.start_as_current_span(
+            f"{self.__class__.__name__}.route_many"
+        ) as span:
+            if self.context.tracing_enabled:
+                span.set_attribute("requests.count", len(requests))
+                span.set_attribute(GEN_AI_REQUEST_TOP_K, top_k)
+                span.set_attribute("llm", self.llm.name)
+
+            if not self.initialized:
+                await self.initialize()
+
+            semaphore = asyncio.Semaphore(self.max_concurrent_prompts)
+
+            async def route_chunk(chunk: List[str]) -> List[List[LLMRouterResult]]:
+                async with semaphore:
+                    return await self._route_many_with_llm(chunk, top_k)
+
+            chunks = await asyncio.gather(
+                *(
+                    route_chunk(requests[start : start + self.requests_per_prompt])
+                    for start in range(0, len(requests), self.requests_per_prompt)
+                )
+            )
+            return [results for chunk in chunks for results in chunk]
+
     async def route_to_server(
         self, request: str, top_k: int = 1
     ) -> List[LLMRouterResult[str]]:
@@ -281,26 +376,75 @@ class LLMRouter(Router):
             if not response or not response.categories:
                 return []
 
-            result: List[LLMRouterResult] = []
-            for r in response.categories:
-                router_category = self.categories.get(r.category)
-                if not router_category:
-                    # Skip invalid categories
-                    # TODO: saqadri - log or raise an error
-                    continue
-
-                result.append(
-                    LLMRouterResult(
-                        result=router_category.category,
-                        confidence=r.confidence,
-                        reasoning=r.reasoning,
-                    )
-                )
+            result = self._build_results(response.categories)
 
             self._annotate_span_for_router_result(span, result)
 
             return result[:top_k]
 
+    async def _route_many_with_llm(
+        self, requests: List[str], top_k: int = 1
+    ) -> List[List[LLMRouterResult]]:
+        """Route a chunk of requests with a single routing prompt."""
+        tracer = get_tracer(self.context)
+        with tracer.start_as_current_span(
+            f"{self.__class__.__name__}._route_many_with_llm"
+        ) as span:
+            prompt = DEFAULT_BATCH_ROUTING_INSTRUCTION.format(
+                context=self._generate_context(),
+                requests=self._format_requests(requests),
+                top_k=top_k,
+            )
+
+            # Chunks are routed concurrently, so each prompt must stand alone
+            response = await self.llm.generate_structured(
+                message=prompt,
+                response_model=StructuredBatchResponse,
+                request_params=RequestParams(use_history=False),
+            )
+
+            if self.context.tracing_enabled:
+                span.set_attribute("requests.count", len(requests))
+                span.add_event("routing.response", {"prompt": prompt})
+
+            categories_by_index: Dict[int, List[StructuredResponseCategory]] = {}
+            if response and response.requests:
+                for r in response.requests:
+                    categories_by_index.setdefault(r.request_index, r.categories)
+
+            # Requests the response left out get no routes
+            return [
+                self._build_results(categories_by_index.get(index, []))[:top_k]
+                for index in range(1, len(requests) + 1)
+            ]
+
+    def _build_results(
+        self, categories: List[StructuredResponseCategory]
+    ) -> List[LLMRouterResult]:
+        """Turn the categories chosen by the LLM into router results."""
+        result: List[LLMRouterResult] = []
+        for r in categories:
+            router_category = self.categories.get(r.category)
+            if not router_category:
+                # Skip invalid categories
+                # TODO: saqadri - log or raise an error
+                continue
+
+            result.append(
+                LLMRouterResult(
+                    result=router_category.category,
+                    confidence=r.confidence,
+                    reasoning=r.reasoning,
+                )
+            )
+        return result
+
+    def _format_requests(self, requests: List[str]) -> str:
+        """Number the requests of a batch for the routing prompt."""
+        return "\n\n".join(
+            f"Request {index}: {request}" for index, request in enumerate(requests, 1)
+        )
+
     def _annotate_span_for_route_request(
         self,
         span: trace.Span,
@@ -5,11 +5,17 @@ Connects Python MCP agents to the existing Node.js MCP server
 """
 
 import asyncio
+import itertools
 import json
+import os
 import subprocess
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from mcp_agent import Agent, AugmentedLLM, MCPApp
+from mcp_agent.config import get_settings
+
+# Tool results (e.g. generated code) can be much larger than asyncio's default 64 KiB line limit
+STDOUT_LINE_LIMIT = 16 * 1024 * 1024
 
 
 @dataclass
@@ -20,57 +26,246 @@ class PractitionerStyle:
     focus_areas: List[str]
 
 
-class FuzzyDiscoMCPClient:
-    """Client to communicate with the Node.js MCP server"""
+def load_server_pool_config() -> Dict[str, Any]:
+    """Read the `fuzzy_disco_pool` section of mcp_agent.config.yaml, if there is one"""
+    try:
+        return dict(getattr(get_settings(), "fuzzy_disco_pool", None) or {})
+    except Exception:
+        return {}
+
+
+class MCPServerWorker:
+    """
+    One Node.js MCP server subprocess.
+
+    Calls are multiplexed over the server's stdio pipe: each request gets its own
+    JSON-RPC id and a single reader task routes responses back to their callers,
+    so many calls can be in flight on the process at once.
+    """
     
-    def __init__(self, server_path: str = "./mcp-server-standalone.js"):
+    def __init__(self, server_path: str, request_timeout: float, max_in_flight: int):
         self.server_path = server_path
+        self.request_timeout = request_timeout
         self.process = None
+        self.outstanding = 0
+        """Calls assigned to this worker that haven't completed (including queued ones)"""
+        self._request_ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+        self._start_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        # Bounds the requests waiting on the server, so callers back off when it falls behind
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+    
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
         
     async def start(self):
-        """Start the Node.js MCP server as a subprocess"""
+        """Start the Node.js MCP server as a subprocess, and warm it up"""
         self.process = await asyncio.create_subprocess_exec(
             'node', self.server_path,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=STDOUT_LINE_LIMIT,
         )
+        self._reader_task = asyncio.create_task(self._read_responses(self.process))
         
-    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Call a tool on the MCP server"""
-        if not self.process:
+        # The first requests pay for module loading and JIT warm-up; do it before real traffic
+        await self.request("initialize", {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "fuzzy-disco-agents", "version": "1.0.0"}
+        })
+        await self.request("tools/list", {})
+    
+    async def ensure_started(self):
+        """Start the server, or restart it if it has exited"""
+        async with self._start_lock:
+            if self.alive:
+                return
+            if self.process is not None:
+                print(f"MCP server worker exited with code {self.process.returncode}; restarting")
+                await self._stop()
             await self.start()
-            
-        # Create MCP request
+        
+    async def request(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Send a JSON-RPC request and wait for its response"""
+        request_id = next(self._request_ids)
         request = {
             "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments
-            }
+            "id": request_id,
+            "method": method,
+            "params": params
         }
         
-        # Send request
-        request_json = json.dumps(request) + '\n'
-        self.process.stdin.write(request_json.encode())
-        await self.process.stdin.drain()
-        
-        # Read response
-        response_line = await self.process.stdout.readline()
-        response = json.loads(response_line.decode())
+        async with self._in_flight:
+            response_future = asyncio.get_running_loop().create_future()
+            self._pending[request_id] = response_future
+            try:
+                await self._send(request)
+                # Cancelling the caller (or timing out) abandons the request;
+                # a late response for it is dropped by the reader
+                response = await asyncio.wait_for(
+                    response_future, timeout or self.request_timeout
+                )
+            finally:
+                self._pending.pop(request_id, None)
         
         if "error" in response:
             raise Exception(f"MCP Error: {response['error']}")
             
         return response.get("result", {})
     
-    async def close(self):
-        """Close the MCP server process"""
+    async def _send(self, request: Dict[str, Any]):
+        """Write one request line, waiting for the pipe to drain before the next"""
+        request_json = json.dumps(request) + '\n'
+        async with self._write_lock:
+            self.process.stdin.write(request_json.encode())
+            await self.process.stdin.drain()
+    
+    async def _read_responses(self, process):
+        """Route each response line from the server to the caller waiting on its id"""
+        error: BaseException = ConnectionError("MCP server closed its output")
+        try:
+            while True:
+                response_line = await process.stdout.readline()
+                if not response_line:
+                    break
+                
+                try:
+                    response = json.loads(response_line.decode())
+                except json.JSONDecodeError:
+                    continue
+                
+                response_future = self._pending.pop(response.get("id"), None)
+                if response_future is not None and not response_future.done():
+                    response_future.set_result(response)
+        except asyncio.CancelledError:
+            error = ConnectionError("MCP client closed")
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            self._fail_pending(error)
+    
+    def _fail_pending(self, error: BaseException):
+        """Fail every request that is still waiting for a response"""
+        pending, self._pending = self._pending, {}
+        for response_future in pending.values():
+            if not response_future.done():
+                response_future.set_exception(error)
+    
+    async def _stop(self):
+        if self._reader_task:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+            
         if self.process:
-            self.process.terminate()
+            if self.process.returncode is None:
+                self.process.terminate()
             await self.process.wait()
+            self.process = None
+    
+    async def close(self):
+        """Close the MCP server process"""
+        async with self._start_lock:
+            await self._stop()
+
+
+class FuzzyDiscoMCPClient:
+    """
+    Client to communicate with the Node.js MCP server.
+
+    Each server process is single-threaded, so the client runs a pool of them and
+    sends each call to the worker with the fewest outstanding requests. Workers are
+    warmed up at start, and restarted when they crash. Defaults come from the
+    `fuzzy_disco_pool` section of mcp_agent.config.yaml.
+    """
+    
+    def __init__(
+        self,
+        server_path: Optional[str] = None,
+        request_timeout: Optional[float] = None,
+        pool_size: Optional[int] = None,
+        max_in_flight_per_worker: Optional[int] = None,
+    ):
+        config = load_server_pool_config()
+        self.server_path = server_path or config.get("server_path") or "./mcp-server-standalone.js"
+        self.request_timeout = request_timeout or config.get("request_timeout") or 30.0
+        # 0 (or unset) means one worker per CPU core
+        self.pool_size = pool_size or config.get("size") or os.cpu_count() or 1
+        self.max_in_flight_per_worker = (
+            max_in_flight_per_worker or config.get("max_in_flight_per_worker") or 16
+        )
+        self.workers: List[MCPServerWorker] = []
+        self._start_lock = asyncio.Lock()
+        
+    async def start(self):
+        """Start and warm up the pool of Node.js MCP server subprocesses"""
+        async with self._start_lock:
+            if self.workers:
+                return
+            workers = [
+                MCPServerWorker(self.server_path, self.request_timeout, self.max_in_flight_per_worker)
+                for _ in range(self.pool_size)
+            ]
+            try:
+                # Let every worker finish starting, so none is left half-started
+                results = await asyncio.gather(
+                    *(worker.start() for worker in workers), return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+            except BaseException:
+                # Don't leak the servers that did start; the next call starts a new pool
+                await asyncio.gather(
+                    *(worker.close() for worker in workers), return_exceptions=True
+                )
+                raise
+            self.workers = workers
+        
+    async def call_tool(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Call a tool on the MCP server"""
+        if not self.workers:
+            await self.start()
+        
+        # Least-outstanding-requests dispatch
+        worker = min(self.workers, key=lambda w: w.outstanding)
+        worker.outstanding += 1
+        try:
+            await worker.ensure_started()
+            return await worker.request(
+                "tools/call",
+                {
+                    "name": tool_name,
+                    "arguments": arguments
+                },
+                timeout=timeout,
+            )
+        finally:
+            worker.outstanding -= 1
+    
+    async def close(self):
+        """Close the MCP server processes"""
+        workers, self.workers = self.workers, []
+        await asyncio.gather(*(worker.close() for worker in workers))
 
 
 class PractitionerAgent(Agent):
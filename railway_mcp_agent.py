@@ -8,7 +8,8 @@ import asyncio
 import aiohttp
 import json
 import os
-from typing import Dict, Any, List
+import random
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -55,19 +56,64 @@ PRACTITIONERS = [
 ]
 
 
+class RailwayAPIError(Exception):
+    """A Railway API call that failed (after any retries)"""
+    
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
 class RailwayMCPClient:
-    """MCP Client that connects to Railway HTTP API instead of subprocess"""
+    """
+    MCP Client that connects to Railway HTTP API instead of subprocess.
+
+    Connections are kept alive and reused, transient failures (connection errors,
+    timeouts, 429 and 5xx responses) are retried with jittered exponential backoff,
+    and identical concurrent calls share a single HTTP round-trip.
+    """
+    
+    # Map tool names to API endpoints
+    ENDPOINT_MAP = {
+        "select_practitioner_style": "/api/select-style",
+        "generate_code_with_style": "/api/generate-code",
+        "coordinate_team_workflow": "/api/coordinate-team",
+        "analyze_code_quality": "/api/analyze-code"
+    }
     
-    def __init__(self, base_url: str = None):
+    def __init__(
+        self,
+        base_url: str = None,
+        max_connections: int = 32,
+        total_timeout: float = 60.0,
+        connect_timeout: float = 10.0,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        max_retry_backoff: float = 8.0,
+    ):
         self.base_url = base_url or os.getenv(
             'RAILWAY_API_URL', 
             'https://fuzzy-disco-ai-production.up.railway.app'
         )
+        self.max_connections = max_connections
+        self.timeout = aiohttp.ClientTimeout(total=total_timeout, connect=connect_timeout)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
         self.session = None
+        # Maps (tool_name, canonical arguments) -> the in-flight call for them
+        self._in_flight: Dict[Tuple[str, str], asyncio.Task] = {}
     
     async def start(self):
         """Initialize HTTP session"""
-        self.session = aiohttp.ClientSession()
+        connector = aiohttp.TCPConnector(
+            # Everything goes to one host, so the per-host limit is the pool size
+            limit=self.max_connections,
+            limit_per_host=self.max_connections,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
+        self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
         
         # Test connection
         try:
@@ -80,40 +126,70 @@ class RailwayMCPClient:
             print(f"❌ Failed to connect to Railway API: {e}")
     
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Call a tool via HTTP API"""
+        """
+        Call a tool via HTTP API.
+        Concurrent calls with identical arguments share one request (and its result).
+        """
         if not self.session:
             await self.start()
         
-        # Map tool names to API endpoints
-        endpoint_map = {
-            "select_practitioner_style": "/api/select-style",
-            "generate_code_with_style": "/api/generate-code",
-            "coordinate_team_workflow": "/api/coordinate-team",
-            "analyze_code_quality": "/api/analyze-code"
-        }
-        
-        endpoint = endpoint_map.get(tool_name)
+        endpoint = self.ENDPOINT_MAP.get(tool_name)
         if not endpoint:
             raise Exception(f"Unknown tool: {tool_name}")
         
-        url = f"{self.base_url}{endpoint}"
+        key = (tool_name, json.dumps(arguments, sort_keys=True))
+        call = self._in_flight.get(key)
+        if call is None:
+            call = asyncio.create_task(self._post(f"{self.base_url}{endpoint}", arguments))
+            self._in_flight[key] = call
+            call.add_done_callback(lambda _: self._forget(key, call))
         
-        try:
-            async with self.session.post(url, json=arguments) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result
-                else:
-                    error_text = await response.text()
-                    raise Exception(f"API Error {response.status}: {error_text}")
+        # Shield the shared call so that one caller cancelling doesn't cancel it for the others
+        return await asyncio.shield(call)
+    
+    def _forget(self, key: Tuple[str, str], call: asyncio.Task):
+        if self._in_flight.get(key) is call:
+            del self._in_flight[key]
+        # Mark the exception retrieved, in case every caller was cancelled
+        if not call.cancelled():
+            call.exception()
+    
+    async def _post(self, url: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """POST to the API, retrying transient failures with jittered backoff"""
+        for attempt in range(self.max_retries + 1):
+            retryable = attempt < self.max_retries
+            try:
+                async with self.session.post(url, json=arguments) as response:
+                    if response.status == 200:
+                        return await response.json()
                     
-        except Exception as e:
-            raise Exception(f"HTTP request failed: {e}")
+                    error_text = await response.text()
+                    if not retryable or not _is_transient_status(response.status):
+                        raise RailwayAPIError(
+                            f"API Error {response.status}: {error_text}",
+                            status=response.status,
+                        )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not retryable:
+                    raise RailwayAPIError(f"HTTP request failed: {e!r}") from e
+            except aiohttp.ClientError as e:
+                raise RailwayAPIError(f"HTTP request failed: {e!r}") from e
+            
+            # Full jitter, so retries from concurrent callers don't arrive in lockstep
+            backoff = min(self.max_retry_backoff, self.retry_backoff * 2 ** attempt)
+            await asyncio.sleep(random.uniform(0, backoff))
     
     async def close(self):
         """Close HTTP session"""
+        for call in list(self._in_flight.values()):
+            call.cancel()
         if self.session:
             await self.session.close()
+            self.session = None
+
+
+def _is_transient_status(status: int) -> bool:
+    return status == 429 or status >= 500
 
 
 class RailwayPractitionerAgent: